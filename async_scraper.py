@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+🎼 asyncio 기반 클래식 공연 정보 스크래퍼
+하나의 이벤트 루프에서 여러 HTTP 요청을 동시에 처리하고 (keep-alive 연결 재사용),
+CPU를 쓰는 파싱/추출 단계는 executor에서 실행합니다.
+
+요청은 SimpleConcertScraper와 같은 규칙을 따릅니다.
+- polite_fetch.HostThrottle (기본은 프로세스 안의 모든 스크래퍼가 공유하는 DEFAULT_THROTTLE):
+  리다이렉트 단계마다 호스트별 토큰 버킷 + 동시 요청 수 제한
+- 연결 오류/타임아웃, 429/5xx는 지터를 섞은 지수 백오프로 재시도 (Retry-After를 따르고 그동안 호스트 전체를 멈춤)
+- cache(http_cache.ResponseCache)가 있으면 TTL 안에서는 캐시, 지나면 조건부 요청으로 재검증
+"""
+
+import asyncio
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import aiohttp
+
+from simple_scraper import SimpleConcertScraper, DEFAULT_HEADERS
+from batch_scraper import host_of
+from polite_fetch import (
+    DEFAULT_THROTTLE, DEFAULT_MAX_RETRIES, RETRY_STATUSES, MAX_RETRY_AFTER,
+    retry_after_seconds, backoff_delay,
+)
+
+DEFAULT_MAX_CONNECTIONS = 100
+# 호스트별 연결 풀 크기 (실제 동시 요청 수는 HostThrottle의 max_in_flight가 제한)
+DEFAULT_PER_HOST_LIMIT = 8
+DEFAULT_TIMEOUT = 15
+MAX_REDIRECTS = 10
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# 요청 한 단계의 응답 (본문까지 받은 뒤 연결을 돌려주므로 헤더/본문만 남김)
+FetchedPage = namedtuple('FetchedPage', ['url', 'status', 'headers', 'text'])
+
+# executor가 프로세스 풀이어도 쓸 수 있도록 파서는 프로세스마다 하나씩 생성
+_parser = None
+
+
+def _parse_page(url, html_content):
+    """HTML에서 공연 정보 추출 (executor에서 실행)"""
+    global _parser
+    if _parser is None:
+        _parser = SimpleConcertScraper()
+    return _parser.parse_concert_info(url, html_content)
+
+
+async def acquire_host(throttle, host):
+    """이벤트 루프를 막지 않고 호스트 요청 자리 + 토큰 얻기 (반드시 throttle.release와 짝지어 호출)"""
+    while True:
+        delay = throttle.try_acquire(host)
+        if delay <= 0:
+            return
+        await asyncio.sleep(delay)
+
+
+def raise_for_status(page):
+    """2xx/3xx가 아니면 예외"""
+    if page.status >= 400:
+        raise RuntimeError(f"{page.status} 오류: {page.url}")
+
+
+class AsyncConcertScraper:
+    def __init__(self, max_connections=DEFAULT_MAX_CONNECTIONS, per_host_limit=DEFAULT_PER_HOST_LIMIT,
+                 timeout=DEFAULT_TIMEOUT, executor=None, cache=None, throttle=None,
+                 max_retries=DEFAULT_MAX_RETRIES):
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=os.cpu_count() or 2)
+        # http_cache.ResponseCache (None이면 캐시 없이 매번 다운로드)
+        self.cache = cache
+        # 호스트별 속도/동시성 제한 (없으면 PoliteSession과 같은 프로세스 공용 제한)
+        self.throttle = throttle or DEFAULT_THROTTLE
+        self.max_retries = max_retries
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_session(self):
+        """연결 풀을 공유하는 ClientSession (처음 사용할 때 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.per_host_limit,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _send(self, url, headers):
+        """요청 한 단계 (호스트 자리를 잡고 본문까지 받은 뒤 놓음)"""
+        host = host_of(url)
+        await acquire_host(self.throttle, host)
+        try:
+            async with self._get_session().get(url, headers=headers, allow_redirects=False) as response:
+                return FetchedPage(url, response.status, response.headers, await response.text())
+        finally:
+            self.throttle.release(host)
+
+    async def _follow_redirects(self, url, headers):
+        """리다이렉트를 직접 따라가서 단계마다 그 호스트의 제한을 따름"""
+        for _ in range(MAX_REDIRECTS + 1):
+            page = await self._send(url, headers)
+            location = page.headers.get('Location')
+            if page.status not in REDIRECT_STATUSES or not location:
+                return page
+            url = urljoin(url, location)
+        raise RuntimeError(f"리다이렉트가 너무 많습니다: {url}")
+
+    async def _get(self, url, headers=None):
+        """재시도가 붙은 GET (PoliteSession.request와 같은 규칙)"""
+        host = host_of(url)
+        attempt = 0
+        while True:
+            try:
+                page = await self._follow_redirects(url, headers)
+                error = None
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                page, error = None, e
+
+            should_retry = error is not None or page.status in RETRY_STATUSES
+            if not should_retry or attempt >= self.max_retries:
+                if error is not None:
+                    raise error
+                return page
+
+            delay = backoff_delay(attempt)
+            retry_after = retry_after_seconds(page)
+            if retry_after is not None:
+                if retry_after > MAX_RETRY_AFTER:
+                    return page
+                # 서버가 알려준 시간만큼 이 호스트 전체를 멈춤
+                self.throttle.pause(host, retry_after)
+                delay = max(delay, retry_after)
+            print(f"⏳ 재시도 {attempt + 1}/{self.max_retries} ({host}, "
+                  f"{error or page.status}), {delay:.1f}초 후")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _fetch(self, url):
+        """캐시를 거쳐 (본문, 출처) 가져오기 (ResponseCache.fetch_with_source와 같은 규칙)"""
+        if not self.cache:
+            page = await self._get(url)
+            raise_for_status(page)
+            return page.text, 'network'
+
+        # SQLite 캐시 읽기/쓰기는 기본 스레드 풀에서 (파싱용 executor는 프로세스 풀일 수도 있음)
+        loop = asyncio.get_running_loop()
+        entry = await loop.run_in_executor(None, self.cache.get, url)
+        if entry and self.cache.is_fresh(entry):
+            return entry['body'], 'cache'
+
+        headers = self.cache.conditional_headers(entry) if entry else {}
+        try:
+            page = await self._get(url, headers)
+        except Exception:
+            if entry:
+                return entry['body'], 'stale'
+            raise
+
+        if page.status == 304 and entry:
+            await loop.run_in_executor(None, self.cache.touch, url)
+            return entry['body'], 'revalidated'
+
+        raise_for_status(page)
+        await loop.run_in_executor(None, self.cache.store, url, page.text,
+                                   page.headers.get('ETag'), page.headers.get('Last-Modified'))
+        return page.text, 'network'
+
+    async def get_page_content(self, url):
+        """페이지 콘텐츠 가져오기"""
+        try:
+            html_content, _ = await self._fetch(url)
+            return html_content
+        except Exception as e:
+            print(f"페이지 로딩 실패: {str(e) or type(e).__name__}")
+            return None
+
+    async def scrape_concert_info(self, url):
+        """공연 정보 스크래핑"""
+        print(f"🔍 스크래핑 중: {url}")
+
+        html_content = await self.get_page_content(url)
+        if not html_content:
+            return None
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _parse_page, url, html_content)
+
+    async def _scrape_one(self, url):
+        """URL 하나 스크래핑 (실패도 결과로 돌려줌)"""
+        try:
+            result = await self.scrape_concert_info(url)
+            if result is None:
+                return {'url': url, 'success': False, 'result': None, 'error': '페이지 로딩 실패'}
+            return {'url': url, 'success': True, 'result': result, 'error': None}
+        except Exception as e:
+            return {'url': url, 'success': False, 'result': None, 'error': str(e)}
+
+    async def scrape_many(self, urls):
+        """여러 공연 URL 동시 스크래핑 (끝나는 순서대로 결과 dict를 yield)
+
+        결과 형식은 batch_scraper.scrape_many와 같습니다.
+        호스트별 동시 요청 수는 throttle이, 전체 연결 수는 커넥터의 max_connections가 제한합니다.
+        """
+        unique_urls = list(dict.fromkeys(url.strip() for url in urls if url and url.strip()))
+        tasks = [asyncio.ensure_future(self._scrape_one(url)) for url in unique_urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close(self):
+        """리소스 정리"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._own_executor:
+            self.executor.shutdown(wait=False)
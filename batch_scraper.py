@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+🎼 여러 공연 URL 동시 스크래핑
+워커 풀 크기와 호스트별 동시 요청 수를 제한하면서, 끝나는 순서대로 결과를 돌려줍니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import deque, OrderedDict
+from urllib.parse import urlparse
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST_LIMIT = 2
+
+
+def host_of(url):
+    """URL의 호스트 (www. 제거, 소문자)"""
+    host = (urlparse(url).hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+def _scrape_one(scraper, url):
+    """URL 하나 스크래핑 (실패도 결과로 돌려줌)"""
+    try:
+        result = scraper.scrape_concert_info(url)
+        if result is None:
+            return {'url': url, 'success': False, 'result': None, 'error': '페이지 로딩 실패'}
+        return {'url': url, 'success': True, 'result': result, 'error': None}
+    except Exception as e:
+        return {'url': url, 'success': False, 'result': None, 'error': str(e)}
+
+
+def scrape_many(scraper, urls, max_workers=DEFAULT_MAX_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+    """URL 목록을 동시에 스크래핑하고 끝나는 순서대로 결과 dict를 yield
+
+    각 결과는 {'url', 'success', 'result', 'error'} 형태입니다.
+    같은 호스트에는 per_host_limit 개까지만 동시에 요청하고,
+    자리가 빈 호스트의 URL부터 워커에 넘기므로 워커가 대기하며 놀지 않습니다.
+    """
+    # 중복 URL 제거 (순서 유지)
+    pending = OrderedDict()
+    seen = set()
+    for url in urls:
+        url = (url or '').strip()
+        if url and url not in seen:
+            seen.add(url)
+            pending.setdefault(host_of(url), deque()).append(url)
+
+    in_flight = {}
+    host_counts = {}
+
+    def next_url():
+        for host, queue in pending.items():
+            if queue and host_counts.get(host, 0) < per_host_limit:
+                return host, queue.popleft()
+        return None, None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # 빈 워커와 호스트 여유가 있는 만큼 작업 제출
+            while len(in_flight) < max_workers:
+                host, url = next_url()
+                if url is None:
+                    break
+                host_counts[host] = host_counts.get(host, 0) + 1
+                in_flight[executor.submit(_scrape_one, scraper, url)] = host
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                host = in_flight.pop(future)
+                host_counts[host] -= 1
+                yield future.result()
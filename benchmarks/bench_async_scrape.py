@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+⏱️ 스레드 방식 vs asyncio 방식 동시 스크래핑 벤치마크
+로컬 스텁 HTTP 서버(별도 프로세스)가 지연을 흉내 내며 공연 페이지를 돌려줍니다.
+
+사용법: python benchmarks/bench_async_scrape.py [--count 300] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from simple_scraper import SimpleConcertScraper
+from polite_fetch import HostThrottle
+from async_scraper import AsyncConcertScraper
+
+SAMPLE_PAGE = """<html><head><title>롯데콘서트홀</title></head><body>
+<h1>정명훈 &amp; 원 코리아 오케스트라 &lt;베토벤 합창&gt;</h1>
+<p>2025.11.19 (수) 19:30 롯데콘서트홀</p>
+<p>지휘 | 정명훈</p><p>소프라노 | 박소영</p><p>테너 | 황준호</p>
+<p>베토벤 교향곡 제9번 d단조, Op.125 '합창'</p>
+<p>R석 150,000원 S석 120,000원 A석 80,000원</p>
+</body></html>"""
+
+
+def run_stub_server(port, latency, ready):
+    """지연 후 공연 페이지를 돌려주는 스텁 서버"""
+    async def handle(request):
+        await asyncio.sleep(latency)
+        return web.Response(text=SAMPLE_PAGE, content_type='text/html')
+
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handle)
+    runner = web.AppRunner(app, access_log=None)
+
+    async def main():
+        await runner.setup()
+        await web.TCPSite(runner, '127.0.0.1', port, backlog=1024).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+def bench_threads(urls):
+    """/api/scrape 방식: 요청마다 스레드 하나 (로컬 스텁 서버라 호스트 속도 제한은 끔)"""
+    scraper = SimpleConcertScraper(throttle=HostThrottle(enabled=False))
+    results = []
+    peak_threads = 0
+    threads = [threading.Thread(target=lambda u=u: results.append(scraper.scrape_concert_info(u)))
+               for u in urls]
+    for thread in threads:
+        thread.start()
+        peak_threads = max(peak_threads, threading.active_count())
+    for thread in threads:
+        thread.join()
+    return sum(1 for r in results if r), peak_threads
+
+
+def bench_async(urls):
+    """AsyncConcertScraper: 이벤트 루프 하나 (스레드 방식과 같이 호스트 속도 제한은 끔)"""
+    async def main():
+        ok = 0
+        peak_threads = 0
+        async with AsyncConcertScraper(max_connections=len(urls), per_host_limit=len(urls),
+                                       throttle=HostThrottle(enabled=False)) as scraper:
+            async for item in scraper.scrape_many(urls):
+                ok += item['success']
+                peak_threads = max(peak_threads, threading.active_count())
+        return ok, peak_threads
+
+    return asyncio.run(main())
+
+
+def measure(name, func, urls):
+    """실행 시간, 최대 스레드 수, 최대 할당 메모리 측정"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ok, peak_threads = func(urls)
+    elapsed = time.perf_counter() - started
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<8} {ok:>4}/{len(urls)} 성공  {elapsed:7.2f}s  "
+          f"최대 스레드 {peak_threads:>4}  최대 메모리 {peak_memory / 1024:9.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=300, help='동시 스크래핑 수')
+    parser.add_argument('--latency', type=float, default=0.2, help='스텁 서버 응답 지연 (초)')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=run_stub_server, args=(args.port, args.latency, ready), daemon=True)
+    server.start()
+    ready.wait(10)
+
+    urls = [f"http://127.0.0.1:{args.port}/kor/Performance/ConcertDetails/{i}" for i in range(args.count)]
+    print(f"🎼 동시 스크래핑 {args.count}건, 서버 지연 {args.latency}s")
+    try:
+        measure('threads', bench_threads, urls)
+        measure('asyncio', bench_async, urls)
+    finally:
+        server.terminate()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+⏱️ culture_log.db 읽기/쓰기 혼합 부하 벤치마크 (임시 파일 사용)
+culture_log_app.py 라우트와 같은 쿼리(목록 한 페이지 + 전체 개수, 통계, 기록 추가)를 여러 스레드가 동시에 돌리면서
+- connect: 요청마다 sqlite3.connect/close, 기본 롤백 저널 (예전 방식)
+- pool: db_pool.ConnectionPool (스레드별 연결 재사용, WAL, 튜닝 PRAGMA)
+두 방식의 초당 요청 수, 읽기/쓰기 지연 p50/p95, 잠금 오류 수를 비교합니다.
+
+사용법: python benchmarks/bench_db.py [--threads 8] [--duration 3] [--write-ratio 0.2] [--rows 5000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from db_pool import ConnectionPool
+
+CATEGORIES = ['concert', 'musical', 'exhibition', 'play']
+PER_PAGE = 10
+
+
+def percentile(samples, fraction):
+    """정렬된 표본의 백분위수 (최근접 순위)"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def make_row(i):
+    return (
+        f'공연 {i}', random.choice(CATEGORIES), f'2026-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}',
+        '롯데콘서트홀', json.dumps(['정명훈', '서울시향'], ensure_ascii=False),
+        json.dumps(['브람스 교향곡 1번'], ensure_ascii=False), json.dumps(['R석 50,000원'], ensure_ascii=False),
+        random.randint(1, 5), '좋았다 ' * 20, '[]', f'https://example.com/{i}',
+    )
+
+
+INSERT = '''
+    INSERT INTO culture_logs
+    (title, category, date, venue, performers, program, price, rating, review, photos, source_url)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def create_database(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE culture_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, category TEXT NOT NULL, date TEXT NOT NULL,
+            venue TEXT, performers TEXT, program TEXT, price TEXT, rating INTEGER, review TEXT, photos TEXT,
+            source_url TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    conn.executemany(INSERT, [make_row(i) for i in range(rows)])
+    conn.commit()
+    conn.close()
+
+
+def read_logs(conn, rows):
+    """get_logs: 카테고리 필터 목록 한 페이지 + 개수"""
+    category = random.choice(CATEGORIES)
+    page = random.randint(1, 5)
+    conn.execute(
+        'SELECT * FROM culture_logs WHERE category = ? ORDER BY date DESC, created_at DESC LIMIT ? OFFSET ?',
+        (category, PER_PAGE, (page - 1) * PER_PAGE),
+    ).fetchall()
+    conn.execute('SELECT COUNT(*) FROM culture_logs WHERE category = ?', (category,)).fetchone()
+
+
+def read_stats(conn, rows):
+    """get_stats 일부"""
+    conn.execute('SELECT category, COUNT(*) FROM culture_logs GROUP BY category').fetchall()
+    conn.execute('SELECT AVG(rating) FROM culture_logs WHERE rating IS NOT NULL').fetchone()
+
+
+def write_log(conn, rows):
+    """create_log"""
+    conn.execute(INSERT, make_row(random.randint(0, rows)))
+    conn.commit()
+
+
+class ConnectEachTime:
+    """예전 방식: 요청마다 연결을 열고 닫음"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def run(self, operation, rows):
+        conn = sqlite3.connect(self.path)
+        try:
+            operation(conn, rows)
+        finally:
+            conn.close()
+
+
+class Pooled:
+    def __init__(self, path):
+        self.pool = ConnectionPool(path)
+
+    def run(self, operation, rows):
+        with self.pool.connection() as conn:
+            operation(conn, rows)
+
+
+def bench(mode, backend_class, args):
+    directory = tempfile.mkdtemp(prefix='bench_db_')
+    path = os.path.join(directory, 'culture_log.db')
+    random.seed(1)
+    create_database(path, args.rows)
+    backend = backend_class(path)
+
+    samples = {'read': [], 'write': []}
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker(seed):
+        rng = random.Random(seed)
+        local = {'read': [], 'write': []}
+        local_errors = 0
+        while time.perf_counter() < deadline:
+            if rng.random() < args.write_ratio:
+                kind, operation = 'write', write_log
+            else:
+                kind, operation = 'read', read_logs if rng.random() < 0.8 else read_stats
+            started = time.perf_counter()
+            try:
+                backend.run(operation, args.rows)
+            except sqlite3.OperationalError:
+                local_errors += 1
+                continue
+            local[kind].append((time.perf_counter() - started) * 1000)
+        with lock:
+            for kind in local:
+                samples[kind].extend(local[kind])
+            errors[0] += local_errors
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    os.rmdir(directory)
+
+    total = len(samples['read']) + len(samples['write'])
+    return {
+        'mode': mode,
+        'requests_per_sec': round(total / elapsed, 1),
+        'reads': len(samples['read']),
+        'writes': len(samples['write']),
+        'read_p50_ms': round(percentile(samples['read'], 0.5), 3),
+        'read_p95_ms': round(percentile(samples['read'], 0.95), 3),
+        'write_p50_ms': round(percentile(samples['write'], 0.5), 3),
+        'write_p95_ms': round(percentile(samples['write'], 0.95), 3),
+        'lock_errors': errors[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=3.0, help='방식마다 부하를 줄 시간 (초)')
+    parser.add_argument('--write-ratio', type=float, default=0.2, help='쓰기 요청 비율')
+    parser.add_argument('--rows', type=int, default=5000, help='미리 넣어 둘 기록 수')
+    args = parser.parse_args()
+
+    print(f"🗃️ 기록 {args.rows}개, 스레드 {args.threads}개, 쓰기 {args.write_ratio:.0%}, 방식마다 {args.duration}초")
+    results = [bench('connect', ConnectEachTime, args), bench('pool', Pooled, args)]
+    print(f"\n{'방식':<10}{'req/s':>10}{'읽기 p50':>10}{'읽기 p95':>10}{'쓰기 p50':>10}{'쓰기 p95':>10}{'잠금 오류':>10}")
+    for result in results:
+        print(f"{result['mode']:<10}{result['requests_per_sec']:>10}{result['read_p50_ms']:>10}"
+              f"{result['read_p95_ms']:>10}{result['write_p50_ms']:>10}{result['write_p95_ms']:>10}"
+              f"{result['lock_errors']:>10}")
+    before, after = results
+    if before['requests_per_sec']:
+        print(f"\n📈 pool / connect = {after['requests_per_sec'] / before['requests_per_sec']:.2f}배")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+⏱️ 저장된 corpus로 추출 속도/정확도 벤치마크 (네트워크 없음)
+corpus/pages 의 공연 페이지를 SimpleConcertScraper, ConcertScraper의 parse_concert_info에 반복해서 넣고
+- 추출기별(HTML 파싱, 제목/날짜/공연장/출연진/프로그램/가격) 지연 시간 p50/p95
+- 초당 처리 페이지 수
+- tracemalloc 최대 메모리
+- corpus/expected (페이지를 직접 보고 쓴 정답) 대비 필드별 정확도
+를 보여 줍니다. corpus/golden 은 추출기 출력 스냅숏이라 정확도 기준으로 쓰지 않습니다. 기준 파일(benchmarks/extraction_baseline.json)보다 정확도가 떨어지거나
+p95/메모리가 허용 범위(--tolerance, --min-delta-ms)를 넘게 나빠지면 0이 아닌 값으로 끝납니다.
+
+사용법: python benchmarks/bench_extraction.py [--repeat 20] [--tolerance 0.5] [--update-baseline]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'corpus'))
+
+import concert_scraper
+import simple_scraper
+from simple_scraper import SimpleConcertScraper
+from concert_scraper import ConcertScraper
+from update_golden import FIELDS, load_corpus, expected_path
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_baseline.json')
+
+# 추출기 이름 → 스크래퍼 메서드 이름 (HTML 파싱은 모듈 함수라 따로 감쌈)
+EXTRACTORS = {
+    'title': 'extract_title',
+    'date': 'extract_date_time',
+    'venue': 'extract_venue',
+    'performers': 'extract_performers',
+    'program': 'extract_program',
+    'price': 'extract_price',
+}
+STAGES = ['parse'] + list(EXTRACTORS) + ['total']
+
+
+def percentile(samples, fraction):
+    """정렬된 표본의 백분위수 (최근접 순위)"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class StageTimer:
+    """parse_html과 추출기 메서드를 감싸서 페이지 한 장당 단계별 누적 시간을 잼"""
+
+    def __init__(self, scraper, module):
+        self.current = None
+        self.samples = {stage: [] for stage in STAGES}
+        for stage, method in EXTRACTORS.items():
+            setattr(scraper, method, self.wrap(stage, getattr(scraper, method)))
+        self.module = module
+        self.original_parse = module.parse_html
+
+    def wrap(self, stage, func):
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if self.current is not None:
+                    self.current[stage] += time.perf_counter() - started
+        return timed
+
+    def __enter__(self):
+        self.module.parse_html = self.wrap('parse', self.original_parse)
+        return self
+
+    def __exit__(self, *exc):
+        self.module.parse_html = self.original_parse
+
+    def run(self, scraper, url, html):
+        """페이지 한 장 추출하고 단계별 시간 기록"""
+        self.current = dict.fromkeys(STAGES, 0.0)
+        started = time.perf_counter()
+        info = scraper.parse_concert_info(url, html)
+        self.current['total'] = time.perf_counter() - started
+        for stage, elapsed in self.current.items():
+            self.samples[stage].append(elapsed * 1000)
+        self.current = None
+        return info
+
+
+def accuracy(scraper, key, pages):
+    """필드별 정답 일치 비율 {필드: 0~1}, 틀린 (페이지, 필드) 목록"""
+    hits = dict.fromkeys(FIELDS, 0)
+    misses = []
+    for name, url, html in pages:
+        with open(expected_path(name), encoding='utf-8') as f:
+            expected = json.load(f)[key]
+        info = scraper.parse_concert_info(url, html)
+        for field in FIELDS:
+            if info[field] == expected[field]:
+                hits[field] += 1
+            else:
+                misses.append((name, field))
+    return {field: hits[field] / len(pages) for field in FIELDS}, misses
+
+
+def peak_memory_kb(scraper, pages):
+    """corpus 한 바퀴 추출하는 동안 tracemalloc 최대 메모리 (KB)"""
+    tracemalloc.start()
+    try:
+        for _, url, html in pages:
+            scraper.parse_concert_info(url, html)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def bench(key, scraper_class, module, pages, repeat):
+    """스크래퍼 하나의 결과 dict"""
+    scraper = scraper_class()
+    # 워밍업 (정규식 컴파일/키워드 사전 등 처음 한 번 비용 제외)
+    for _, url, html in pages:
+        scraper.parse_concert_info(url, html)
+
+    field_accuracy, misses = accuracy(scraper, key, pages)
+    memory = peak_memory_kb(scraper, pages)
+
+    timed_scraper = scraper_class()
+    with StageTimer(timed_scraper, module) as timer:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for _, url, html in pages:
+                timer.run(timed_scraper, url, html)
+        elapsed = time.perf_counter() - started
+
+    return {
+        'pages_per_sec': round(repeat * len(pages) / elapsed, 1),
+        'peak_kb': round(memory, 1),
+        'accuracy': {field: round(value, 4) for field, value in field_accuracy.items()},
+        'misses': misses,
+        'latency_ms': {
+            stage: {
+                'p50': round(statistics.median(timer.samples[stage]), 3),
+                'p95': round(percentile(timer.samples[stage], 0.95), 3),
+            }
+            for stage in STAGES
+        },
+    }
+
+
+def print_report(key, result):
+    print(f"\n🎼 {key}: {result['pages_per_sec']:,.1f} 페이지/초, 최대 메모리 {result['peak_kb']:,.1f} KB")
+    print(f"{'단계':<12} {'p50 ms':>9} {'p95 ms':>9}")
+    for stage in STAGES:
+        latency = result['latency_ms'][stage]
+        print(f"{stage:<12} {latency['p50']:>9.3f} {latency['p95']:>9.3f}")
+    print(' '.join(f"{field}={value:.0%}" for field, value in result['accuracy'].items()))
+    for name, field in result['misses']:
+        print(f"  ❌ {name}: {field} 정답과 다름")
+
+
+def regressions(results, baseline, tolerance, min_delta_ms):
+    """기준 대비 나빠진 항목 설명 목록"""
+    problems = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for field, value in result['accuracy'].items():
+            if value < base['accuracy'].get(field, 0):
+                problems.append(f"{key} {field} 정확도 {base['accuracy'][field]:.0%} → {value:.0%}")
+        for stage in STAGES:
+            before = base['latency_ms'].get(stage, {}).get('p95')
+            after = result['latency_ms'][stage]['p95']
+            # 마이크로초 단위 단계는 잡음이 커서 절대 증가량(min_delta_ms)도 넘어야 회귀로 봄
+            if before and after > before * (1 + tolerance) and after - before > min_delta_ms:
+                problems.append(f"{key} {stage} p95 {before:.3f}ms → {after:.3f}ms")
+        if result['peak_kb'] > base['peak_kb'] * (1 + tolerance):
+            problems.append(f"{key} 최대 메모리 {base['peak_kb']:,.1f}KB → {result['peak_kb']:,.1f}KB")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help='corpus 반복 횟수')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='p95/메모리 허용 증가 비율 (0.5 = 50%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=0.05, help='p95 회귀로 볼 최소 증가량 (ms)')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='기준 결과 파일')
+    parser.add_argument('--update-baseline', action='store_true', help='이번 결과를 기준 파일로 저장')
+    args = parser.parse_args()
+
+    pages = load_corpus()
+    print(f"📄 corpus 페이지 {len(pages)}개, {args.repeat}회 반복")
+    results = {
+        'simple': bench('simple', SimpleConcertScraper, simple_scraper, pages, args.repeat),
+        'concert': bench('concert', ConcertScraper, concert_scraper, pages, args.repeat),
+    }
+    for key, result in results.items():
+        print_report(key, result)
+
+    if args.update_baseline:
+        baseline = {key: {k: v for k, v in result.items() if k != 'misses'} for key, result in results.items()}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"\n💾 기준 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️ 기준 파일 없음 ({args.baseline}), --update-baseline으로 만드세요")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    problems = regressions(results, baseline, args.tolerance, args.min_delta_ms)
+    if problems:
+        print("\n🚨 기준 대비 회귀:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("\n✅ 기준 대비 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+⏱️ 키워드 사전 크기별 본문 훑기 비용 벤치마크
+keywords.json 사전에 가짜 공연장/작곡가 이름을 늘려 가며 corpus 페이지 본문을 훑는 시간을 잽니다.
+
+- automaton: KeywordMatcher (Aho-Corasick) 한 번 훑기
+- per-keyword: 예전 추출기처럼 키워드마다 대소문자 무시 정규식으로 본문 검색
+- alternation: 키워드 전체를 교대(|) 정규식 하나로 검색
+
+사용법: python benchmarks/bench_keywords.py [--sizes 30,100,300,1000,3000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'corpus'))
+
+from keyword_matcher import KeywordMatcher
+from extraction import load_keywords
+from page_parser import parse_html
+from update_golden import load_corpus
+
+
+def corpus_text():
+    """corpus 페이지 본문을 모두 이어 붙인 텍스트"""
+    return '\n'.join(parse_html(html).text for _, _, html in load_corpus())
+
+
+def synthetic_keywords(size, seed=0):
+    """실제 사전 + 가짜 한글/로마자 이름으로 size개 키워드 만들기"""
+    keywords = load_keywords()
+    words = list(dict.fromkeys(keywords['venues'] + keywords['composers']))
+    rng = random.Random(seed)
+    syllables = [chr(code) for code in range(ord('가'), ord('힣') + 1, 37)]
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    while len(words) < size:
+        if rng.random() < 0.5:
+            words.append(''.join(rng.choice(syllables) for _ in range(rng.randint(2, 5))) + rng.choice(['홀', '극장', '']))
+        else:
+            words.append(rng.choice(letters).upper() + ''.join(rng.choice(letters) for _ in range(rng.randint(4, 9))))
+    return words[:size]
+
+
+def bench_automaton(words, text):
+    matcher = KeywordMatcher()
+    for word in words:
+        matcher.add(word, word, ignore_case=True)
+    matcher.build()
+    return lambda: matcher.find_all(text)
+
+
+def bench_per_keyword(words, text):
+    patterns = [re.compile(re.escape(word), re.IGNORECASE) for word in words]
+    return lambda: [match.start() for pattern in patterns for match in pattern.finditer(text)]
+
+
+def bench_alternation(words, text):
+    alternation = '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    pattern = re.compile(f'(?=({alternation}))', re.IGNORECASE)
+    return lambda: [match.start() for match in pattern.finditer(text)]
+
+
+def measure(func, repeat):
+    """repeat번 중 가장 빠른 한 번 (ms)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='30,100,300,1000,3000', help='사전 크기 목록 (쉼표 구분)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    text = corpus_text()
+    sizes = [int(size) for size in args.sizes.split(',')]
+    print(f"📄 본문 {len(text):,}자, 반복 {args.repeat}회 중 최소값 (ms)")
+    print(f"{'사전 크기':>9} {'automaton':>10} {'per-keyword':>12} {'alternation':>12}")
+    for size in sizes:
+        words = synthetic_keywords(size)
+        row = [measure(build(words, text), args.repeat)
+               for build in (bench_automaton, bench_per_keyword, bench_alternation)]
+        print(f"{size:>9} {row[0]:>10.2f} {row[1]:>12.2f} {row[2]:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+⏱️ HTML 파서 백엔드별 파싱 + 텍스트 추출 벤치마크
+corpus/pages 의 저장된 공연 페이지를 백엔드마다 파싱해서 get_text까지 걸린 시간과 텍스트 크기를 잽니다.
+가지치기(script/style/nav/footer/메뉴 제거)를 끈 경우도 함께 보여 줍니다.
+
+사용법: python benchmarks/bench_parsers.py [--repeat 50] [--scale 1]
+  --scale N: 페이지 본문을 N번 반복해서 실제 사이트 크기(수백 KB)의 페이지를 흉내 냄
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'corpus'))
+
+from page_parser import parse_html, available_backends
+from update_golden import load_corpus
+
+
+def scaled(html, scale):
+    """<body> 내용을 scale번 반복한 HTML"""
+    if scale <= 1 or '<body' not in html:
+        return html
+    start = html.index('>', html.index('<body')) + 1
+    end = html.rindex('</body>')
+    return html[:start] + html[start:end] * scale + html[end:]
+
+
+def measure(pages, backend, prune, repeat):
+    """페이지당 (중앙값 ms, 텍스트 글자 수 합계)"""
+    timings = []
+    text_size = 0
+    for html in pages:
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            text = parse_html(html, backend, prune=prune).text
+            samples.append(time.perf_counter() - started)
+        timings.append(statistics.median(samples) * 1000)
+        text_size += len(text)
+    return sum(timings), text_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50, help='페이지마다 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--scale', type=int, default=1, help='본문 반복 배수')
+    args = parser.parse_args()
+
+    pages = [scaled(html, args.scale) for _, _, html in load_corpus()]
+    print(f"📄 페이지 {len(pages)}개, HTML {sum(map(len, pages)):,}자, 반복 {args.repeat}회 중앙값")
+    print(f"{'백엔드':<12} {'가지치기':>6} {'파싱+텍스트 ms':>14} {'텍스트 글자 수':>14}")
+    for backend in available_backends():
+        for prune in (False, True):
+            elapsed, text_size = measure(pages, backend, prune, args.repeat)
+            print(f"{backend:<12} {'O' if prune else 'X':>6} {elapsed:>14.2f} {text_size:>14,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+🗂️ 공연장 시즌 목록 크롤러
+사이트 어댑터의 목록/달력 페이지(listing_urls)를 돌면서 상세 페이지 링크
+(롯데콘서트홀 ConcertDetails/<id>, 예술의전당 show_view?SN=<id>)를 찾아 SQLite 프런티어에 쌓고,
+처음 보는 상세 페이지만 스크래퍼의 scrape_many로 동시에 추출합니다.
+
+- 프런티어(catalog.db)의 URL 기본 키가 "본 URL" 색인: 상세 URL은 ID로 정규화해서 중복 없이 한 번만 저장
+- 목록 페이지는 새 공연이 올라오므로 매번 받지만, 새 상세 링크가 하나도 없는 목록 페이지에서는
+  다음 페이지 링크를 따라가지 않음 → 다시 돌리면 대부분 시작 페이지 몇 장 + 새 공연 수만큼만 요청
+  (--full 이면 목록 페이지를 끝까지 다시 훑음)
+- 실패한 상세 페이지는 MAX_ATTEMPTS번까지 다음 실행에서 다시 시도
+
+사용법: python catalog_crawler.py [--site lotteconcerthall sac] [--db catalog.db] [--output new.jsonl] [--full]
+"""
+
+import argparse
+import html
+import json
+import re
+import sqlite3
+import time
+from urllib.parse import urljoin
+
+from batch_scraper import host_of, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT
+from site_adapters import ADAPTERS
+
+DEFAULT_CATALOG_PATH = 'catalog.db'
+# 한 번 실행에서 받을 최대 목록 페이지 수 (사이트별)
+DEFAULT_MAX_LISTING_PAGES = 50
+# 상세 페이지 실패 허용 횟수 (넘으면 더 시도하지 않음)
+MAX_ATTEMPTS = 3
+# 한 번에 scrape_many로 넘길 상세 URL 수
+DEFAULT_BATCH_SIZE = 50
+
+HREF_PATTERN = re.compile(r'href\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+def catalog_sources(names=None):
+    """크롤링할 수 있는 (목록 페이지가 있는) 어댑터 목록"""
+    sources = [adapter for adapter in ADAPTERS if adapter.listing_urls and adapter.detail_id_pattern]
+    if names:
+        sources = [adapter for adapter in sources if adapter.name in names]
+    return sources
+
+
+def detail_urls(adapter, page_html):
+    """목록 HTML에서 찾은 상세 페이지 URL (정규화, 나온 순서, 중복 제거)"""
+    ids = re.findall(adapter.detail_id_pattern, page_html)
+    return list(dict.fromkeys(adapter.detail_url.format(id=detail_id) for detail_id in ids))
+
+
+def listing_links(adapter, page_url, page_html):
+    """목록 HTML에서 따라갈 같은 호스트의 다른 목록 페이지 URL"""
+    if not adapter.listing_link_pattern:
+        return []
+    pattern = re.compile(adapter.listing_link_pattern)
+    links = []
+    for href in HREF_PATTERN.findall(page_html):
+        href = html.unescape(href)
+        if pattern.search(href):
+            url = urljoin(page_url, href).split('#', 1)[0]
+            if host_of(url) == host_of(page_url) and url not in links:
+                links.append(url)
+    return links
+
+
+class CatalogStore:
+    """크롤링 프런티어 (상세/목록 URL, 상태, 추출 결과)"""
+
+    def __init__(self, path=DEFAULT_CATALOG_PATH):
+        self.path = path
+        self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _init_db(self):
+        """프런티어 테이블 생성"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_frontier (
+                url TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                source TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                result TEXT,
+                discovered_at REAL NOT NULL,
+                fetched_at REAL
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_catalog_frontier_status ON catalog_frontier (kind, status)')
+        conn.commit()
+        conn.close()
+
+    def add(self, urls, kind, source):
+        """처음 보는 URL만 추가, 새로 추가된 수 반환"""
+        now = time.time()
+        conn = self._connect()
+        before = conn.total_changes
+        conn.executemany(
+            'INSERT OR IGNORE INTO catalog_frontier (url, kind, source, discovered_at) VALUES (?, ?, ?, ?)',
+            [(url, kind, source, now) for url in urls],
+        )
+        added = conn.total_changes - before
+        conn.commit()
+        conn.close()
+        return added
+
+    def mark_listing_fetched(self, url, source):
+        """목록 페이지를 받은 시각 기록 (목록은 매번 다시 받으므로 상태는 바꾸지 않음)"""
+        self.add([url], 'listing', source)
+        conn = self._connect()
+        conn.execute('UPDATE catalog_frontier SET fetched_at = ? WHERE url = ?', (time.time(), url))
+        conn.commit()
+        conn.close()
+
+    def pending_details(self):
+        """아직 추출하지 않은 상세 URL (실패했어도 시도 횟수가 남은 것 포함, 발견 순)"""
+        conn = self._connect()
+        rows = conn.execute('''
+            SELECT url FROM catalog_frontier
+            WHERE kind = 'detail' AND (status = 'pending' OR (status = 'failed' AND attempts < ?))
+            ORDER BY discovered_at, rowid
+        ''', (MAX_ATTEMPTS,)).fetchall()
+        conn.close()
+        return [row[0] for row in rows]
+
+    def record_result(self, item):
+        """scrape_many 결과 하나 저장 ({'url', 'success', 'result', 'error'})"""
+        conn = self._connect()
+        if item['success']:
+            conn.execute('''
+                UPDATE catalog_frontier SET status = 'done', attempts = attempts + 1, error = NULL,
+                    result = ?, fetched_at = ?
+                WHERE url = ?
+            ''', (json.dumps(item['result'], ensure_ascii=False), time.time(), item['url']))
+        else:
+            conn.execute('''
+                UPDATE catalog_frontier SET status = 'failed', attempts = attempts + 1, error = ?, fetched_at = ?
+                WHERE url = ?
+            ''', (item['error'], time.time(), item['url']))
+        conn.commit()
+        conn.close()
+
+    def stats(self):
+        """종류/상태별 URL 수"""
+        conn = self._connect()
+        rows = conn.execute('SELECT kind, status, COUNT(*) FROM catalog_frontier GROUP BY kind, status').fetchall()
+        conn.close()
+        return {f'{kind}_{status}': count for kind, status, count in rows}
+
+
+class CatalogCrawler:
+    def __init__(self, scraper, store, max_listing_pages=DEFAULT_MAX_LISTING_PAGES,
+                 max_workers=DEFAULT_MAX_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+        # get_page_content / scrape_many 가 있는 스크래퍼 (SimpleConcertScraper, ConcertScraper)
+        self.scraper = scraper
+        self.store = store
+        self.max_listing_pages = max_listing_pages
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+
+    def discover(self, adapter, full=False):
+        """목록 페이지를 훑어서 새 상세 URL을 프런티어에 추가, (받은 목록 페이지 수, 새 상세 URL 수) 반환"""
+        queue = list(adapter.listing_urls)
+        visited = set()
+        fetched = added = 0
+        while queue and fetched < self.max_listing_pages:
+            url = queue.pop(0)
+            if url in visited:
+                continue
+            visited.add(url)
+
+            page_html = self.scraper.get_page_content(url)
+            fetched += 1
+            if not page_html:
+                continue
+            self.store.mark_listing_fetched(url, adapter.name)
+
+            found = detail_urls(adapter, page_html)
+            new_details = self.store.add(found, 'detail', adapter.name)
+            added += new_details
+            # 본 공연만 있는 목록 페이지 뒤쪽은 이미 본 페이지로 봄 (공연 링크가 없는 안내/달력 첫 페이지는 계속 따라감)
+            if new_details or full or not found:
+                queue.extend(link for link in listing_links(adapter, url, page_html) if link not in visited)
+        return fetched, added
+
+    def scrape_pending(self, batch_size=DEFAULT_BATCH_SIZE):
+        """프런티어의 새 상세 페이지를 동시에 추출, 끝나는 순서대로 결과 yield
+
+        이번 실행에서 실패한 URL은 다음 실행에서 다시 시도 (한 실행에서 같은 URL을 두 번 받지 않음)
+        """
+        urls = self.store.pending_details()
+        for start in range(0, len(urls), batch_size):
+            batch = urls[start:start + batch_size]
+            for item in self.scraper.scrape_many(batch, max_workers=self.max_workers,
+                                                 per_host_limit=self.per_host_limit):
+                self.store.record_result(item)
+                yield item
+
+    def crawl(self, sources=None, full=False):
+        """목록 훑기 → 새 상세 페이지 추출, 결과 yield"""
+        for adapter in sources or catalog_sources():
+            fetched, added = self.discover(adapter, full=full)
+            print(f"🗂️ {adapter.name}: 목록 페이지 {fetched}개, 새 공연 {added}개")
+        yield from self.scrape_pending()
+
+
+def main():
+    from simple_scraper import SimpleConcertScraper
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--site', nargs='*', help='어댑터 이름 (기본: 목록 페이지가 있는 모든 사이트)')
+    parser.add_argument('--db', default=DEFAULT_CATALOG_PATH, help='프런티어 SQLite 파일')
+    parser.add_argument('--output', help='새로 추출한 공연을 JSON Lines로 덧붙일 파일')
+    parser.add_argument('--full', action='store_true', help='새 공연이 없어도 목록 페이지를 끝까지 훑기')
+    parser.add_argument('--max-listing-pages', type=int, default=DEFAULT_MAX_LISTING_PAGES)
+    args = parser.parse_args()
+
+    store = CatalogStore(args.db)
+    crawler = CatalogCrawler(SimpleConcertScraper(), store, max_listing_pages=args.max_listing_pages)
+    output = open(args.output, 'a', encoding='utf-8') if args.output else None
+    succeeded = failed = 0
+    try:
+        for item in crawler.crawl(catalog_sources(args.site), full=args.full):
+            if item['success']:
+                succeeded += 1
+                print(f"✅ {item['result']['title']} ({item['url']})")
+                if output:
+                    output.write(json.dumps(item['result'], ensure_ascii=False) + '\n')
+            else:
+                failed += 1
+                print(f"❌ {item['url']}: {item['error']}")
+    finally:
+        if output:
+            output.close()
+
+    print(f"\n📊 새로 추출 {succeeded}개, 실패 {failed}개, 프런티어 {store.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,15 +4,10 @@
 롯데콘서트홀, 예술의전당 등의 공연 정보를 예쁘게 추출합니다.
 """
 
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -20,140 +15,292 @@ from rich.table import Table
 from rich.prompt import Prompt
 from rich import print as rprint
 import re
-import time
+import threading
 from datetime import datetime
 import json
+from page_parser import parse_html
+from driver_pool import DriverPool, network_idle
+from site_adapters import FIELDS, extract_site_fields, find_adapter
+from polite_fetch import PoliteSession
+from batch_scraper import scrape_many, host_of, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT
+from fetch_strategy import STATIC, RENDERED, API, is_usable, api_url_for, json_to_html
+from scrape_timings import record_timings, stage, note, count, mark_failed
+from extraction import TextScanner, load_keywords, role_patterns, finditer_at, search_at, search_before, line_before, run_start
 
 console = Console()
 
+# 렌더링 준비를 기다리는 최대 시간 (초) — 준비 조건이 먼저 맞으면 바로 진행
+RENDER_DEADLINE = 8
+# 준비 조건 확인 간격 (초)
+RENDER_POLL = 0.1
+# 렌더링 결과의 응답 캐시 키 접두사 (정적 HTML과 같은 키를 쓰면 JS 껍데기 사이트의 정적 시도가
+# 캐시된 렌더링 결과를 받아 static으로 잘못 학습됨)
+RENDERED_CACHE_PREFIX = 'rendered:'
+
+# ---- 추출 패턴 (import 시점에 한 번만 컴파일) ----
+TITLE_SELECTORS = ['h1', '.concert_title', '.performance_title', 'title']
+
+TITLE_NAMED_PATTERN = re.compile(r'정명훈\s*&\s*원\s*코리아\s*오케스트라\s*<[^>]+>')
+TITLE_BRACKET_PATTERN = re.compile(r'[^<>\n]{5,100}<[^<>\n]+>')
+TITLE_BRACKET_STOP = re.compile(r'[<>\n]')
+TITLE_PLAIN_PATTERN = re.compile(r'[가-힣 \t\w&,\.]{5,100}')
+
+DATE_PATTERNS = [
+    re.compile(r'\d{4}[-\.]\d{1,2}[-\.]\d{1,2}\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}'),
+    re.compile(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}'),
+    re.compile(r'\d{4}[-\.]\d{1,2}[-\.]\d{1,2}'),
+    re.compile(r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일'),
+]
+
+# 키워드 사전 (keywords.json)
+KEYWORDS = load_keywords()
+
+VENUES = KEYWORDS['venues']
+# 공연장 이름 + 바로 뒤의 홀 이름 ("세종문화회관 대극장", 사이트 이름 같은 다른 글자는 뺌)
+VENUE_PATTERNS = {
+    venue: re.compile(rf'{re.escape(venue)}(?:[ \t]*[가-힣A-Za-z]*(?:홀|극장|관|룸|센터))?') for venue in VENUES
+}
+
+# 롯데콘서트홀 형식: "역할 | 이름" — (패턴, 역할, 시작 키워드)
+# (합창은 "국립합창단, 안양시립합창단"처럼 여러 단체를 쉼표로 나열)
+ROLE_PATTERNS = role_patterns(KEYWORDS['roles'], r'([^\n,]+)', overrides={'합창': r'([^\n]+)'})
+# 한글/영문 이름 분리 (영문은 악센트 있는 라틴 문자 포함: Jarůšková, Šimon)
+NAME_SPLIT_PATTERN = re.compile(r'([가-힣\s,]+)\s*([A-Za-zÀ-ÖØ-öø-ɏ\s\-,]+)?')
+
+# 일반적인 출연진 패턴 — (패턴, 시작 키워드)
+CAST_PATTERNS = [
+    (re.compile(r'출연\s*[:\s]*([^\n]+)'), '출연'),
+    (re.compile(r'연주자\s*[:\s]*([^\n]+)'), '연주자'),
+]
+
+# 베토벤 교향곡 제9번 특별 패턴 — (패턴, 후보 종류, 시작 키워드)
+BEETHOVEN_PATTERNS = [
+    (re.compile(r'베토벤\s*교향곡\s*제\s*9번[^\n]{0,50}', re.IGNORECASE), 'composer', '베토벤'),
+    (re.compile(r'Beethoven\s*Symphony\s*No\.?\s*9[^\n]{0,50}', re.IGNORECASE), 'composer', 'Beethoven'),
+    (re.compile(r'교향곡\s*제\s*9번[^\n]*(?:합창|Choral)', re.IGNORECASE), 'symphony', '교향곡'),
+    (re.compile(r'베토벤[^\n]{0,30}(?:d단조|D\s*minor)[^\n]{0,30}(?:op\.?\s*125|Op\.?\s*125)', re.IGNORECASE), 'composer', '베토벤'),
+]
+
+# 일반적인 작곡가 패턴
+COMPOSERS = KEYWORDS['composers']
+COMPOSER_PATTERNS = [
+    (composer, re.compile(rf'{re.escape(composer)}[^\n]{{5,100}}', re.IGNORECASE)) for composer in COMPOSERS
+]
+PROGRAM_SKIP_WORDS = ['가격', 'price', '티켓', 'ticket']
+
+# 좌석별 가격 패턴 — (패턴, 후보 종류)
+SEAT_PATTERNS = [
+    (re.compile(r'[RSABCVIP]+석\s*[:\s]*[\d,]+원'), 'seat'),
+    (re.compile(r'[RSABCVIP]+\s*[:\s]*[\d,]+원'), 'seat'),
+    (re.compile(r'(?:전석|일반|학생)\s*[:\s]*[\d,]+원'), 'seat_grade'),
+    (re.compile(r'시야방해[RSAB]*\s*[:\s]*[\d,]+원'), 'obstructed'),
+]
+PRICE_DIGITS = '0123456789,'
+
+# 본문 한 번 훑기로 모든 추출기의 후보 위치 수집
+SCANNER = TextScanner(
+    patterns={
+        'bracket': '<',
+        'date': r'\d\d\d\d[-\.년]',
+        'seat': r'[RSABCVIP]+(?=석|[\s:]*[\d,]+원)',
+    },
+    keywords={
+        'title_name': ['정명훈'],
+        'venue': VENUES,
+        'role': [literal for _, _, literal in ROLE_PATTERNS],
+        'cast': [literal for _, literal in CAST_PATTERNS],
+        'symphony': ['교향곡'],
+        'seat_grade': ['전석', '일반', '학생'],
+        'obstructed': ['시야방해'],
+        'won': ['원'],
+    },
+    ci_keywords={
+        'composer': COMPOSERS,
+    },
+)
+
 class ConcertScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, cache=None, parser=None, driver_pool=None, strategies=None, timings=None):
+        # 호스트별 속도/동시성 제한 + 재시도 (제한은 프로세스 안의 모든 스크래퍼가 공유)
+        self.session = PoliteSession()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
         })
-        self.driver = None
-
-    def setup_driver(self):
-        """Selenium WebDriver 설정"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')  # 헤드리스 모드
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
+        # http_cache.ResponseCache (None이면 캐시 없이 매번 다운로드)
+        self.cache = cache
+        # HTML 파서 백엔드 (None이면 page_parser.DEFAULT_BACKEND)
+        self.parser = parser
+        # driver_pool.DriverPool (없으면 처음 렌더링할 때 브라우저 1개짜리 풀을 만듦)
+        self.driver_pool = driver_pool
+        self._owns_pool = driver_pool is None
+        self._pool_lock = threading.Lock()
+        # fetch_strategy.FetchStrategyStore (None이면 예전처럼 requests → 실패 시 Selenium)
+        self.strategies = strategies
+        # scrape_timings.TimingAggregate (있으면 결과에 `_timings`를 붙이고 집계에 추가)
+        self.timings = timings
+
+    def get_driver_pool(self):
+        """렌더링용 드라이버 풀"""
+        with self._pool_lock:
+            if self.driver_pool is None:
+                self.driver_pool = DriverPool(size=1)
+            return self.driver_pool
+
     def get_page_content(self, url):
         """페이지 콘텐츠 가져오기 (Selenium + requests 조합)"""
+        # 먼저 requests로 시도, 실패시 Selenium 사용
+        return self.fetch_static(url) or self.fetch_rendered(url)
+
+    def fetch_static(self, url):
+        """requests로 HTML 가져오기 (캐시가 있으면 캐시/조건부 요청, 실패하면 None)"""
         try:
-            # 먼저 requests로 시도
-            response = self.session.get(url, timeout=10)
-            if response.status_code == 200:
-                return response.text
-        except:
-            pass
-            
-        # requests 실패시 Selenium 사용
+            with stage('fetch'):
+                if self.cache:
+                    html_content, source = self.cache.fetch_with_source(self.session, url, timeout=10)
+                else:
+                    response = self.session.get(url, timeout=10)
+                    if response.status_code != 200:
+                        return None
+                    html_content, source = response.text, 'network'
+        except Exception:
+            return None
+
+        note(fetch_path=source)
+        if source == 'network':
+            count('bytes', len(html_content.encode('utf-8')))
+        return html_content
+
+    def fetch_rendered(self, url):
+        """브라우저로 렌더링한 HTML 가져오기 (실패하면 None)"""
+        cache_key = RENDERED_CACHE_PREFIX + url
+        if self.cache:
+            entry = self.cache.get(cache_key)
+            if entry and self.cache.is_fresh(entry):
+                note(fetch_path='cache')
+                return entry['body']
+
         try:
-            if not self.driver:
-                self.setup_driver()
-            
-            self.driver.get(url)
-            time.sleep(3)  # 페이지 로딩 대기
-            return self.driver.page_source
+            # 풀에서 미리 떠 있는 브라우저를 빌려 페이지 이동만 함 (스레드마다 다른 브라우저)
+            with stage('render'), self.get_driver_pool().driver() as driver:
+                page_source = self.render_page(driver, url)
+            note(fetch_path='rendered')
+            count('bytes', len(page_source.encode('utf-8')))
+
+            # 렌더링 결과는 검증자(ETag 등) 없이 저장 → TTL 동안만 재사용
+            if self.cache:
+                self.cache.store(cache_key, page_source)
+            return page_source
         except Exception as e:
             console.print(f"[red]페이지 로딩 실패: {str(e)}")
             return None
 
-    def extract_title(self, soup, text):
+    def fetch_with_api(self, url, api_url):
+        """정적 HTML + API 응답(JSON 문자열 값)을 합친 HTML (둘 다 실패하면 None)"""
+        page_html = self.fetch_static(url) or ''
+        api_address = api_url_for(api_url, url)
+        if api_address:
+            try:
+                with stage('fetch_api'):
+                    response = self.session.get(api_address, timeout=10)
+                    response.raise_for_status()
+                note(fetch_path='api')
+                count('bytes', len(response.content))
+                api_html = json_to_html(response.json())
+                if '</body>' in page_html:
+                    page_html = page_html.replace('</body>', api_html + '</body>', 1)
+                else:
+                    page_html += api_html
+            except Exception as e:
+                console.print(f"[yellow]API 요청 실패 ({api_address}): {str(e)}")
+        return page_html or None
+
+    def render_page(self, driver, url):
+        """브라우저로 페이지를 열고 준비 조건이 맞는 즉시 HTML 반환
+
+        사이트 어댑터에 준비 노드(ready_selector)가 있으면 그 노드가 나타날 때까지,
+        없으면 네트워크가 잠잠해질 때까지 기다리고, 어느 쪽이든 RENDER_DEADLINE을 넘기지 않습니다.
+        """
+        driver.get(url)  # eager: DOMContentLoaded까지만 기다림
+
+        adapter = find_adapter(url)
+        if adapter and adapter.ready_selector:
+            condition = EC.presence_of_element_located((By.CSS_SELECTOR, adapter.ready_selector))
+        else:
+            condition = network_idle()
+
+        try:
+            WebDriverWait(driver, RENDER_DEADLINE, poll_frequency=RENDER_POLL).until(condition)
+        except TimeoutException:
+            console.print(f"[yellow]렌더링 준비 조건 시간 초과 ({RENDER_DEADLINE}초), 현재 상태로 진행")
+
+        return driver.page_source
+
+    def extract_title(self, page, text, index=None):
         """공연 제목 추출"""
-        title_patterns = [
-            r'정명훈\s*&\s*원\s*코리아\s*오케스트라\s*<[^>]+>',
-            r'[^<>\n]{5,100}<[^<>\n]+>',
-            r'[가-힣\s\w&,\.]{5,100}'
-        ]
-        
+        index = index or SCANNER.scan(text)
+
         # 텍스트에서 패턴 매칭
-        for pattern in title_patterns:
-            match = re.search(pattern, text)
+        candidates = [
+            search_at(TITLE_NAMED_PATTERN, text, index.positions('title_name')),
+            search_before(TITLE_BRACKET_PATTERN, text, index.positions('bracket'),
+                          stop_class=TITLE_BRACKET_STOP, lookback=100),
+            # 검색 결과/목록 페이지: 첫 날짜 바로 윗줄
+            line_before(text, index.positions('date')),
+            TITLE_PLAIN_PATTERN.search(text),
+        ]
+
+        for match in candidates:
             if match:
                 title = match.group().strip()
                 if len(title) > 5:
                     return title
         
         # HTML 태그에서 찾기
-        title_selectors = ['h1', '.concert_title', '.performance_title', 'title']
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                title = element.get_text().strip()
+        for selector in TITLE_SELECTORS:
+            element_text = page.select_text(selector)
+            if element_text and element_text.strip():
+                title = element_text.strip()
                 if len(title) > 5 and '공연정보' not in title:
                     return title
                     
         return "제목 없음"
 
-    def extract_date_time(self, text):
+    def extract_date_time(self, text, index=None):
         """날짜 및 시간 추출"""
-        date_patterns = [
-            r'\d{4}[-\.]\d{1,2}[-\.]\d{1,2}\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}',
-            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}',
-            r'\d{4}[-\.]\d{1,2}[-\.]\d{1,2}',
-            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        index = index or SCANNER.scan(text)
+
+        for pattern in DATE_PATTERNS:
+            match = search_at(pattern, text, index.positions('date'))
             if match:
                 return match.group().strip()
                 
         return ""
 
-    def extract_venue(self, text):
+    def extract_venue(self, text, index=None):
         """공연장 추출"""
-        venues = [
-            '롯데콘서트홀', '예술의전당', 'SAC', '세종문화회관', '통영국제음악당',
-            'LG아트센터', '금호아트홀', '블루스퀘어', 'IBK챔버홀', '리사이틀홀'
-        ]
-        
-        for venue in venues:
-            if venue in text:
+        index = index or SCANNER.scan(text)
+
+        for venue in VENUES:
+            positions = index.positions('venue', venue)
+            if positions:
                 # 주변 텍스트도 함께 추출
-                pattern = rf'{venue}[^\n]{{0,30}}'
-                match = re.search(pattern, text)
+                match = VENUE_PATTERNS[venue].match(text, positions[0])
                 if match:
                     return match.group().strip()
                     
         return ""
 
-    def extract_performers(self, text):
+    def extract_performers(self, text, index=None):
         """출연진 정보 추출"""
+        index = index or SCANNER.scan(text)
         performers = []
         
-        # 롯데콘서트홀 형식: "역할 | 이름"
-        role_patterns = [
-            (r'지휘\s*[|│]\s*([^\n,]+)', '지휘'),
-            (r'소프라노\s*[|│]\s*([^\n,]+)', '소프라노'),
-            (r'메조\s*소프라노\s*[|│]\s*([^\n,]+)', '메조소프라노'),
-            (r'테너\s*[|│]\s*([^\n,]+)', '테너'),
-            (r'바리톤\s*[|│]\s*([^\n,]+)', '바리톤'),
-            (r'연주\s*[|│]\s*([^\n,]+)', '연주'),
-            (r'합창\s*[|│]\s*([^\n,]+)', '합창'),
-            (r'피아노\s*[|│]\s*([^\n,]+)', '피아노'),
-            (r'바이올린\s*[|│]\s*([^\n,]+)', '바이올린')
-        ]
-        
-        for pattern, role in role_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, role, literal in ROLE_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions('role', literal)):
                 name = match.group(1).strip()
                 if name and len(name) > 1:
                     # 한글/영문 이름 분리
-                    name_match = re.search(r'([\가-힣\s]+)\s*([A-Za-z\s\-]+)?', name)
+                    name_match = NAME_SPLIT_PATTERN.search(name)
                     if name_match:
                         kor_name = name_match.group(1).strip()
                         eng_name = name_match.group(2).strip() if name_match.group(2) else ""
@@ -168,14 +315,8 @@ class ConcertScraper:
                             performers.append(performer_info)
         
         # 일반적인 출연진 패턴
-        general_patterns = [
-            r'출연\s*[:\s]*([^\n]+)',
-            r'연주자\s*[:\s]*([^\n]+)'
-        ]
-        
-        for pattern in general_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, literal in CAST_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions('cast', literal)):
                 names = match.group(1).split(',')
                 for name in names:
                     name = name.strip()
@@ -184,102 +325,163 @@ class ConcertScraper:
         
         return performers[:15]  # 최대 15명
 
-    def extract_program(self, text):
+    def extract_program(self, text, index=None):
         """프로그램 정보 추출"""
+        index = index or SCANNER.scan(text)
         programs = []
         
         # 베토벤 교향곡 제9번 특별 패턴
-        beethoven_patterns = [
-            r'베토벤\s*교향곡\s*제\s*9번[^\n]{0,50}',
-            r'Beethoven\s*Symphony\s*No\.?\s*9[^\n]{0,50}',
-            r'교향곡\s*제\s*9번[^\n]*(?:합창|Choral)',
-            r'베토벤[^\n]{0,30}(?:d단조|D\s*minor)[^\n]{0,30}(?:op\.?\s*125|Op\.?\s*125)'
-        ]
-        
-        for pattern in beethoven_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern, kind, literal in BEETHOVEN_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions(kind, literal)):
                 program = match.group().strip()
                 if program not in programs:
                     programs.append(program)
         
         # 일반적인 작곡가 패턴
-        composers = [
-            'Bach', 'Mozart', 'Beethoven', 'Brahms', 'Chopin', 'Schubert', 
-            'Rachmaninoff', 'Tchaikovsky', 'Mahler', 'Debussy', 'Ravel',
-            '바흐', '모차르트', '베토벤', '브람스', '쇼팽', '슈베르트', '차이콥스키'
-        ]
-        
-        for composer in composers:
-            pattern = rf'{composer}[^\n]{{5,100}}'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for composer, pattern in COMPOSER_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions('composer', composer)):
                 program = match.group().strip()
                 if len(program) > 10 and len(program) < 150:
-                    if not any(p in program.lower() for p in ['가격', 'price', '티켓', 'ticket']) and program not in programs:
+                    if not any(p in program.lower() for p in PROGRAM_SKIP_WORDS) and program not in programs:
                         programs.append(program)
         
         return programs[:10]  # 최대 10개
 
-    def extract_price(self, text):
+    def extract_price(self, text, index=None):
         """가격 정보 추출"""
+        index = index or SCANNER.scan(text)
         prices = []
         
         # 좌석별 가격 패턴
-        seat_patterns = [
-            r'[RSABCVIP]+석\s*[:\s]*[\d,]+원',
-            r'[RSABCVIP]+\s*[:\s]*[\d,]+원',
-            r'(?:전석|일반|학생)\s*[:\s]*[\d,]+원',
-            r'시야방해[RSAB]*\s*[:\s]*[\d,]+원'
-        ]
-        
-        for pattern in seat_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, kind in SEAT_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions(kind)):
                 price = match.group().strip()
                 if price not in prices:
                     prices.append(price)
         
-        # 일반 가격 패턴 (좌석별이 없을 때)
+        # 일반 가격 패턴 (좌석별이 없을 때): "숫자원" 의 '원' 위치에서 숫자 구간을 거꾸로 찾음
         if not prices:
-            general_patterns = [r'[\d,]+원']
-            for pattern in general_patterns:
-                matches = re.finditer(pattern, text)
-                for match in matches:
-                    price_str = match.group().strip()
-                    # 숫자만 추출해서 합리적인 범위인지 확인
-                    price_num = int(re.sub(r'[^\d]', '', price_str))
-                    if 1000 <= price_num <= 1000000:  # 1천원~100만원
-                        if price_str not in prices:
-                            prices.append(price_str)
+            for won in index.positions('won'):
+                if won == 0 or text[won - 1] not in PRICE_DIGITS:
+                    continue
+                price_str = text[run_start(text, won, PRICE_DIGITS):won + 1]
+                # 숫자만 추출해서 합리적인 범위인지 확인
+                digits = price_str.replace(',', '')[:-1]
+                if digits and 1000 <= int(digits) <= 1000000:  # 1천원~100만원
+                    if price_str not in prices:
+                        prices.append(price_str)
         
         return prices[:8]  # 최대 8개 가격
 
     def scrape_concert_info(self, url):
         """공연 정보 스크래핑"""
         console.print(f"[cyan]🔍 스크래핑 중: {url}")
-        
-        html_content = self.get_page_content(url)
+
+        with record_timings(self.timings, url) as timings:
+            concert_info = self.fetch_and_parse(url)
+            if concert_info is None:
+                mark_failed()
+
+        if timings and concert_info:
+            concert_info['_timings'] = timings.as_dict()
+        return concert_info
+
+    def fetch_and_parse(self, url):
+        """전략에 맞게 가져와서 추출 (가져오기 실패면 None)"""
+        if self.strategies is None:
+            html_content = self.get_page_content(url)
+            if not html_content:
+                return None
+            return self.parse_concert_info(url, html_content)
+
+        # 이 호스트에 맞는 방법을 알면 바로 그 방법으로 (JS 껍데기만 주는 사이트는 requests를 건너뜀)
+        host = host_of(url)
+        known = self.strategies.lookup(host)
+        note(strategy=known['strategy'] if known else 'probe')
+        if known:
+            info = self.scrape_with(known['strategy'], url, known['api_url'])
+            if known['source'] == 'learned':
+                self.strategies.record(host, known['strategy'], is_usable(info))
+            if info is None and known['strategy'] != RENDERED:
+                # 요청 자체가 실패(차단/오류)하면 예전처럼 브라우저로
+                info = self.scrape_with(RENDERED, url)
+            return info
+
+        # 처음 보는 호스트: 싼 방법부터 시도해서 쓸 만한 필드가 나온 방법을 기억
+        info = None
+        for strategy, api_url in self.probe_order(url):
+            result = self.scrape_with(strategy, url, api_url)
+            if is_usable(result):
+                self.strategies.record(host, strategy, True)
+                return result
+            info = info or result
+        return info
+
+    def probe_order(self, url):
+        """처음 보는 호스트에서 시도할 (전략, API 주소 템플릿) 순서"""
+        order = [(STATIC, None)]
+        adapter = find_adapter(url)
+        if adapter and adapter.api_url:
+            order.append((API, adapter.api_url))
+        order.append((RENDERED, None))
+        return order
+
+    def scrape_with(self, strategy, url, api_url=None):
+        """정해진 방법으로 가져와서 추출 (가져오기 실패면 None)"""
+        if strategy == RENDERED:
+            html_content = self.fetch_rendered(url)
+        elif strategy == API:
+            html_content = self.fetch_with_api(url, api_url)
+        else:
+            html_content = self.fetch_static(url)
+
         if not html_content:
             return None
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        text_content = soup.get_text()
-        
+        return self.parse_concert_info(url, html_content)
+
+    def parse_concert_info(self, url, html_content):
+        """이미 받아온 HTML에서 공연 정보 추출 (네트워크 없음)"""
+        # 파싱 + script/style/nav/footer/메뉴 가지치기
+        with stage('parse'):
+            page = parse_html(html_content, self.parser)
+        note(html_length=len(html_content))
+
+        # 사이트 어댑터: 알려진 DOM 노드의 작은 조각에서만 추출
+        fields = extract_site_fields(self, url, page)
+
+        # 어댑터가 없거나 못 찾은 필드만 본문 전체에서 범용 추출
+        missing = [field for field in FIELDS if field not in fields]
+        if missing:
+            with stage('text'):
+                text_content = page.text
+            note(text_length=len(text_content))
+            with stage('scan'):
+                index = SCANNER.scan(text_content)
+            generic = {
+                'title': lambda: self.extract_title(page, text_content, index),
+                'date': lambda: self.extract_date_time(text_content, index),
+                'venue': lambda: self.extract_venue(text_content, index),
+                'performers': lambda: self.extract_performers(text_content, index),
+                'program': lambda: self.extract_program(text_content, index),
+                'price': lambda: self.extract_price(text_content, index),
+            }
+            for field in missing:
+                with stage(f'extract_{field}'):
+                    fields[field] = generic[field]()
+
         # 정보 추출
         concert_info = {
             'url': url,
             'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'title': self.extract_title(soup, text_content),
-            'date': self.extract_date_time(text_content),
-            'venue': self.extract_venue(text_content),
-            'performers': self.extract_performers(text_content),
-            'program': self.extract_program(text_content),
-            'price': self.extract_price(text_content)
         }
+        concert_info.update((field, fields[field]) for field in FIELDS)
         
         return concert_info
 
+    def scrape_many(self, urls, max_workers=DEFAULT_MAX_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+        """여러 공연 URL 동시 스크래핑 (끝나는 순서대로 결과 반환)"""
+        return scrape_many(self, urls, max_workers=max_workers, per_host_limit=per_host_limit)
+
     def display_concert_info(self, info):
         """공연 정보를 예쁘게 출력"""
         if not info:
@@ -345,9 +547,9 @@ class ConcertScraper:
             console.print(f"[red]❌ 저장 실패: {str(e)}")
 
     def close(self):
-        """리소스 정리"""
-        if self.driver:
-            self.driver.quit()
+        """리소스 정리 (직접 만든 드라이버 풀만 닫음)"""
+        if self._owns_pool and self.driver_pool:
+            self.driver_pool.close()
 
 
 def main():
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+🎯 corpus 골든 결과 갱신
+corpus/pages/*.html 을 두 스크래퍼로 파싱해서 corpus/golden/<이름>.json 에 저장합니다.
+추출 결과가 의도적으로 바뀌었을 때만 실행하세요.
+골든은 추출기 자신의 스냅숏(회귀 확인용)일 뿐 정답이 아닙니다. 정답은 페이지를 직접 보고 손으로 쓴
+corpus/expected/<이름>.json 이고, 이 스크립트는 그 파일을 건드리지 않습니다.
+
+사용법: python corpus/update_golden.py
+"""
+
+import json
+import os
+import sys
+
+CORPUS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(CORPUS_DIR))
+
+from simple_scraper import SimpleConcertScraper
+from concert_scraper import ConcertScraper
+
+FIELDS = ['title', 'date', 'venue', 'performers', 'program', 'price']
+
+
+def load_corpus():
+    """(이름, URL, HTML) 목록"""
+    with open(os.path.join(CORPUS_DIR, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    pages = []
+    for entry in manifest:
+        with open(os.path.join(CORPUS_DIR, 'pages', f"{entry['name']}.html"), encoding='utf-8') as f:
+            pages.append((entry['name'], entry['url'], f.read()))
+    return pages
+
+
+def extract_fields(scraper, url, html):
+    """비교 대상 필드만 추출 (url, scraped_at 제외)"""
+    info = scraper.parse_concert_info(url, html)
+    return {field: info[field] for field in FIELDS}
+
+
+def golden_path(name):
+    return os.path.join(CORPUS_DIR, 'golden', f'{name}.json')
+
+
+def expected_path(name):
+    """손으로 확인한 정답 파일 ({'notes': ..., 'simple': {...}, 'concert': {...}})"""
+    return os.path.join(CORPUS_DIR, 'expected', f'{name}.json')
+
+
+def main():
+    scrapers = {'simple': SimpleConcertScraper(), 'concert': ConcertScraper()}
+    for name, url, html in load_corpus():
+        golden = {key: extract_fields(scraper, url, html) for key, scraper in scrapers.items()}
+        with open(golden_path(name), 'w', encoding='utf-8') as f:
+            json.dump(golden, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+        print(f"💾 {golden_path(name)}")
+
+
+if __name__ == '__main__':
+    main()
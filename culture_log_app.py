@@ -3,16 +3,28 @@
 🎭 My Culture Log - 개인 문화생활 기록 플랫폼 MVP
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, render_template, request, jsonify, send_from_directory, Response, stream_with_context, g
 from flask_cors import CORS
 from simple_scraper import SimpleConcertScraper
-import sqlite3
+from http_cache import ResponseCache
+from scrape_timings import SharedTimingAggregate
+from metrics import REGISTRY, CONTENT_TYPE, Counter, Histogram
+from scrape_metrics import SCRAPES_IN_FLIGHT, record_scrape, observe_scrape
+from rescrape_scheduler import RescrapeScheduler
+from task_store import ScrapeTaskStore, STATUS_DONE, STAGE_FETCHING, FINAL_STAGES
+from db_pool import ConnectionPool
+from log_search import create_search_index, search_clause, render_snippet
+from log_details import create_detail_tables, save_log_details, normalize_name, canonical_composer
+from log_pagination import (
+    ORDER_BY as LOG_ORDER_BY, COUNT_MODES, CountCache, create_indexes, encode_cursor, decode_cursor,
+    keyset_condition, keyset_params, cursor_size,
+)
+from scrape_executor import ScrapeExecutor, ScrapeQueueFull, new_task_id, DEFAULT_RETRY_AFTER as SCRAPE_RETRY_AFTER
 import json
 import os
 import uuid
 from datetime import datetime
 from PIL import Image
-import threading
 import time
 
 app = Flask(__name__)
@@ -22,6 +34,27 @@ CORS(app)
 UPLOAD_FOLDER = 'uploads'
 THUMBNAILS_FOLDER = 'thumbnails'
 DATABASE = 'culture_log.db'
+MAX_BATCH_URLS = 100
+HTTP_CACHE_DB = 'http_cache.db'
+# 스크래핑 작업 상태/결과 (워커 공유), 같은 URL의 결과를 다시 쓰는 시간 (초)
+SCRAPE_TASK_DB = os.environ.get('SCRAPE_TASK_DB', 'scrape_tasks.db')
+SCRAPE_RESULT_TTL = int(os.environ.get('SCRAPE_RESULT_TTL', 3600))
+# inline: 웹 프로세스 안에서 스크래핑, worker: scrape_worker.py 프로세스에 맡김 (살아 있는 워커가 없으면 inline)
+SCRAPE_MODE = os.environ.get('SCRAPE_MODE', 'inline')
+# worker 모드에서 큐에 쌓아 둘 최대 작업 수 (넘으면 429)
+SCRAPE_JOB_QUEUE_MAX = int(os.environ.get('SCRAPE_JOB_QUEUE_MAX', 100))
+# 진행 상황 스트림(SSE)을 열어 둘 최대 시간, 롱폴링 최대 대기, keep-alive 주석 간격 (초)
+SCRAPE_EVENTS_TIMEOUT = int(os.environ.get('SCRAPE_EVENTS_TIMEOUT', 90))
+SCRAPE_LONG_POLL_MAX = 25
+SSE_KEEPALIVE = 15
+# 스크래핑 응답 캐시 설정 (TTL 초, 최대 용량 MB)
+SCRAPE_CACHE_TTL = int(os.environ.get('SCRAPE_CACHE_TTL', 3600))
+SCRAPE_CACHE_MAX_MB = int(os.environ.get('SCRAPE_CACHE_MAX_MB', 50))
+# 단계별 시간 집계에 남길 최근 스크래핑 수, 집계 파일 (웹 프로세스와 scrape_worker.py 공유)
+SCRAPE_TIMINGS_WINDOW = int(os.environ.get('SCRAPE_TIMINGS_WINDOW', 500))
+SCRAPE_TIMINGS_DB = os.environ.get('SCRAPE_TIMINGS_DB', 'scrape_timings.db')
+# 저장된 공연 페이지 재확인 주기 (초, 0이면 끔)
+RESCRAPE_INTERVAL = int(os.environ.get('RESCRAPE_INTERVAL', 600))
 
 # 폴더 생성
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -29,13 +62,45 @@ os.makedirs(THUMBNAILS_FOLDER, exist_ok=True)
 os.makedirs('static', exist_ok=True)
 
 # 전역 변수
-scraper = SimpleConcertScraper()
-scraping_results = {}
-scraping_status = {}
+# culture_log.db 연결 (스레드마다 하나, WAL)
+db = ConnectionPool(DATABASE)
+# /api/logs?count=approx 용 조건별 전체 개수
+log_counts = CountCache()
+scrape_timings = SharedTimingAggregate(SCRAPE_TIMINGS_DB, SCRAPE_TIMINGS_WINDOW)
+scraper = SimpleConcertScraper(cache=ResponseCache(
+    HTTP_CACHE_DB, ttl=SCRAPE_CACHE_TTL, max_bytes=SCRAPE_CACHE_MAX_MB * 1024 * 1024
+), timings=scrape_timings)
+# 시작은 start_rescrape_scheduler() (gunicorn.conf.py의 post_worker_init, 직접 실행할 때)
+rescrape_scheduler = RescrapeScheduler(scraper, DATABASE)
+scrape_tasks = ScrapeTaskStore(SCRAPE_TASK_DB, ttl=SCRAPE_RESULT_TTL)
+
+# 메트릭 (/metrics, gunicorn 워커 전체 합계)
+REQUEST_LATENCY = Histogram('http_request_duration_seconds', '라우트별 요청 처리 시간', ['method', 'route'])
+REQUESTS = Counter('http_requests_total', '라우트/상태 코드별 요청 수', ['method', 'route', 'status'])
+# (스크래핑 메트릭은 scrape_worker.py 와 같이 쓰는 scrape_metrics.py)
+DB_QUERY_DURATION = Histogram('db_query_duration_seconds', 'SQLite 조회 시간', ['query'])
+UPLOADS = Counter('photo_uploads_total', '업로드된 사진 수')
+UPLOAD_BYTES = Counter('photo_upload_bytes_total', '업로드된 사진 바이트 수')
+THUMBNAIL_DURATION = Histogram('thumbnail_duration_seconds', '썸네일 생성 시간')
+THUMBNAIL_FAILURES = Counter('thumbnail_failures_total', '썸네일 생성 실패 수')
+
+
+def start_rescrape_scheduler():
+    """저장된 공연 페이지 재확인 시작 (SCRAPE_MODE=worker면 scrape_worker.py가 하므로 웹 프로세스에서는 안 함)"""
+    if RESCRAPE_INTERVAL > 0 and SCRAPE_MODE != 'worker':
+        rescrape_scheduler.start(RESCRAPE_INTERVAL)
+        return True
+    return False
+
 
 def init_db():
-    """데이터베이스 초기화"""
-    conn = sqlite3.connect(DATABASE)
+    """데이터베이스 초기화 (WAL 모드는 연결 풀이 켬)"""
+    with db.connection() as conn:
+        create_tables(conn)
+    print(f"✅ 데이터베이스 초기화 완료: {DATABASE}")
+
+def create_tables(conn):
+    """테이블 생성"""
     cursor = conn.cursor()
 
     # 문화생활 기록 테이블
@@ -58,9 +123,33 @@ def init_db():
         )
     ''')
 
-    conn.commit()
-    conn.close()
-    print(f"✅ 데이터베이스 초기화 완료: {DATABASE}")
+    # 목록 정렬/카테고리 필터용 인덱스
+    create_indexes(conn)
+
+    # 출연진/프로그램/가격 하위 테이블 (처음 만들면 기존 기록 옮김)
+    create_detail_tables(conn)
+
+    # 검색 색인 (FTS5 trigram, 없으면 LIKE 검색)
+    create_search_index(conn)
+
+def format_log(log):
+    """culture_logs 행 → API 응답 항목"""
+    photos = json.loads(log[10]) if log[10] else []
+    return {
+        'id': log[0],
+        'title': log[1],
+        'category': log[2],
+        'date': log[3],
+        'venue': log[4],
+        'performers': log[5],
+        'program': log[6],
+        'price': log[7],
+        'rating': log[8],
+        'review': log[9],
+        'photos': photos,
+        'source_url': log[11],
+        'created_at': log[12]
+    }
 
 def create_thumbnail(image_path, thumbnail_path, size=(300, 400)):
     """이미지 썸네일 생성"""
@@ -81,18 +170,43 @@ def create_thumbnail(image_path, thumbnail_path, size=(300, 400)):
         print(f"썸네일 생성 실패: {e}")
         return False
 
-def scrape_async(task_id, url):
-    """비동기 스크래핑"""
-    global scraping_results, scraping_status
-    
-    try:
-        scraping_status[task_id] = "진행중"
-        result = scraper.scrape_concert_info(url)
-        scraping_results[task_id] = result
-        scraping_status[task_id] = "완료"
-    except Exception as e:
-        scraping_results[task_id] = None
-        scraping_status[task_id] = f"오류: {str(e)}"
+def run_scrape(url):
+    """실행기 워커에서 URL 하나 스크래핑 (같은 URL 요청이 여럿이어도 한 번)"""
+    return observe_scrape(scraper.scrape_concert_info, url)
+
+def task_listener(task_id):
+    """실행기 알림 → 작업 상태/결과 저장 (공유 저장소에)"""
+    def listener(event, payload):
+        if event == 'started':
+            scrape_tasks.set_stage(task_id, STAGE_FETCHING)
+        elif event == 'stage':
+            scrape_tasks.set_stage(task_id, payload)
+        elif event == 'done' and payload is not None:
+            scrape_tasks.finish(task_id, payload)
+        else:
+            scrape_tasks.fail(task_id, payload or '페이지 로딩 실패')
+    return listener
+
+scrape_executor = ScrapeExecutor(run_scrape)
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def observe_request(response):
+    """라우트별 지연 시간/상태 코드 집계 (스트리밍 응답은 응답 객체를 돌려줄 때까지)"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_LATENCY.observe(time.perf_counter() - started, method=request.method, route=route)
+        REQUESTS.inc(method=request.method, route=route, status=response.status_code)
+    return response
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus 텍스트 형식 메트릭"""
+    return Response(REGISTRY.render(), content_type=CONTENT_TYPE)
 
 @app.route('/')
 def index():
@@ -108,23 +222,129 @@ def scrape_performance():
     if not url:
         return jsonify({'error': 'URL이 필요합니다.'}), 400
     
-    task_id = f"task_{int(time.time() * 1000)}"
-    thread = threading.Thread(target=scrape_async, args=(task_id, url))
-    thread.daemon = True
-    thread.start()
+    task_id = new_task_id()
+
+    # 최근에 스크래핑한 URL이면 저장된 결과로 바로 완료
+    cached = scrape_tasks.recent_result(url)
+    if cached is not None:
+        scrape_tasks.create(task_id, url, STATUS_DONE, cached)
+        return jsonify({'task_id': task_id, 'status': STATUS_DONE, 'result': cached, 'cached': True})
+
+    try:
+        # 워커 프로세스가 살아 있으면 작업 큐에 넣기만 함 (없으면 이 프로세스에서)
+        if SCRAPE_MODE == 'worker' and scrape_tasks.live_workers():
+            if scrape_tasks.pending_jobs() >= SCRAPE_JOB_QUEUE_MAX:
+                raise ScrapeQueueFull(SCRAPE_RETRY_AFTER)
+            scrape_tasks.create(task_id, url, job=True)
+        else:
+            scrape_tasks.create(task_id, url)
+            scrape_executor.submit(url, task_listener(task_id))
+    except ScrapeQueueFull as e:
+        scrape_tasks.fail(task_id, str(e))
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
     
     return jsonify({'task_id': task_id})
 
+@app.route('/api/scrape-batch', methods=['POST'])
+def scrape_batch():
+    """여러 공연 정보 동시 스크래핑 (NDJSON 스트리밍, URL마다 한 줄)"""
+    data = request.get_json() or {}
+    urls = data.get('urls') or []
+
+    if not isinstance(urls, list) or not urls:
+        return jsonify({'error': 'URL 목록이 필요합니다.'}), 400
+
+    if len(urls) > MAX_BATCH_URLS:
+        return jsonify({'error': f'한 번에 최대 {MAX_BATCH_URLS}개까지 가능합니다.'}), 400
+
+    invalid = [url for url in urls if not isinstance(url, str) or not url.startswith('http')]
+    if invalid:
+        return jsonify({'error': '올바르지 않은 URL이 있습니다.', 'invalid': invalid}), 400
+
+    def generate():
+        succeeded = failed = 0
+        SCRAPES_IN_FLIGHT.inc(len(urls))
+        try:
+            for item in scraper.scrape_many(urls):
+                if item['success']:
+                    succeeded += 1
+                else:
+                    failed += 1
+                SCRAPES_IN_FLIGHT.dec()
+                record_scrape(item['url'], item['success'])
+                yield json.dumps(item, ensure_ascii=False) + '\n'
+        finally:
+            # 클라이언트가 중간에 끊어도 진행 중 수를 되돌림
+            SCRAPES_IN_FLIGHT.dec(len(urls) - succeeded - failed)
+        yield json.dumps({'done': True, 'succeeded': succeeded, 'failed': failed}, ensure_ascii=False) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/scrape-status/<task_id>')
 def scrape_status(task_id):
-    """스크래핑 상태 확인"""
-    status = scraping_status.get(task_id, "알 수 없음")
+    """스크래핑 상태 확인 (어느 워커에서든)
+
+    ?wait=초&stage=마지막으로 본 단계 → 단계가 바뀔 때까지 최대 wait초 기다렸다가 응답 (롱폴링, SSE 대신)
+    """
+    try:
+        wait = min(float(request.args.get('wait', 0)), SCRAPE_LONG_POLL_MAX)
+    except ValueError:
+        wait = 0
+    if wait > 0:
+        task = scrape_tasks.wait(task_id, request.args.get('stage') or None, wait)
+    else:
+        task = scrape_tasks.get(task_id)
     
-    if status == "완료":
-        result = scraping_results.get(task_id)
-        return jsonify({'status': status, 'result': result})
+    if task['status'] == STATUS_DONE:
+        return jsonify(task)
     else:
-        return jsonify({'status': status})
+        return jsonify({'status': task['status'], 'stage': task['stage']})
+
+@app.route('/api/scrape-events/<task_id>')
+def scrape_events(task_id):
+    """스크래핑 진행 상황 Server-Sent Events (단계가 바뀔 때마다 한 번, 끝나면 결과와 함께 닫음)"""
+    def generate():
+        seen_stage = None
+        deadline = time.monotonic() + SCRAPE_EVENTS_TIMEOUT
+        yield 'retry: 2000\n\n'
+        while time.monotonic() < deadline:
+            task = scrape_tasks.wait(task_id, seen_stage, min(SSE_KEEPALIVE, deadline - time.monotonic()))
+            if task['stage'] == seen_stage and task['stage'] not in FINAL_STAGES:
+                # 프록시가 연결을 끊지 않게
+                yield ': keep-alive\n\n'
+                continue
+            seen_stage = task['stage']
+            yield f"data: {json.dumps(task, ensure_ascii=False)}\n\n"
+            if task['stage'] is None or task['stage'] in FINAL_STAGES:
+                return
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/api/scrape-timings')
+def scrape_timings_summary():
+    """최근 스크래핑의 단계별/호스트별 소요 시간 (느린 사이트/추출기 찾기용, 모든 gunicorn 워커와 scrape_worker.py 합계)"""
+    return jsonify(scrape_timings.summary())
+
+@app.route('/api/scrape-queue')
+def scrape_queue():
+    """스크래핑 실행기 대기/진행 중 작업 수 (이 워커 프로세스 기준) + 작업 큐 상태 (공유)"""
+    stats = scrape_executor.stats()
+    stats['mode'] = SCRAPE_MODE
+    stats['jobs_pending'] = scrape_tasks.pending_jobs()
+    stats['live_workers'] = scrape_tasks.live_workers()
+    return jsonify(stats)
+
+@app.route('/api/rescrape-changes')
+def rescrape_changes():
+    """재확인에서 발견한 공연 정보 변경 내역 (?url= 로 한 공연만)"""
+    try:
+        limit = min(int(request.args.get('limit', 50)), 500)
+        return jsonify({'success': True, 'changes': rescrape_scheduler.changes(request.args.get('url'), limit)})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/upload-photos', methods=['POST'])
 def upload_photos():
@@ -145,10 +365,15 @@ def upload_photos():
                 
                 # 원본 저장
                 file.save(filepath)
+                UPLOADS.inc()
+                UPLOAD_BYTES.inc(os.path.getsize(filepath))
                 
                 # 썸네일 생성
                 thumbnail_path = os.path.join(THUMBNAILS_FOLDER, filename)
-                create_thumbnail(filepath, thumbnail_path)
+                with THUMBNAIL_DURATION.time():
+                    thumbnail_created = create_thumbnail(filepath, thumbnail_path)
+                if not thumbnail_created:
+                    THUMBNAIL_FAILURES.inc()
                 
                 uploaded_files.append({
                     'filename': filename,
@@ -167,77 +392,92 @@ def upload_photos():
 def get_logs():
     """문화생활 기록 목록 조회"""
     try:
-        conn = sqlite3.connect(DATABASE)
+        query_started = time.perf_counter()
+        conn = db.get()
         cursor = conn.cursor()
         
-        # 페이지네이션
+        # 페이지네이션 (after 토큰이 있으면 page 대신 그 다음부터)
         page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 10))
-        offset = (page - 1) * per_page
+        after = request.args.get('after')
+        offset = 0 if after else (page - 1) * per_page
+        # 전체 개수: after로 이어 읽을 때는 기본으로 세지 않음
+        count_mode = request.args.get('count', 'none' if after else 'exact')
+        if count_mode not in COUNT_MODES:
+            return jsonify({'error': f"count는 {', '.join(COUNT_MODES)} 중 하나여야 합니다"}), 400
         
         # 필터
         category = request.args.get('category')
         search = request.args.get('search')
         
-        query = "SELECT * FROM culture_logs"
+        source = "culture_logs l"
         params = []
-        
         conditions = []
+        rank = snippet = None
+        if search:
+            # 전문 검색 (세 글자 이상 단어는 FTS5 MATCH, 짧은 단어는 LIKE)
+            source, conditions, params, rank, snippet = search_clause(conn, search)
+
         if category:
-            conditions.append("category = ?")
+            conditions.append("l.category = ?")
             params.append(category)
-        
-        if search:
-            conditions.append("(title LIKE ? OR venue LIKE ? OR performers LIKE ?)")
-            params.extend([f"%{search}%", f"%{search}%", f"%{search}%"])
-        
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-        
-        query += " ORDER BY date DESC, created_at DESC LIMIT ? OFFSET ?"
-        params.extend([per_page, offset])
-        
-        cursor.execute(query, params)
+
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+
+        page_conditions = list(conditions)
+        page_params = list(params)
+        if after:
+            try:
+                values = decode_cursor(after, cursor_size(rank))
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            page_conditions.append(keyset_condition(rank))
+            page_params.extend(keyset_params(values, rank))
+
+        query = f"SELECT l.*, {snippet or 'NULL'}, {rank or 'NULL'} FROM {source}"
+        if page_conditions:
+            query += " WHERE " + " AND ".join(page_conditions)
+        # 검색 결과는 관련도순, 같으면 최신순
+        query += f" ORDER BY {rank}, {LOG_ORDER_BY}" if rank else f" ORDER BY {LOG_ORDER_BY}"
+        # 다음 페이지가 있는지 보려고 하나 더
+        query += " LIMIT ? OFFSET ?"
+
+        cursor.execute(query, page_params + [per_page + 1, offset])
         logs = cursor.fetchall()
-        
-        # 전체 개수 조회
-        count_query = "SELECT COUNT(*) FROM culture_logs"
-        if conditions:
-            count_query += " WHERE " + " AND ".join(conditions[:-2] if search else conditions)
-            cursor.execute(count_query, params[:-2])
+        has_more = len(logs) > per_page
+        logs = logs[:per_page]
+        next_after = None
+        if has_more:
+            last = logs[-1]
+            next_after = encode_cursor(([last[15]] if rank else []) + [last[3], last[12], last[0]])
+
+        # 전체 개수 조회 (같은 조건)
+        def count_logs():
+            return cursor.execute(f"SELECT COUNT(*) FROM {source}{where}", params).fetchone()[0]
+
+        if count_mode == 'exact':
+            total = count_logs()
+        elif count_mode == 'approx':
+            total = log_counts.get((category, search), count_logs)
         else:
-            cursor.execute(count_query)
-        
-        total = cursor.fetchone()[0]
+            total = None
+        DB_QUERY_DURATION.observe(time.perf_counter() - query_started, query='get_logs')
         
         # 결과 포맷팅
         result = []
         for log in logs:
-            photos = json.loads(log[10]) if log[10] else []
-            result.append({
-                'id': log[0],
-                'title': log[1],
-                'category': log[2],
-                'date': log[3],
-                'venue': log[4],
-                'performers': log[5],
-                'program': log[6],
-                'price': log[7],
-                'rating': log[8],
-                'review': log[9],
-                'photos': photos,
-                'source_url': log[11],
-                'created_at': log[12]
-            })
-        
-        conn.close()
+            item = format_log(log)
+            item['snippet'] = render_snippet(log[14])
+            result.append(item)
         
         return jsonify({
             'logs': result,
             'total': total,
-            'page': page,
+            'page': None if after else page,
             'per_page': per_page,
-            'pages': (total + per_page - 1) // per_page
+            'pages': None if total is None else (total + per_page - 1) // per_page,
+            'has_more': has_more,
+            'next_after': next_after
         })
         
     except Exception as e:
@@ -249,30 +489,28 @@ def create_log():
     try:
         data = request.get_json()
         
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO culture_logs 
-            (title, category, date, venue, performers, program, price, rating, review, photos, source_url)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data.get('title'),
-            data.get('category'),
-            data.get('date'),
-            data.get('venue'),
-            json.dumps(data.get('performers', []), ensure_ascii=False),
-            json.dumps(data.get('program', []), ensure_ascii=False),
-            json.dumps(data.get('price', []), ensure_ascii=False),
-            data.get('rating'),
-            data.get('review'),
-            json.dumps(data.get('photos', []), ensure_ascii=False),
-            data.get('source_url')
-        ))
-        
-        log_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with db.connection() as conn:
+            cursor = conn.execute('''
+                INSERT INTO culture_logs 
+                (title, category, date, venue, performers, program, price, rating, review, photos, source_url)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                data.get('title'),
+                data.get('category'),
+                data.get('date'),
+                data.get('venue'),
+                json.dumps(data.get('performers', []), ensure_ascii=False),
+                json.dumps(data.get('program', []), ensure_ascii=False),
+                json.dumps(data.get('price', []), ensure_ascii=False),
+                data.get('rating'),
+                data.get('review'),
+                json.dumps(data.get('photos', []), ensure_ascii=False),
+                data.get('source_url')
+            ))
+            log_id = cursor.lastrowid
+            # 출연진/프로그램/가격 하위 테이블
+            save_log_details(conn, log_id, data.get('performers'), data.get('program'), data.get('price'))
+        log_counts.clear()
         
         return jsonify({'success': True, 'id': log_id})
         
@@ -283,8 +521,8 @@ def create_log():
 def get_stats():
     """통계 데이터"""
     try:
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
+        query_started = time.perf_counter()
+        cursor = db.get().cursor()
         
         # 기본 통계
         cursor.execute("SELECT COUNT(*) FROM culture_logs")
@@ -322,14 +560,28 @@ def get_stats():
         """)
         rating_distribution = dict(cursor.fetchall())
         
-        conn.close()
+        # 공연장별 티켓 가격 (log_prices)
+        cursor.execute("""
+            SELECT l.venue, COUNT(*), AVG(p.amount), MIN(p.amount), MAX(p.amount)
+            FROM log_prices p JOIN culture_logs l ON l.id = p.log_id
+            WHERE l.venue IS NOT NULL AND l.venue != ''
+            GROUP BY l.venue
+            ORDER BY AVG(p.amount) DESC
+        """)
+        venue_prices = {
+            venue: {'count': count, 'average': round(average), 'min': low, 'max': high}
+            for venue, count, average, low, high in cursor.fetchall()
+        }
+        
+        DB_QUERY_DURATION.observe(time.perf_counter() - query_started, query='get_stats')
         
         return jsonify({
             'total_logs': total_logs,
             'avg_rating': round(avg_rating, 1),
             'category_stats': category_stats,
             'monthly_stats': monthly_stats,
-            'rating_distribution': rating_distribution
+            'rating_distribution': rating_distribution,
+            'venue_prices': venue_prices
         })
         
     except Exception as e:
@@ -349,12 +601,10 @@ def thumbnail_file(filename):
 def delete_log(log_id):
     """문화생활 기록 삭제"""
     try:
-        conn = sqlite3.connect(DATABASE)
-        cursor = conn.cursor()
+        conn = db.get()
 
         # 먼저 사진 파일들 삭제
-        cursor.execute("SELECT photos FROM culture_logs WHERE id = ?", (log_id,))
-        result = cursor.fetchone()
+        result = conn.execute("SELECT photos FROM culture_logs WHERE id = ?", (log_id,)).fetchone()
 
         if result and result[0]:
             photos = json.loads(result[0])
@@ -368,15 +618,63 @@ def delete_log(log_id):
                         pass
 
         # 레코드 삭제
-        cursor.execute("DELETE FROM culture_logs WHERE id = ?", (log_id,))
-        conn.commit()
-        conn.close()
+        with db.connection() as conn:
+            conn.execute("DELETE FROM culture_logs WHERE id = ?", (log_id,))
+        log_counts.clear()
 
         return jsonify({'success': True})
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def logs_by_detail(table, column, value, extra):
+    """하위 테이블 인덱스(column, log_id)로 찾은 기록 목록, extra는 기록마다 모을 열"""
+    query_started = time.perf_counter()
+    query = f'''
+        SELECT l.*, group_concat(d.{extra}, char(10))
+        FROM {table} d JOIN culture_logs l ON l.id = d.log_id
+        WHERE d.{column} = ?
+    '''
+    params = [value]
+    category = request.args.get('category')
+    if category:
+        query += " AND l.category = ?"
+        params.append(category)
+    query += f" GROUP BY l.id ORDER BY {LOG_ORDER_BY}"
+    rows = db.get().execute(query, params).fetchall()
+    DB_QUERY_DURATION.observe(time.perf_counter() - query_started, query=f'{table}_logs')
+    return rows
+
+@app.route('/api/performers/<name>/logs')
+def get_performer_logs(name):
+    """출연자가 나온 기록 (역할 포함)"""
+    try:
+        name = normalize_name(name)
+        result = []
+        for log in logs_by_detail('log_performers', 'name', name, 'role'):
+            item = format_log(log)
+            item['roles'] = log[14].split('\n') if log[14] else []
+            result.append(item)
+        return jsonify({'name': name, 'logs': result, 'total': len(result)})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/composers/<name>/logs')
+def get_composer_logs(name):
+    """작곡가의 곡을 들은 기록 (Brahms/브람스 같은 표기는 하나로, 대표 이름이 없는 작곡가는 키워드 표기로)"""
+    try:
+        composer = canonical_composer(name) or name.strip()
+        result = []
+        for log in logs_by_detail('log_works', 'composer', composer, 'title'):
+            item = format_log(log)
+            item['works'] = log[14].split('\n') if log[14] else []
+            result.append(item)
+        return jsonify({'composer': composer, 'logs': result, 'total': len(result)})
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/reset-database', methods=['POST'])
 def reset_database():
     """데이터베이스 완전 초기화 (개발용)"""
@@ -392,9 +690,9 @@ def reset_database():
         os.makedirs(UPLOAD_FOLDER, exist_ok=True)
         os.makedirs(THUMBNAILS_FOLDER, exist_ok=True)
 
-        # 데이터베이스 삭제 및 재생성
-        if os.path.exists(DATABASE):
-            os.remove(DATABASE)
+        # 데이터베이스 삭제 및 재생성 (열린 연결은 풀이 버림)
+        db.remove_database()
+        log_counts.clear()
 
         init_db()
 
@@ -403,10 +701,13 @@ def reset_database():
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# 테이블/인덱스/검색 색인 준비 (gunicorn 워커도, 모두 IF NOT EXISTS라 여러 번 불러도 됨)
+init_db()
+
 if __name__ == '__main__':
-    init_db()
     # 프로덕션에서는 debug=False로 설정
     import os
     debug_mode = os.environ.get('FLASK_ENV') != 'production'
     port = int(os.environ.get('PORT', 5002))
+    start_rescrape_scheduler()
     app.run(debug=debug_mode, host='0.0.0.0', port=port)
\ No newline at end of file
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+🗃️ culture_log.db 연결 풀
+요청마다 sqlite3.connect/close 하는 대신 스레드마다 연결 하나를 열어 두고 다시 씁니다.
+- WAL 저널: 쓰는 동안에도 읽기가 막히지 않음 (gthread 워커 스레드/여러 워커 프로세스)
+- synchronous=NORMAL (WAL에서는 전원이 나가도 DB가 깨지지 않고, 마지막 커밋 몇 개만 잃을 수 있음)
+- cache_size / mmap_size / temp_store=MEMORY, busy_timeout
+- 연결을 계속 쓰므로 sqlite3의 문장 캐시(cached_statements)가 요청 사이에도 유지되어 같은 쿼리를 다시 컴파일하지 않음
+
+with pool.connection() as conn: 블록이 정상으로 끝나면 커밋, 예외면 롤백합니다.
+포크된 프로세스(gunicorn --preload)나 reset() 뒤에는 연결을 새로 엽니다.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# 연결마다 적용할 PRAGMA (journal_mode=WAL은 파일에 남으므로 한 번이면 되지만 새 파일을 위해 매번)
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -8000,  # 음수 = KiB 단위 (8MB)
+    'mmap_size': 64 * 1024 * 1024,
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000,
+    'foreign_keys': 'ON',
+}
+# 연결마다 캐시할 준비된 문장 수
+STATEMENT_CACHE_SIZE = 256
+
+
+class ConnectionPool:
+    def __init__(self, path, pragmas=None):
+        self.path = path
+        self.pragmas = DEFAULT_PRAGMAS if pragmas is None else pragmas
+        self._local = threading.local()
+        # reset()마다 증가, 다른 세대의 연결은 버리고 새로 엶
+        self._generation = 0
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, timeout=30, cached_statements=STATEMENT_CACHE_SIZE)
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def get(self):
+        """이 스레드의 연결 (없거나 오래된 세대/다른 프로세스 것이면 새로)"""
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is None or local.generation != self._generation or local.pid != os.getpid():
+            if conn is not None and local.pid == os.getpid():
+                conn.close()
+            local.conn = self._open()
+            local.generation = self._generation
+            local.pid = os.getpid()
+        return local.conn
+
+    @contextmanager
+    def connection(self):
+        """with pool.connection() as conn: ... (정상 종료면 커밋, 예외면 롤백)"""
+        conn = self.get()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+
+    def reset(self):
+        """열린 연결 버리기 (DB 파일을 지우고 다시 만들 때): 이 스레드 연결은 바로, 다른 스레드는 다음 사용 때 닫고 새로 엶"""
+        self._generation += 1
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            conn.close()
+        self._local.conn = None
+
+    def remove_database(self):
+        """연결을 닫고 DB 파일과 WAL/공유 메모리 파일 삭제"""
+        self.reset()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
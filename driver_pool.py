@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+🚗 Selenium WebDriver 풀
+미리 띄워 둔 헤드리스 Chrome 여러 개를 빌려 쓰고(checkout) 돌려주는(checkin) 스레드 안전한 풀입니다.
+- 풀 크기만큼만 브라우저를 띄우고, 모두 사용 중이면 반납될 때까지 기다림
+- 빌려줄 때 살아 있는지 확인하고, 죽었으면 새로 띄움
+- N페이지를 연 드라이버나 사용 중 죽은 드라이버는 버리고 백그라운드에서 새로 띄움 (메모리 누수 방지)
+- chromedriver 경로는 프로세스당 한 번만 확인 (CHROMEDRIVER_PATH 환경변수로 지정 가능)
+- 이미지/미디어/폰트/외부 트래커 요청은 브라우저 단계에서 막고, DOMContentLoaded까지만 기다림 (eager)
+덕분에 렌더링이 필요한 페이지도 브라우저 부팅 없이 페이지 이동 한 번이면 됩니다.
+"""
+
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+DEFAULT_POOL_SIZE = int(os.environ.get('DRIVER_POOL_SIZE', '2'))
+# 드라이버 하나로 열 최대 페이지 수 (넘으면 새 브라우저로 교체)
+DEFAULT_MAX_PAGES = int(os.environ.get('DRIVER_MAX_PAGES', '50'))
+# 빈 드라이버를 기다리는 최대 시간 (초)
+DEFAULT_CHECKOUT_TIMEOUT = 60
+PAGE_LOAD_TIMEOUT = 30
+
+# 렌더링에 필요 없는 요청 (Chrome DevTools Network.setBlockedURLs 패턴)
+# 이미지/미디어/폰트 확장자
+BLOCKED_EXTENSIONS = [
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico',
+    'mp4', 'webm', 'mp3', 'm4a',
+    'woff', 'woff2', 'ttf', 'otf', 'eot',
+]
+BLOCKED_URL_PATTERNS = [
+    # CDP 와일드카드는 URL 전체와 맞춰 보므로 버전 쿼리가 붙은 주소(/img/a.png?v=3)도 따로 막음
+    pattern for ext in BLOCKED_EXTENSIONS for pattern in (f'*.{ext}', f'*.{ext}?*')
+] + [
+    # 외부 트래커/광고
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*googlesyndication.com*', '*facebook.net*', '*connect.facebook.com*',
+    '*wcs.naver.net*', '*analytics.naver.com*', '*criteo.com*', '*hotjar.com*',
+]
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def driver_path():
+    """chromedriver 경로 (ChromeDriverManager 확인은 프로세스당 한 번)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = os.environ.get('CHROMEDRIVER_PATH')
+            if not _driver_path:
+                _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def create_chrome_driver():
+    """헤드리스 Chrome 드라이버 생성"""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # 헤드리스 모드
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    # DOMContentLoaded에서 driver.get 반환 (나머지는 준비 조건으로 기다림)
+    chrome_options.page_load_strategy = 'eager'
+    # 이미지/알림 끄기 (요청 차단과 별개로 렌더러도 이미지를 디코딩하지 않게 함)
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+
+    driver = webdriver.Chrome(service=Service(driver_path()), options=chrome_options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class network_idle:
+    """WebDriverWait 조건: 문서 로딩이 끝나고 idle_time 동안 새 리소스 요청이 없으면 True
+
+    (expected_conditions처럼 driver를 받는 호출 가능한 객체)
+    """
+
+    SCRIPT = "return [document.readyState, performance.getEntriesByType('resource').length]"
+
+    def __init__(self, idle_time=0.5):
+        self.idle_time = idle_time
+        self.last_count = None
+        self.since = None
+
+    def __call__(self, driver):
+        ready_state, count = driver.execute_script(self.SCRIPT)
+        now = time.monotonic()
+        if ready_state == 'loading' or count != self.last_count:
+            self.last_count = count
+            self.since = now
+            return False
+        return now - self.since >= self.idle_time
+
+
+class PooledDriver:
+    """풀에 든 드라이버 + 사용 기록"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.time()
+
+
+class DriverPool:
+    """크기가 정해진 헤드리스 드라이버 풀 (factory로 드라이버 생성 함수를 바꿀 수 있음)"""
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, max_pages=DEFAULT_MAX_PAGES, factory=create_chrome_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self.factory = factory
+        # 최근에 반납된 드라이버부터 빌려줌 (LIFO: 자주 쓰는 브라우저가 계속 따뜻하게 유지됨)
+        self._idle = queue.LifoQueue()
+        # 풀 크기 제한: 사용 중 + 대기 중 + 띄우는 중인 드라이버 수
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'launched': 0, 'recycled': 0, 'crashed': 0, 'checkouts': 0}
+
+    def _launch(self):
+        """새 드라이버 띄우기"""
+        entry = PooledDriver(self.factory())
+        with self._lock:
+            self.stats['launched'] += 1
+        return entry
+
+    def _quit(self, entry):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+
+    def _is_alive(self, entry):
+        """헬스 체크: 브라우저가 응답하는지"""
+        try:
+            entry.driver.execute_script('return 1')
+            return True
+        except Exception:
+            return False
+
+    def _replace_in_background(self):
+        """슬롯 하나를 차지한 채로 새 드라이버를 띄워 대기열에 넣음"""
+        def launch():
+            try:
+                if not self._closed:
+                    entry = self._launch()
+                    if not self._closed:
+                        self._idle.put(entry)
+                        return
+                    self._quit(entry)
+            except Exception as e:
+                print(f"드라이버 교체 실패: {str(e)}")
+            self._slots.release()
+
+        threading.Thread(target=launch, daemon=True).start()
+
+    def prewarm(self, count=None, background=False):
+        """드라이버를 미리 띄워 둠 (서버 시작 시 호출)"""
+        count = min(count or self.size, self.size)
+
+        def warm():
+            for _ in range(count):
+                if not self._slots.acquire(blocking=False):
+                    break
+                try:
+                    self._idle.put(self._launch())
+                except Exception as e:
+                    self._slots.release()
+                    print(f"드라이버 예열 실패: {str(e)}")
+                    break
+
+        if background:
+            threading.Thread(target=warm, daemon=True).start()
+        else:
+            warm()
+
+    def checkout(self, timeout=DEFAULT_CHECKOUT_TIMEOUT):
+        """드라이버 빌리기 (대기 중인 것 → 새로 띄우기 → 반납 기다리기 순)"""
+        if self._closed:
+            raise RuntimeError('드라이버 풀이 닫혔습니다')
+
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                entry = None
+
+            if entry is None and self._slots.acquire(blocking=False):
+                try:
+                    entry = self._launch()
+                except Exception:
+                    self._slots.release()
+                    raise
+
+            if entry is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError('사용 가능한 드라이버가 없습니다')
+                try:
+                    entry = self._idle.get(timeout=min(remaining, 1.0))
+                except queue.Empty:
+                    continue
+
+            if self._is_alive(entry):
+                with self._lock:
+                    self.stats['checkouts'] += 1
+                return entry
+
+            # 죽은 드라이버: 버리고 같은 슬롯으로 새로 띄움
+            with self._lock:
+                self.stats['crashed'] += 1
+            self._quit(entry)
+            try:
+                entry = self._launch()
+            except Exception:
+                self._slots.release()
+                raise
+            with self._lock:
+                self.stats['checkouts'] += 1
+            return entry
+
+    def checkin(self, entry, failed=False):
+        """드라이버 반납 (N페이지를 넘겼거나 죽었으면 교체)"""
+        entry.pages += 1
+
+        if self._closed:
+            self._quit(entry)
+            self._slots.release()
+            return
+
+        if failed and not self._is_alive(entry):
+            with self._lock:
+                self.stats['crashed'] += 1
+            self._quit(entry)
+            self._replace_in_background()
+        elif entry.pages >= self.max_pages:
+            with self._lock:
+                self.stats['recycled'] += 1
+            self._quit(entry)
+            self._replace_in_background()
+        else:
+            self._idle.put(entry)
+
+    @contextmanager
+    def driver(self, timeout=DEFAULT_CHECKOUT_TIMEOUT):
+        """with pool.driver() as driver: ... (블록이 끝나면 자동 반납)
+
+        KeyboardInterrupt나 버려진 제너레이터의 GeneratorExit으로 끝나도 반납합니다
+        (실패로 반납해서 죽었으면 버림). 반납하지 않으면 슬롯이 영영 비지 않아 풀이 막힙니다.
+        """
+        entry = self.checkout(timeout)
+        failed = True
+        try:
+            yield entry.driver
+            failed = False
+        finally:
+            self.checkin(entry, failed=failed)
+
+    def close(self):
+        """대기 중인 드라이버 모두 종료 (사용 중인 것은 반납될 때 종료)"""
+        self._closed = True
+        while True:
+            try:
+                entry = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._quit(entry)
+            self._slots.release()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+🔎 공연 정보 추출 엔진
+스크래퍼의 정규식은 모두 import 시점에 한 번만 컴파일합니다.
+본문은 TextScanner로 한 번만 스캔해서 후보 위치(날짜/공연장/출연진/프로그램/가격 키워드)를 모으고,
+각 extract_* 는 그 후보 위치에서만, 제한된 창(window) 안에서 패턴을 맞춰 봅니다.
+공연장/작곡가/역할 키워드는 keywords.json 사전으로 만든 Aho-Corasick 자동자 하나로 찾으므로
+사전이 커져도 훑는 비용이 늘지 않습니다.
+덕분에 추출기마다 본문 전체를 다시 훑지 않고, 큰 페이지에서도 패턴이 제곱 시간으로 늘어나지 않습니다.
+"""
+
+import os
+import re
+import json
+
+from keyword_matcher import KeywordMatcher
+
+# 공연장/작곡가/역할 키워드 사전
+KEYWORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'keywords.json')
+# '<' 앞쪽으로 제목 후보를 찾는 최대 길이
+TITLE_LOOKBACK = 200
+# 후보 하나에서 패턴이 읽을 수 있는 최대 길이 ([^\n]* 같은 열린 패턴용)
+MATCH_WINDOW = 1000
+# 빈 줄이 아닌 한 줄
+LINE_PATTERN = re.compile(r'[^\n]+')
+
+
+class TextIndex:
+    """본문 훑기의 결과: 종류별 (위치, 키워드) 목록"""
+
+    def __init__(self, text, hits):
+        self.text = text
+        self.hits = hits
+        # 키워드별 위치 (사전이 커도 키워드 하나 조회는 상수 시간)
+        self.by_literal = {}
+        for kind, kind_hits in hits.items():
+            for pos, found in kind_hits:
+                self.by_literal.setdefault((kind, found), []).append(pos)
+
+    def positions(self, kind, literal=None):
+        """후보 위치 목록 (오름차순), literal을 주면 그 키워드로 시작하는 위치만"""
+        if literal is None:
+            return [pos for pos, _ in self.hits.get(kind, [])]
+        return self.by_literal.get((kind, literal), [])
+
+    def found(self, kind, literal):
+        """키워드가 본문에 한 번이라도 있는지"""
+        return bool(self.positions(kind, literal))
+
+
+class TextScanner:
+    """추출기들이 쓸 후보 위치를 본문 스캔 한 번으로 모두 모으는 스캐너
+
+    patterns: {종류: 정규식} — 그 종류의 패턴이 시작할 수 있는 위치
+    keywords: {종류: 키워드 목록} — 대소문자 구분
+    ci_keywords: {종류: 키워드 목록} — 대소문자 무시 (기록되는 값은 목록에 있는 원래 키워드)
+
+    정규식 종류는 종류마다 하나씩 컴파일해 둡니다. 여러 종류를 거대한 교대(|) 하나로
+    합치면 re 모듈의 리터럴 접두사 최적화가 꺼져서 오히려 느려지기 때문입니다.
+    키워드 종류는 모두 Aho-Corasick 자동자 하나에 넣어 한 번에 찾습니다.
+    """
+
+    def __init__(self, patterns=None, keywords=None, ci_keywords=None):
+        self.patterns = {kind: re.compile(pattern) for kind, pattern in (patterns or {}).items()}
+        self.kinds = list(keywords or {}) + list(ci_keywords or {})
+        self.matcher = KeywordMatcher()
+        for kind, words in (keywords or {}).items():
+            for word in dict.fromkeys(words):
+                self.matcher.add(word, (kind, word))
+        for kind, words in (ci_keywords or {}).items():
+            # 소문자가 같은 키워드는 목록에서 먼저 나온 것으로 기록
+            for word in {word.lower(): word for word in reversed(words)}.values():
+                self.matcher.add(word, (kind, word), ignore_case=True)
+        self.matcher.build()
+
+    def scan(self, text):
+        """본문을 훑어 TextIndex 생성"""
+        hits = {}
+        for kind, regex in self.patterns.items():
+            hits[kind] = [(match.start(), match.group()) for match in regex.finditer(text)]
+
+        for kind in self.kinds:
+            hits[kind] = []
+        for pos, (kind, word) in self.matcher.iter_matches(text):
+            hits[kind].append((pos, word))
+        for kind in self.kinds:
+            # 자동자는 끝 위치 순서로 찾으므로 시작 위치 순서로 정렬
+            hits[kind].sort(key=lambda hit: hit[0])
+
+        return TextIndex(text, hits)
+
+
+def load_keywords(path=KEYWORDS_PATH):
+    """키워드 사전 로드: {'venues': [...], 'composers': [...], 'composer_names': {작곡가: [표기, ...]}, 'roles': {역할: [표기, ...]}}"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def role_patterns(roles, name_pattern, overrides=None):
+    """역할 사전 → [(패턴, 역할, 시작 키워드)] ("역할 | 이름" 형식)
+
+    표기 안의 공백은 있어도 없어도 되고 ('메조 소프라노' → 메조소프라노도 매칭),
+    시작 키워드는 표기의 첫 단어입니다. overrides로 역할별 이름 패턴을 바꿀 수 있습니다.
+    다른 표기의 끝부분인 표기는 그 표기 안에서 매칭하지 않습니다 ('메조 소프라노 | 김정미'는 소프라노가 아님).
+    """
+    overrides = overrides or {}
+    all_forms = [form for forms in roles.values() for form in forms]
+    patterns = []
+    for role, forms in roles.items():
+        for form in forms:
+            words = form.split()
+            prefix = r'\s*'.join(re.escape(word) for word in words)
+            shadows = ''.join(
+                rf'(?<!{re.escape(head)})(?<!{re.escape(head)} )'
+                for head in (other[:-len(form)].strip() for other in all_forms if other != form and other.endswith(form))
+            )
+            pattern = re.compile(rf'{shadows}{prefix}\s*[|│]\s*{overrides.get(role, name_pattern)}')
+            patterns.append((pattern, role, words[0]))
+    return patterns
+
+
+def finditer_at(pattern, text, positions, window=MATCH_WINDOW):
+    """후보 위치에서만 매칭한 pattern.finditer 결과 (서로 겹치지 않는 매치 목록)
+
+    positions가 pattern이 시작할 수 있는 모든 위치를 포함하면 finditer와 같은 결과입니다.
+    매치 길이는 window로 제한됩니다.
+    """
+    matches = []
+    end = 0
+    for pos in positions:
+        if pos < end:
+            continue
+        match = pattern.match(text, pos, pos + window)
+        if match:
+            matches.append(match)
+            end = max(match.end(), pos + 1)
+    return matches
+
+
+def search_at(pattern, text, positions, window=MATCH_WINDOW):
+    """후보 위치에서만 매칭한 pattern.search 결과 (가장 앞의 매치)"""
+    for pos in positions:
+        match = pattern.match(text, pos, pos + window)
+        if match:
+            return match
+    return None
+
+
+def search_before(pattern, text, anchors, stop_class, lookback=TITLE_LOOKBACK, window=MATCH_WINDOW):
+    """'<' 같은 앵커 앞에 글자 구간이 붙는 패턴의 pattern.search 결과
+
+    pattern은 "(stop_class에 없는 글자들)+ 앵커 ..." 꼴이어야 합니다.
+    앵커마다 바로 앞의 stop 글자(최대 lookback 글자 전)부터 한 번만 매칭하므로,
+    앵커가 없는 긴 본문을 매 위치에서 끝까지 훑는 일이 없습니다.
+    """
+    for anchor in anchors:
+        start = max(0, anchor - lookback)
+        for stop in stop_class.finditer(text, start, anchor):
+            start = stop.end()
+        match = pattern.match(text, start, anchor + window)
+        if match:
+            return match
+    return None
+
+
+def line_before(text, positions):
+    """줄 맨 앞에 있는 첫 후보 위치의 바로 윗줄 match (없으면 None)
+
+    검색 결과/목록 페이지처럼 "제목" 다음 줄에 "날짜"가 오는 본문에서 제목을 찾을 때 씁니다.
+    """
+    for pos in positions:
+        if pos > 0 and text[pos - 1] == '\n':
+            return LINE_PATTERN.match(text, text.rfind('\n', 0, pos - 1) + 1, pos - 1)
+    return None
+
+
+def run_start(text, pos, chars):
+    """pos에서 왼쪽으로 chars에 속한 글자가 이어지는 구간의 시작 위치"""
+    while pos > 0 and text[pos - 1] in chars:
+        pos -= 1
+    return pos
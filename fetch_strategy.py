@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+🧭 호스트별 페이지 가져오기 전략 기억
+사이트마다 어떤 방법으로 받아야 쓸 만한 공연 정보가 나오는지 배워서 SQLite 파일에 저장합니다.
+- static: requests로 받은 HTML이면 충분
+- rendered: 200이어도 빈 JS 껍데기라 브라우저 렌더링이 필요
+- api: 정적 HTML + 사이트가 데이터를 불러오는 JSON API 응답을 함께 사용
+
+처음 보는 호스트는 static → (어댑터에 API가 있으면) api → rendered 순으로 시도해서
+쓸 만한 필드가 나온 전략을 기억하고, 다음부터는 바로 그 방법으로 가져옵니다.
+기억한 전략이 RELEARN_AFTER번 연속 실패하면 잊고 다시 알아봅니다.
+
+설정 파일(fetch_strategies.json, FETCH_STRATEGY_CONFIG 환경변수로 경로 지정)에 적은 호스트는
+학습 결과보다 우선하고 학습으로 바뀌지 않습니다.
+  {"hosts": {"example.com": {"strategy": "rendered"},
+             "api.example.com": {"strategy": "api", "api_url": "https://api.example.com/shows/{id}"}}}
+
+현재 표 보기: python fetch_strategy.py [--forget 호스트]
+"""
+
+import argparse
+import html
+import json
+import os
+import sqlite3
+import time
+from urllib.parse import urlparse, parse_qsl
+
+STATIC = 'static'
+RENDERED = 'rendered'
+API = 'api'
+STRATEGIES = (STATIC, RENDERED, API)
+
+DEFAULT_STRATEGY_PATH = 'fetch_strategy.db'
+DEFAULT_CONFIG_PATH = os.environ.get(
+    'FETCH_STRATEGY_CONFIG',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fetch_strategies.json'),
+)
+# 기억한 전략이 이만큼 연속으로 쓸 만한 결과를 못 내면 잊고 다시 알아봄
+RELEARN_AFTER = 3
+
+# 제목은 항상 뭔가 채워지므로 나머지 필드 중 MIN_USABLE_FIELDS개 이상이 있어야 "쓸 만한" 결과
+USABLE_FIELDS = ('date', 'venue', 'performers', 'program', 'price')
+MIN_USABLE_FIELDS = 2
+
+
+def is_usable(info):
+    """추출 결과에 쓸 만한 필드가 충분한지"""
+    if not info:
+        return False
+    return sum(1 for field in USABLE_FIELDS if info.get(field)) >= MIN_USABLE_FIELDS
+
+
+def load_overrides(path=DEFAULT_CONFIG_PATH):
+    """설정 파일의 호스트별 고정 전략 {호스트: {'strategy': ..., 'api_url': ...}}"""
+    if not path or not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, encoding='utf-8') as f:
+            hosts = json.load(f).get('hosts', {})
+    except Exception as e:
+        print(f"가져오기 전략 설정 읽기 실패 ({path}): {str(e)}")
+        return {}
+
+    overrides = {}
+    for host, entry in hosts.items():
+        strategy = entry.get('strategy')
+        if strategy not in STRATEGIES:
+            print(f"⚠️ 알 수 없는 가져오기 전략 무시: {host} → {strategy}")
+            continue
+        if strategy == API and not entry.get('api_url'):
+            print(f"⚠️ api 전략에 api_url이 없어 무시: {host}")
+            continue
+        overrides[host.lower()] = {'strategy': strategy, 'api_url': entry.get('api_url')}
+    return overrides
+
+
+def api_url_for(template, url):
+    """API 주소 템플릿 채우기: {url}, {id}(경로 마지막 조각), 쿼리 파라미터 이름 (못 채우면 None)"""
+    parsed = urlparse(url)
+    params = dict(parse_qsl(parsed.query))
+    params['url'] = url
+    params['id'] = parsed.path.rstrip('/').rsplit('/', 1)[-1]
+    try:
+        return template.format(**params)
+    except (KeyError, IndexError, ValueError) as e:
+        print(f"API 주소 만들기 실패 ({template}): {str(e)}")
+        return None
+
+
+def json_to_html(data):
+    """JSON 응답의 문자열 값을 한 줄씩 <p>로 (페이지 본문과 같은 추출기로 훑을 수 있게)"""
+    lines = []
+
+    def walk(value):
+        if isinstance(value, dict):
+            for item in value.values():
+                walk(item)
+        elif isinstance(value, list):
+            for item in value:
+                walk(item)
+        elif isinstance(value, str) and value.strip():
+            lines.append(f'<p>{html.escape(value.strip())}</p>')
+
+    walk(data)
+    return '<div class="api-data">' + ''.join(lines) + '</div>'
+
+
+class FetchStrategyStore:
+    """학습한 호스트별 전략 (SQLite) + 설정 파일 고정값"""
+
+    def __init__(self, path=DEFAULT_STRATEGY_PATH, config_path=DEFAULT_CONFIG_PATH):
+        self.path = path
+        self.overrides = load_overrides(config_path)
+        self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _init_db(self):
+        """전략 테이블 생성"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS fetch_strategy (
+                host TEXT PRIMARY KEY,
+                strategy TEXT NOT NULL,
+                successes INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def lookup(self, host):
+        """호스트의 전략 {'strategy', 'api_url', 'source'} (모르면 None)"""
+        if host in self.overrides:
+            return dict(self.overrides[host], source='config')
+
+        conn = self._connect()
+        row = conn.execute('SELECT strategy FROM fetch_strategy WHERE host = ?', (host,)).fetchone()
+        conn.close()
+        if not row:
+            return None
+        return {'strategy': row[0], 'api_url': None, 'source': 'learned'}
+
+    def record(self, host, strategy, usable):
+        """전략을 써 본 결과 기록 (성공하면 기억, 기억한 전략이 연속으로 실패하면 잊음)"""
+        if not host or host in self.overrides:
+            return
+
+        now = time.time()
+        conn = self._connect()
+        if usable:
+            conn.execute('''
+                INSERT INTO fetch_strategy (host, strategy, successes, failures, updated_at)
+                VALUES (?, ?, 1, 0, ?)
+                ON CONFLICT(host) DO UPDATE SET
+                    successes = CASE WHEN strategy = excluded.strategy THEN successes + 1 ELSE 1 END,
+                    strategy = excluded.strategy,
+                    failures = 0,
+                    updated_at = excluded.updated_at
+            ''', (host, strategy, now))
+        else:
+            conn.execute('''
+                UPDATE fetch_strategy SET failures = failures + 1, updated_at = ?
+                WHERE host = ? AND strategy = ?
+            ''', (now, host, strategy))
+            conn.execute('DELETE FROM fetch_strategy WHERE host = ? AND failures >= ?', (host, RELEARN_AFTER))
+        conn.commit()
+        conn.close()
+
+    def forget(self, host):
+        """학습한 전략 지우기 (다음 스크래핑 때 다시 알아봄)"""
+        conn = self._connect()
+        conn.execute('DELETE FROM fetch_strategy WHERE host = ?', (host,))
+        conn.commit()
+        conn.close()
+
+    def table(self):
+        """전체 전략 표 (설정 고정값 + 학습 결과, 호스트 순)"""
+        conn = self._connect()
+        rows = conn.execute(
+            'SELECT host, strategy, successes, failures, updated_at FROM fetch_strategy'
+        ).fetchall()
+        conn.close()
+
+        table = {}
+        for host, strategy, successes, failures, updated_at in rows:
+            table[host] = {
+                'host': host, 'strategy': strategy, 'source': 'learned', 'api_url': None,
+                'successes': successes, 'failures': failures,
+                'updated_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(updated_at)),
+            }
+        for host, entry in self.overrides.items():
+            table[host] = {
+                'host': host, 'strategy': entry['strategy'], 'source': 'config', 'api_url': entry['api_url'],
+                'successes': None, 'failures': None, 'updated_at': None,
+            }
+        return [table[host] for host in sorted(table)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', default=DEFAULT_STRATEGY_PATH, help='학습 결과 SQLite 파일')
+    parser.add_argument('--forget', metavar='HOST', help='이 호스트의 학습 결과 지우기')
+    args = parser.parse_args()
+
+    store = FetchStrategyStore(args.db)
+    if args.forget:
+        store.forget(args.forget)
+        print(f"🗑️ {args.forget} 학습 결과를 지웠습니다")
+
+    rows = store.table()
+    if not rows:
+        print("아직 기억한 전략이 없습니다")
+        return
+    print(f"{'호스트':<30} {'전략':<9} {'출처':<8} {'성공':>5} {'실패':>5}")
+    for row in rows:
+        successes = '-' if row['successes'] is None else row['successes']
+        failures = '-' if row['failures'] is None else row['failures']
+        print(f"{row['host']:<30} {row['strategy']:<9} {row['source']:<8} {successes:>5} {failures:>5}")
+
+
+if __name__ == '__main__':
+    main()
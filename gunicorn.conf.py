@@ -0,0 +1,28 @@
+"""
+gunicorn 설정 (gunicorn이 작업 디렉토리의 이 파일을 자동으로 읽음)
+워커별 메트릭 스냅샷 디렉토리를 서버 시작 때 비우고, 끝난 워커의 Gauge 값을 빼기 위한 훅
+웹 워커에서 스크래핑하는 모드(SCRAPE_MODE=inline)면 앱을 불러온 뒤 워커마다 재확인 스케줄러를 시작
+스크래핑 진행 상황 스트림(SSE)/롱폴링이 요청 자리를 수십 초씩 잡으므로 워커마다 스레드를 여러 개 둠 (gthread)
+"""
+
+import os
+import sys
+
+import metrics
+
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+
+
+def on_starting(server):
+    metrics.reset_directory()
+
+
+def child_exit(server, worker):
+    metrics.mark_process_dead(worker.pid)
+
+
+def post_worker_init(worker):
+    # 워커가 앱을 불러온 뒤에 호출됨 (다른 앱을 띄운 경우는 건너뜀)
+    app_module = sys.modules.get('culture_log_app')
+    if app_module is not None:
+        app_module.start_rescrape_scheduler()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+🗄️ 스크래퍼용 HTTP 응답 캐시
+URL별로 본문, ETag, Last-Modified를 SQLite 파일에 저장합니다.
+TTL 안이면 요청 없이 캐시를 쓰고, 지나면 If-None-Match/If-Modified-Since로 재검증해서
+304면 캐시된 본문을 그대로 돌려줍니다. 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 지웁니다.
+"""
+
+import sqlite3
+import time
+
+DEFAULT_CACHE_PATH = 'http_cache.db'
+DEFAULT_TTL = 60 * 60  # 1시간
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # 50MB
+
+
+class ResponseCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _init_db(self):
+        """캐시 테이블 생성"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_http_cache_last_access ON http_cache (last_access)')
+        conn.commit()
+        conn.close()
+
+    def get(self, url):
+        """캐시 항목 조회 (없으면 None), 조회 시각을 갱신해서 LRU 순서에 반영"""
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT body, etag, last_modified, fetched_at FROM http_cache WHERE url = ?', (url,)
+        ).fetchone()
+        if row:
+            conn.execute('UPDATE http_cache SET last_access = ? WHERE url = ?', (time.time(), url))
+            conn.commit()
+        conn.close()
+
+        if not row:
+            return None
+        return {'body': row[0], 'etag': row[1], 'last_modified': row[2], 'fetched_at': row[3]}
+
+    def is_fresh(self, entry):
+        """TTL 안에 있는 항목인지"""
+        return time.time() - entry['fetched_at'] < self.ttl
+
+    def conditional_headers(self, entry):
+        """재검증 요청 헤더"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """응답 저장 후 용량 초과분 제거"""
+        now = time.time()
+        size = len(body.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        conn = self._connect()
+        conn.execute('''
+            INSERT OR REPLACE INTO http_cache (url, body, etag, last_modified, size, fetched_at, last_access)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (url, body, etag, last_modified, size, now, now))
+        self._evict(conn)
+        conn.commit()
+        conn.close()
+
+    def touch(self, url):
+        """304 응답을 받았을 때 TTL 다시 시작"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute('UPDATE http_cache SET fetched_at = ?, last_access = ? WHERE url = ?', (now, now, url))
+        conn.commit()
+        conn.close()
+
+    def _evict(self, conn):
+        """전체 크기가 max_bytes 이하가 될 때까지 가장 오래 안 쓴 항목 삭제"""
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM http_cache').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        victims = []
+        for url, size in conn.execute('SELECT url, size FROM http_cache ORDER BY last_access ASC'):
+            if total <= self.max_bytes:
+                break
+            victims.append((url,))
+            total -= size
+        conn.executemany('DELETE FROM http_cache WHERE url = ?', victims)
+
+    def stats(self):
+        """캐시 항목 수와 전체 크기"""
+        conn = self._connect()
+        count, total = conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM http_cache').fetchone()
+        conn.close()
+        return {'entries': count, 'bytes': total, 'max_bytes': self.max_bytes, 'ttl': self.ttl}
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        conn = self._connect()
+        conn.execute('DELETE FROM http_cache')
+        conn.commit()
+        conn.close()
+
+    def fetch(self, session, url, timeout=15):
+        """캐시를 거쳐 페이지 본문 가져오기
+
+        - TTL 안: 네트워크 요청 없이 캐시 반환
+        - TTL 지남: 조건부 요청, 304면 캐시 반환
+        - 네트워크 오류: 캐시가 있으면 (오래됐어도) 캐시 반환, 없으면 예외
+        - 2xx가 아니면 requests.HTTPError
+        """
+        return self.fetch_with_source(session, url, timeout)[0]
+
+    def fetch_with_source(self, session, url, timeout=15):
+        """fetch와 같지만 (본문, 출처)를 반환
+
+        출처: 'cache'(TTL 안), 'revalidated'(304), 'stale'(네트워크 오류로 오래된 캐시), 'network'(새로 받음)
+        """
+        entry = self.get(url)
+        if entry and self.is_fresh(entry):
+            return entry['body'], 'cache'
+
+        headers = self.conditional_headers(entry) if entry else {}
+        try:
+            response = session.get(url, headers=headers, timeout=timeout)
+        except Exception:
+            if entry:
+                return entry['body'], 'stale'
+            raise
+
+        if response.status_code == 304 and entry:
+            self.touch(url)
+            return entry['body'], 'revalidated'
+
+        response.raise_for_status()
+        self.store(url, response.text, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response.text, 'network'
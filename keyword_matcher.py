@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+🔤 Aho-Corasick 다중 키워드 매처
+공연장/작곡가/역할 같은 키워드 사전을 자동자 하나로 만들어 두고,
+본문을 한 번 훑어 모든 키워드 등장 위치(겹치는 것 포함)를 찾습니다.
+훑는 비용은 본문 길이에만 비례하고 사전 크기와는 거의 무관합니다.
+"""
+
+import re
+from collections import deque
+
+
+class KeywordMatcher:
+    def __init__(self):
+        # 상태별 전이 {글자: 다음 상태}, 실패 링크, 출력 (키워드 길이, 값) 목록
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._delta = None
+        self._first = None
+        self._built = False
+        self.size = 0
+
+    def add(self, keyword, value, ignore_case=False):
+        """키워드 추가 (value는 매칭될 때 함께 돌려줄 값)
+
+        대소문자 무시 키워드는 소문자로 넣고, 구분하는 키워드는 매칭 후 원문과 다시 비교합니다.
+        """
+        if not keyword:
+            return
+        key = _fold(keyword)
+        state = 0
+        for ch in key:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(key), None if ignore_case else keyword, value))
+        self._built = False
+        self.size += 1
+
+    def build(self):
+        """실패 링크 계산 (BFS) 후 실패 링크를 미리 따라간 전이표 생성"""
+        goto, fail, output = self._goto, self._fail, self._output
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                fail[next_state] = goto[link].get(ch, 0)
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+        # delta[상태]: 자기 전이 + 실패 링크(루트 제외)의 전이, 없으면 루트 전이로 대체
+        # → 본문 글자마다 사전 조회 한두 번으로 다음 상태가 정해짐
+        delta = [dict() for _ in goto]
+        for state in order:
+            delta[state] = dict(delta[fail[state]]) if fail[state] else {}
+            delta[state].update(goto[state])
+        self._delta = delta
+        # 루트 상태에서는 키워드 첫 글자가 나올 때까지 정규식으로 건너뜀
+        first = ''.join(re.escape(ch) for ch in sorted(goto[0]))
+        self._first = re.compile(f'[{first}]') if first else None
+        self._built = True
+        return self
+
+    def iter_matches(self, text):
+        """(시작 위치, 값)을 본문 순서대로 yield (끝 위치 기준 순서)"""
+        if not self._built:
+            self.build()
+
+        lowered = _fold(text)
+
+        if self._first is None:
+            return
+
+        delta, output, first = self._delta, self._output, self._first
+        root = self._goto[0]
+        length_text = len(lowered)
+        i = 0
+        state = 0
+        while i < length_text:
+            if not state:
+                skip = first.search(lowered, i)
+                if not skip:
+                    return
+                i = skip.start()
+            ch = lowered[i]
+            state = delta[state].get(ch) or root.get(ch, 0)
+            if output[state]:
+                for length, exact, value in output[state]:
+                    start = i - length + 1
+                    if exact is None or text[start:i + 1] == exact:
+                        yield start, value
+            i += 1
+
+    def find_all(self, text):
+        """모든 매치 목록 [(시작 위치, 값)]"""
+        return list(self.iter_matches(text))
+
+
+def _fold(text):
+    """소문자 변환 (길이가 달라지는 드문 문자는 그대로 둬서 위치를 맞춤)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+🎼 문화생활 기록의 출연진/프로그램/가격을 정규화한 하위 테이블
+culture_logs 는 performers/program/price 를 JSON 문자열로 저장해서 "정명훈이 나온 공연", "들었던 브람스 전부",
+"공연장별 평균 티켓 가격" 같은 질문은 전체를 읽고 파이썬에서 JSON을 풀어야 했습니다.
+기록을 저장할 때 항목을 풀어서 인덱스가 있는 테이블에 같이 넣습니다.
+- log_performers (log_id, name, role): "이름 - 역할" 또는 "[라벨] 이름, 이름" 형식을 풀고 "(영문 이름)"은 뗌
+- log_works (log_id, composer, title): keywords.json 의 composer_names 로 작곡가 이름을 하나로 (Brahms → 브람스),
+  composer_names 에 없는 composers 키워드는 찾은 표기 그대로 (Haydn → Haydn)
+- log_prices (log_id, seat_class, amount): "R석 50,000원" → ('R석', 50000)
+기록을 지우면 외래 키(ON DELETE CASCADE)로 같이 지워집니다. 테이블을 처음 만들 때 기존 기록을 모두 옮깁니다.
+"""
+
+import json
+import re
+
+from extraction import load_keywords
+
+KEYWORDS = load_keywords()
+ROLES = set(KEYWORDS['roles'])
+# 표기 → 대표 작곡가 이름 (긴 표기부터 찾음), 대표 이름이 없는 composers 키워드는 그 키워드가 대표 이름
+NAMED_ALIASES = [(alias, composer) for composer, aliases in KEYWORDS['composer_names'].items() for alias in aliases]
+COMPOSER_ALIASES = sorted(
+    NAMED_ALIASES + [
+        (keyword, keyword) for keyword in KEYWORDS['composers']
+        if keyword.lower() not in {alias.lower() for alias, _ in NAMED_ALIASES}
+    ],
+    key=lambda item: -len(item[0]),
+)
+COMPOSER_PATTERNS = [
+    # 영문 표기는 단어 단위로 (Offenbach ≠ Bach), 한글 표기는 앞 글자만 봄 (오펜바흐 ≠ 바흐, 브람스의 = 브람스)
+    (re.compile(rf'(?<![A-Za-z]){re.escape(alias)}(?![A-Za-z])' if alias.isascii() else rf'(?<![가-힣]){re.escape(alias)}',
+                re.IGNORECASE), composer)
+    for alias, composer in COMPOSER_ALIASES
+]
+
+PERFORMER_ROLE_PATTERN = re.compile(r'^(.+?)\s+-\s+(\S+)$')
+PERFORMER_LABEL_PATTERN = re.compile(r'^\[[^\]]*\]\s*')
+ENGLISH_NAME_PATTERN = re.compile(r'\s*\([A-Za-zÀ-ÖØ-öø-ɏ\s\-\.,]+\)')
+PRICE_PATTERN = re.compile(r'^(.*?)\s*[:\s]*([\d,]+)\s*원')
+
+TABLES = {
+    'log_performers': '''
+        CREATE TABLE IF NOT EXISTS log_performers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            log_id INTEGER NOT NULL REFERENCES culture_logs(id) ON DELETE CASCADE,
+            name TEXT NOT NULL,
+            role TEXT,
+            position INTEGER NOT NULL
+        )
+    ''',
+    'log_works': '''
+        CREATE TABLE IF NOT EXISTS log_works (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            log_id INTEGER NOT NULL REFERENCES culture_logs(id) ON DELETE CASCADE,
+            composer TEXT,
+            title TEXT NOT NULL,
+            position INTEGER NOT NULL
+        )
+    ''',
+    'log_prices': '''
+        CREATE TABLE IF NOT EXISTS log_prices (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            log_id INTEGER NOT NULL REFERENCES culture_logs(id) ON DELETE CASCADE,
+            seat_class TEXT,
+            amount INTEGER NOT NULL,
+            position INTEGER NOT NULL
+        )
+    ''',
+}
+INDEXES = {
+    'idx_log_performers_name': 'log_performers (name, log_id)',
+    'idx_log_performers_log': 'log_performers (log_id)',
+    'idx_log_works_composer': 'log_works (composer, log_id)',
+    'idx_log_works_log': 'log_works (log_id)',
+    'idx_log_prices_log': 'log_prices (log_id)',
+}
+
+
+def normalize_name(name):
+    """출연자 이름 비교용: "(영문 이름)" 떼고 공백 정리"""
+    return ' '.join(ENGLISH_NAME_PATTERN.sub('', name).split())
+
+
+def canonical_composer(text):
+    """문자열에서 가장 먼저 나오는 작곡가의 대표 이름 (composer_names 에 없으면 찾은 composers 키워드, 없으면 None)"""
+    found = None
+    for pattern, composer in COMPOSER_PATTERNS:
+        match = pattern.search(text)
+        if match and (found is None or match.start() < found[0]):
+            found = (match.start(), composer)
+    return found[1] if found else None
+
+
+def parse_performers(performers):
+    """출연진 목록 → [(이름, 역할)]"""
+    parsed = []
+    for item in performers:
+        item = str(item).strip()
+        match = PERFORMER_ROLE_PATTERN.match(item)
+        if match and match.group(2) in ROLES:
+            entries = [(match.group(1), match.group(2))]
+        else:
+            entries = [(name, None) for name in PERFORMER_LABEL_PATTERN.sub('', item).split(',')]
+        for name, role in entries:
+            name = normalize_name(name)
+            if name and (name, role) not in parsed:
+                parsed.append((name, role))
+    return parsed
+
+
+def parse_program(program):
+    """프로그램 목록 → [(작곡가, 곡)]"""
+    parsed = []
+    for item in program:
+        title = ' '.join(str(item).split())
+        if title:
+            parsed.append((canonical_composer(title), title))
+    return parsed
+
+
+def parse_prices(prices):
+    """가격 목록 → [(좌석 등급, 금액)] (금액이 없는 항목은 뺌)"""
+    parsed = []
+    for item in prices:
+        match = PRICE_PATTERN.match(str(item).strip())
+        if match:
+            parsed.append((match.group(1).strip() or None, int(match.group(2).replace(',', ''))))
+    return parsed
+
+
+def as_list(value):
+    """요청/DB 값 → 목록 (문자열 하나면 한 항목)"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return value if isinstance(value, list) else []
+
+
+def load_list(value):
+    """culture_logs 의 JSON 문자열 열 → 목록"""
+    if not value:
+        return []
+    try:
+        return as_list(json.loads(value))
+    except ValueError:
+        return [value]
+
+
+def save_log_details(conn, log_id, performers, program, price):
+    """기록 하나의 하위 테이블 행을 다시 씀 (목록은 JSON을 푼 값)"""
+    performers, program, price = as_list(performers), as_list(program), as_list(price)
+    for table in TABLES:
+        conn.execute(f'DELETE FROM {table} WHERE log_id = ?', (log_id,))
+    conn.executemany(
+        'INSERT INTO log_performers (log_id, name, role, position) VALUES (?, ?, ?, ?)',
+        [(log_id, name, role, i) for i, (name, role) in enumerate(parse_performers(performers))],
+    )
+    conn.executemany(
+        'INSERT INTO log_works (log_id, composer, title, position) VALUES (?, ?, ?, ?)',
+        [(log_id, composer, title, i) for i, (composer, title) in enumerate(parse_program(program))],
+    )
+    conn.executemany(
+        'INSERT INTO log_prices (log_id, seat_class, amount, position) VALUES (?, ?, ?, ?)',
+        [(log_id, seat, amount, i) for i, (seat, amount) in enumerate(parse_prices(price))],
+    )
+
+
+def migrate_log_details(conn):
+    """기존 기록 전부를 하위 테이블로 옮김, 옮긴 기록 수"""
+    rows = conn.execute('SELECT id, performers, program, price FROM culture_logs').fetchall()
+    for log_id, performers, program, price in rows:
+        save_log_details(conn, log_id, load_list(performers), load_list(program), load_list(price))
+    return len(rows)
+
+
+def fill_missing_composers(conn):
+    """작곡가 없이 저장된 곡에 지금 사전으로 찾은 작곡가를 채움 (키워드를 추가한 뒤 예전 기록용)"""
+    updates = []
+    for work_id, title in conn.execute('SELECT id, title FROM log_works WHERE composer IS NULL').fetchall():
+        composer = canonical_composer(title)
+        if composer:
+            updates.append((composer, work_id))
+    conn.executemany('UPDATE log_works SET composer = ? WHERE id = ?', updates)
+    return len(updates)
+
+
+def create_detail_tables(conn):
+    """하위 테이블/인덱스 생성, 새로 만들었으면 기존 기록 옮기기"""
+    existing = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('log_performers', 'log_works', 'log_prices')"
+    )}
+    for sql in TABLES.values():
+        conn.execute(sql)
+    for name, target in INDEXES.items():
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {target}')
+    if len(existing) < len(TABLES):
+        migrated = migrate_log_details(conn)
+        if migrated:
+            print(f"✅ 출연진/프로그램/가격 {migrated}개 기록 옮김")
+    else:
+        filled = fill_missing_composers(conn)
+        if filled:
+            print(f"✅ 작곡가 없던 곡 {filled}개에 작곡가 채움")
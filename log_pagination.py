@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+📑 /api/logs 키셋(커서) 페이지네이션
+OFFSET은 앞 페이지를 전부 정렬하고 건너뛰어야 해서 뒤 페이지일수록 느립니다.
+마지막으로 받은 기록의 (date, created_at, id)를 불투명한 after 토큰으로 돌려주고,
+다음 요청은 그보다 "작은" 기록부터 인덱스(idx_culture_logs_*)를 따라 읽으므로 몇 번째 페이지든 비용이 같습니다.
+- 정렬: date DESC, created_at DESC, id DESC (id로 같은 날짜/시각 기록도 순서가 정해짐)
+- 전문 검색(관련도순)이면 bm25 값도 토큰에 넣어 (관련도, 날짜...) 순서로 이어 읽음
+- 전체 개수: exact(매번 COUNT), approx(조건별로 잠시 캐시), none(세지 않음)
+"""
+
+import base64
+import json
+import threading
+import time
+
+ORDER_BY = 'l.date DESC, l.created_at DESC, l.id DESC'
+KEYSET = '(l.date, l.created_at, l.id) < (?, ?, ?)'
+
+# 필터 + 정렬 조합별 인덱스 (culture_log_app.create_tables에서 생성)
+INDEXES = {
+    'idx_culture_logs_date': 'culture_logs (date DESC, created_at DESC, id DESC)',
+    'idx_culture_logs_category_date': 'culture_logs (category, date DESC, created_at DESC, id DESC)',
+}
+
+COUNT_MODES = ('exact', 'approx', 'none')
+# approx 개수를 다시 셀 간격 (초)
+APPROX_COUNT_TTL = 60
+# 캐시할 조건 수 (검색어가 제각각이어도 메모리가 늘지 않게, 넘치면 비움)
+APPROX_COUNT_MAX_ENTRIES = 1000
+
+
+def create_indexes(conn):
+    for name, target in INDEXES.items():
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {target}')
+
+
+def encode_cursor(values):
+    """정렬 키 값 목록 → URL에 그대로 쓸 수 있는 토큰"""
+    raw = json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, size):
+    """토큰 → 정렬 키 값 목록 (형식이 틀리면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        values = json.loads(raw.decode('utf-8'))
+    except Exception:
+        raise ValueError('잘못된 after 토큰입니다')
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError('잘못된 after 토큰입니다')
+    return values
+
+
+def keyset_condition(rank=None):
+    """after 토큰 다음 기록 조건 (rank가 있으면 관련도가 같은 기록끼리만 날짜로 비교)"""
+    if rank is None:
+        return KEYSET
+    return f'({rank} > ? OR ({rank} = ? AND {KEYSET}))'
+
+
+def keyset_params(values, rank=None):
+    """decode_cursor 값 → keyset_condition 매개변수"""
+    if rank is None:
+        return values
+    return [values[0], values[0]] + values[1:]
+
+
+def cursor_size(rank=None):
+    return 3 if rank is None else 4
+
+
+class CountCache:
+    """조건별 전체 개수를 ttl초 동안 재사용 (count=approx), 이 프로세스에서 기록이 바뀌면 비움"""
+
+    def __init__(self, ttl=APPROX_COUNT_TTL, max_entries=APPROX_COUNT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, count):
+        now = time.monotonic()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None and now - cached[1] < self.ttl:
+                return cached[0]
+        total = count()
+        with self._lock:
+            if len(self._counts) >= self.max_entries:
+                self._counts.clear()
+            self._counts[key] = (total, now)
+        return total
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
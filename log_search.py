@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+🔎 문화생활 기록 전문 검색 (SQLite FTS5, trigram 토크나이저)
+culture_logs 의 제목/공연장/출연진/프로그램/후기를 culture_logs_fts 가상 테이블에 색인합니다.
+- 외부 콘텐츠 테이블(content='culture_logs')이라 본문은 한 번만 저장, 트리거로 추가/수정/삭제를 따라감
+- trigram 토크나이저: 띄어쓰기 없는 한글도 세 글자 이상이면 부분 문자열로 찾음 ("명훈" ✗, "정명훈" ✓, "서울시" → 서울시향)
+- bm25 순위 (제목 > 출연진/프로그램 > 공연장 > 후기), 찾은 부분을 <mark>로 감싼 snippet
+- 두 글자 이하 검색어와 FTS5/trigram이 없는 SQLite(3.34 미만)에서는 LIKE로 찾음
+"""
+
+import html
+
+FTS_TABLE = 'culture_logs_fts'
+# 색인 열 (순서대로 bm25 가중치)
+FTS_COLUMNS = ('title', 'venue', 'performers', 'program', 'review')
+BM25_WEIGHTS = (10.0, 3.0, 5.0, 5.0, 1.0)
+# trigram이 찾을 수 있는 최소 글자 수
+MIN_TRIGRAM_LENGTH = 3
+SNIPPET_TOKENS = 12
+# snippet 표시 (HTML 이스케이프 뒤 <mark>로 바꿈, 본문에 나올 일 없는 사용자 영역 문자)
+MARK_START = '\ue000'
+MARK_END = '\ue001'
+
+LIKE_CONDITION = '(' + ' OR '.join(f'l.{column} LIKE ?' for column in FTS_COLUMNS) + ')'
+
+
+def create_search_index(conn):
+    """FTS 테이블과 동기화 트리거 생성, 새로 만들었으면 기존 기록 색인 (FTS5/trigram이 없으면 False)"""
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+        ).fetchone()
+        columns = ', '.join(FTS_COLUMNS)
+        conn.execute(f'''
+            CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+                {columns}, content='culture_logs', content_rowid='id', tokenize='trigram'
+            )
+        ''')
+    except Exception as e:
+        print(f"⚠️ 전문 검색 색인을 만들 수 없어 LIKE 검색을 씁니다: {str(e)}")
+        return False
+
+    new_values = ', '.join(f'new.{column}' for column in FTS_COLUMNS)
+    old_values = ', '.join(f'old.{column}' for column in FTS_COLUMNS)
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS culture_logs_fts_insert AFTER INSERT ON culture_logs BEGIN
+            INSERT INTO {FTS_TABLE} (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS culture_logs_fts_delete AFTER DELETE ON culture_logs BEGIN
+            INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS culture_logs_fts_update AFTER UPDATE ON culture_logs BEGIN
+            INSERT INTO {FTS_TABLE} ({FTS_TABLE}, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO {FTS_TABLE} (rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    ''')
+    if not exists:
+        conn.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('rebuild')")
+    return True
+
+
+def has_search_index(conn):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (FTS_TABLE,)
+    ).fetchone() is not None
+
+
+def split_terms(search):
+    """검색어 → (FTS로 찾을 단어, LIKE로 찾을 짧은 단어)"""
+    long_terms, short_terms = [], []
+    for term in search.split():
+        (long_terms if len(term) >= MIN_TRIGRAM_LENGTH else short_terms).append(term)
+    return long_terms, short_terms
+
+
+def match_expression(terms):
+    """단어들을 모두 포함 (각 단어는 따옴표로 감싼 구문, 연산자로 해석되지 않게)"""
+    return ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def render_snippet(snippet):
+    """snippet → HTML (본문은 이스케이프, 찾은 부분만 <mark>)"""
+    if not snippet:
+        return None
+    return html.escape(snippet).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def search_clause(conn, search):
+    """검색 조건 → (FROM/JOIN 절, WHERE 조건 목록, 매개변수, 순위 ORDER BY 식, snippet 식)
+
+    culture_logs 별칭은 항상 l
+    """
+    long_terms, short_terms = split_terms(search)
+    conditions, params = [], []
+    if long_terms and has_search_index(conn):
+        source = f'{FTS_TABLE} JOIN culture_logs l ON l.id = {FTS_TABLE}.rowid'
+        conditions.append(f'{FTS_TABLE} MATCH ?')
+        params.append(match_expression(long_terms))
+        weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+        rank = f'bm25({FTS_TABLE}, {weights})'
+        snippet = f"snippet({FTS_TABLE}, -1, '{MARK_START}', '{MARK_END}', '…', {SNIPPET_TOKENS})"
+    else:
+        source = 'culture_logs l'
+        short_terms = long_terms + short_terms
+        rank = snippet = None
+    for term in short_terms:
+        conditions.append(LIKE_CONDITION)
+        params.extend([f'%{term}%'] * len(FTS_COLUMNS))
+    return source, conditions, params, rank, snippet
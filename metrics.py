@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+📈 Prometheus 텍스트 형식 메트릭 (외부 패키지 없음)
+Counter / Gauge / Histogram 값을 프로세스 메모리에 모으고, 주기적으로 METRICS_DIR 아래
+프로세스별 스냅샷 파일(metrics_<pid>.json)로 씁니다. /metrics 를 받은 워커는 자기 스냅샷을 먼저 쓰고
+디렉토리의 모든 스냅샷을 합쳐서 내보내므로 gunicorn 워커가 여러 개여도 전체 합계가 나옵니다.
+- Counter/Histogram: 끝난 워커 것까지 모두 합산 (재시작해도 값이 줄지 않음)
+- Gauge: 살아 있는 워커 것만 합산 (진행 중인 작업 수 등)
+
+gunicorn.conf.py 의 on_starting 훅이 서버 시작 때 디렉토리를 비우고,
+child_exit 훅이 끝난 워커의 스냅샷을 dead_ 로 바꿔 Gauge에서 빠지게 합니다.
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_DIR = os.environ.get('METRICS_DIR') or os.path.join(tempfile.gettempdir(), 'culture_log_metrics')
+# 스냅샷 파일을 쓰는 간격 (초, 값이 바뀐 경우에만)
+FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', '2'))
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except Exception:
+        return True
+
+
+class MetricsRegistry:
+    """메트릭 정의 + 이 프로세스의 값 + 스냅샷 파일 관리"""
+
+    def __init__(self, directory=METRICS_DIR, flush_interval=FLUSH_INTERVAL, pid=None):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._pid = pid
+        self.metrics = {}
+        # {이름: {라벨 튜플: 값}} (히스토그램 값은 [버킷별 개수..., 합계, 개수])
+        self.values = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flusher = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            atexit.register(self.flush)
+
+    @property
+    def pid(self):
+        """스냅샷 파일 이름에 쓸 프로세스 ID (gunicorn --preload로 포크돼도 워커 자신의 PID)"""
+        return self._pid or os.getpid()
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        self.values.setdefault(metric.name, {})
+        return metric
+
+    def update(self, name, labels, func):
+        """값 하나를 func(이전 값)으로 바꿈"""
+        with self._lock:
+            samples = self.values[name]
+            samples[labels] = func(samples.get(labels))
+            self._dirty = True
+        self._ensure_flusher()
+
+    def _ensure_flusher(self):
+        """값이 처음 바뀔 때 백그라운드 스냅샷 스레드 시작 (포크된 워커마다 따로)"""
+        if not self.directory or (self._flusher and self._flusher.is_alive()):
+            return
+
+        def loop():
+            while True:
+                time.sleep(self.flush_interval)
+                if self._dirty:
+                    self.flush()
+
+        with self._lock:
+            if self._flusher and self._flusher.is_alive():
+                return
+            self._flusher = threading.Thread(target=loop, daemon=True)
+            self._flusher.start()
+
+    def snapshot_path(self):
+        return os.path.join(self.directory, f'metrics_{self.pid}.json')
+
+    def flush(self):
+        """이 프로세스의 값을 스냅샷 파일로 (임시 파일에 쓰고 교체해서 읽는 쪽이 반쪽 파일을 보지 않음)"""
+        if not self.directory:
+            return
+        with self._lock:
+            data = {
+                'pid': self.pid,
+                'values': {
+                    name: [[list(map(list, labels)), value] for labels, value in samples.items()]
+                    for name, samples in self.values.items()
+                },
+            }
+            self._dirty = False
+        try:
+            temp_path = f'{self.snapshot_path()}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.snapshot_path())
+        except Exception as e:
+            print(f"메트릭 스냅샷 저장 실패: {str(e)}")
+
+    def collect(self):
+        """모든 프로세스 값 합산 {이름: {라벨 튜플: 값}}"""
+        if not self.directory:
+            with self._lock:
+                return {name: dict(samples) for name, samples in self.values.items()}
+
+        self.flush()
+        merged = {name: {} for name in self.metrics}
+        for filename in os.listdir(self.directory):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, filename), encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception:
+                continue  # 쓰는 중이거나 깨진 파일은 이번 수집에서 빠짐
+
+            alive = not filename.startswith('dead_') and _pid_alive(data.get('pid', 0))
+            for name, samples in data.get('values', {}).items():
+                metric = self.metrics.get(name)
+                if metric is None or (metric.kind == 'gauge' and not alive):
+                    continue
+                target = merged[name]
+                for labels, value in samples:
+                    key = tuple(tuple(pair) for pair in labels)
+                    target[key] = metric.merge(target.get(key), value)
+        return merged
+
+    def render(self):
+        """Prometheus 텍스트 노출 형식"""
+        merged = self.collect()
+        lines = []
+        for name, metric in sorted(self.metrics.items()):
+            lines.append(f'# HELP {name} {metric.help}')
+            lines.append(f'# TYPE {name} {metric.kind}')
+            for labels, value in sorted(merged.get(name, {}).items()):
+                lines.extend(metric.render(labels, value))
+        return '\n'.join(lines) + '\n'
+
+
+def reset_directory(directory=METRICS_DIR):
+    """이전 실행의 스냅샷 지우기 (gunicorn 시작 때)"""
+    os.makedirs(directory, exist_ok=True)
+    for filename in os.listdir(directory):
+        if filename.endswith('.json') or filename.endswith('.tmp'):
+            try:
+                os.remove(os.path.join(directory, filename))
+            except OSError:
+                pass
+
+
+def mark_process_dead(pid, directory=METRICS_DIR):
+    """끝난 워커 스냅샷을 dead_ 로 바꿈 (Counter/Histogram은 계속 합산, Gauge는 제외)"""
+    path = os.path.join(directory, f'metrics_{pid}.json')
+    if os.path.exists(path):
+        # 나중에 같은 PID를 받은 워커가 끝나도 덮어쓰지 않게 시각을 붙임
+        os.replace(path, os.path.join(directory, f'dead_metrics_{pid}_{time.time_ns()}.json'))
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, help, labelnames=(), registry=None):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.registry = registry or REGISTRY
+        self.registry.register(self)
+
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f'{self.name} 라벨은 {self.labelnames} 이어야 합니다')
+        return tuple((name, str(labels[name])) for name in self.labelnames)
+
+    def merge(self, total, value):
+        return (total or 0) + value
+
+    def render(self, labels, value):
+        return [f'{self.name}{_format_labels(labels)} {_format_value(value)}']
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        self.registry.update(self.name, self._key(labels), lambda value: (value or 0) + amount)
+
+
+class Gauge(Metric):
+    kind = 'gauge'
+
+    def inc(self, amount=1, **labels):
+        self.registry.update(self.name, self._key(labels), lambda value: (value or 0) + amount)
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, amount, **labels):
+        self.registry.update(self.name, self._key(labels), lambda value: amount)
+
+    @contextmanager
+    def track(self, **labels):
+        """with gauge.track(): ... 블록 동안 1 증가"""
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), buckets=DEFAULT_BUCKETS, registry=None):
+        self.buckets = tuple(buckets) + (float('inf'),)
+        super().__init__(name, help, labelnames, registry)
+
+    def observe(self, amount, **labels):
+        index = next(i for i, bound in enumerate(self.buckets) if amount <= bound)
+
+        def add(value):
+            value = list(value or [0] * (len(self.buckets) + 2))
+            value[index] += 1
+            value[-2] += amount
+            value[-1] += 1
+            return value
+
+        self.registry.update(self.name, self._key(labels), add)
+
+    @contextmanager
+    def time(self, **labels):
+        """with histogram.time(): ... 블록 실행 시간(초) 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def merge(self, total, value):
+        if total is None:
+            return list(value)
+        return [a + b for a, b in zip(total, value)]
+
+    def render(self, labels, value):
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, value):
+            cumulative += bucket_count
+            bucket_labels = labels + (('le', _format_value(bound)),)
+            lines.append(f'{self.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}')
+        lines.append(f'{self.name}_sum{_format_labels(labels)} {_format_value(value[-2])}')
+        lines.append(f'{self.name}_count{_format_labels(labels)} {_format_value(value[-1])}')
+        return lines
+
+
+REGISTRY = MetricsRegistry()
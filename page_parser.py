@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+🧹 HTML 파서 백엔드 선택 + DOM 가지치기
+페이지를 파싱한 뒤 script/style/nav/footer/menu 같은 본문이 아닌 가지를 먼저 잘라내고 텍스트를 뽑습니다.
+메뉴 JSON이나 사이트 내비게이션 글자가 출연진/공연장으로 잘못 잡히는 것을 막고, 추출기가 훑을 본문도 줄어듭니다.
+
+백엔드 (설치된 것 중 앞쪽이 기본값, SCRAPER_HTML_PARSER 환경변수로 지정 가능)
+- selectolax: lexbor 기반 C 파서 (가장 빠름)
+- lxml: BeautifulSoup + lxml 트리 빌더
+- html.parser: BeautifulSoup 기본 파서 (항상 사용 가능)
+"""
+
+import hashlib
+import os
+import re
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml
+except ImportError:
+    lxml = None
+
+# 통째로 잘라낼 태그
+PRUNE_TAGS = {'script', 'style', 'noscript', 'template', 'nav', 'footer', 'menu'}
+# 태그 이름만으로는 안 잡히는 사이트 메뉴 영역 (예술의전당은 <div id="gnb">)
+PRUNE_IDS = {'gnb', 'lnb'}
+PRUNE_CLASSES = {'gnb', 'lnb'}
+PRUNE_ROLES = {'navigation'}
+PRUNE_SELECTOR = ', '.join(
+    [f'#{name}' for name in sorted(PRUNE_IDS)]
+    + [f'.{name}' for name in sorted(PRUNE_CLASSES)]
+    + [f'[role="{role}"]' for role in sorted(PRUNE_ROLES)]
+)
+
+
+# content_hash용: DOM 없이 정규식으로 잘라낼 블록 (스크립트 nonce, 로그인 메뉴 등 매번 바뀌는 부분)
+HASH_PRUNE_PATTERN = re.compile(
+    r'<!--.*?-->|<(script|style|noscript|template|nav|footer|menu)\b.*?</\1\s*>',
+    re.IGNORECASE | re.DOTALL,
+)
+HASH_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def available_backends():
+    """사용 가능한 백엔드 목록 (빠른 순서)"""
+    backends = []
+    if LexborHTMLParser is not None:
+        backends.append('selectolax')
+    if lxml is not None:
+        backends.append('lxml')
+    backends.append('html.parser')
+    return backends
+
+
+DEFAULT_BACKEND = os.environ.get('SCRAPER_HTML_PARSER') or available_backends()[0]
+
+
+def resolve_backend(backend=None):
+    """요청한 백엔드가 없으면 html.parser로 대체"""
+    backend = backend or DEFAULT_BACKEND
+    if backend not in available_backends():
+        print(f"⚠️ HTML 파서 '{backend}' 사용 불가, html.parser로 대체합니다")
+        return 'html.parser'
+    return backend
+
+
+def _is_pruned(tag):
+    """BeautifulSoup 태그가 잘라낼 가지인지 (CSS 선택자보다 훨씬 빠른 한 번 훑기용)"""
+    if tag.name in PRUNE_TAGS:
+        return True
+    if tag.get('id') in PRUNE_IDS or tag.get('role') in PRUNE_ROLES:
+        return True
+    return not PRUNE_CLASSES.isdisjoint(tag.get('class') or ())
+
+
+def normalize_text(text):
+    """줄마다 앞뒤 공백을 지우고 빈 줄을 없앰 (백엔드마다 다른 공백 처리를 맞춤)"""
+    lines = (line.strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+class ParsedPage:
+    """파싱된 페이지: 본문 텍스트 + CSS 선택자로 요소 텍스트 찾기"""
+
+    def __init__(self, backend, tree):
+        self.backend = backend
+        self.tree = tree
+        self._text = None
+
+    @property
+    def text(self):
+        """가지치기 후 남은 본문 텍스트"""
+        if self._text is None:
+            if self.backend == 'selectolax':
+                raw = self.tree.root.text() if self.tree.root else ''
+            else:
+                raw = self.tree.get_text()
+            self._text = normalize_text(raw)
+        return self._text
+
+    def select_text(self, selector):
+        """선택자에 맞는 첫 요소의 텍스트 (없으면 None)"""
+        if self.backend == 'selectolax':
+            node = self.tree.css_first(selector)
+            return node.text() if node is not None else None
+
+        element = self.tree.select_one(selector)
+        return element.get_text() if element is not None else None
+
+    def select_texts(self, selector):
+        """선택자에 맞는 모든 요소의 텍스트 목록"""
+        if self.backend == 'selectolax':
+            return [node.text() for node in self.tree.css(selector)]
+        return [element.get_text() for element in self.tree.select(selector)]
+
+
+def content_hash(html):
+    """가지치기한 본문 글자의 해시 (파싱 없이 정규식만 사용, 재스크래핑 변경 감지용)"""
+    text = HASH_TAG_PATTERN.sub(' ', HASH_PRUNE_PATTERN.sub(' ', html))
+    return hashlib.sha256(' '.join(text.split()).encode('utf-8')).hexdigest()
+
+
+def parse_html(html, backend=None, prune=True):
+    """HTML 파싱 (+ 가지치기) → ParsedPage"""
+    backend = resolve_backend(backend)
+
+    if backend == 'selectolax':
+        tree = LexborHTMLParser(html)
+        if prune:
+            tree.strip_tags(sorted(PRUNE_TAGS))
+            for node in tree.css(PRUNE_SELECTOR):
+                node.decompose()
+        return ParsedPage(backend, tree)
+
+    tree = BeautifulSoup(html, backend)
+    if prune:
+        for tag in tree.find_all(_is_pruned):
+            if not tag.decomposed:
+                tag.decompose()
+    return ParsedPage(backend, tree)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+🤝 사이트를 배려하는 공용 HTTP 가져오기 계층
+PoliteSession은 requests.Session을 그대로 대신 쓸 수 있고, 모든 요청이 다음을 거칩니다.
+- 호스트별 토큰 버킷: 초당 rate개, 최대 burst개까지 몰아서 (한 공연장 사이트를 두드리지 않게)
+- 호스트별 동시 요청 수 상한 (max_in_flight)
+- 동시성에 맞춘 HTTPAdapter 연결 풀 (keep-alive 연결 재사용)
+- 제한은 어댑터(ThrottledAdapter)에서 걸므로 리다이렉트로 옮겨 간 요청도 한 번씩 따로 제한됨
+- 연결 오류/타임아웃, 429/5xx 응답은 지터를 섞은 지수 백오프로 재시도 (GET/HEAD만)
+  Retry-After가 있으면 그만큼 기다리고, 그동안 같은 호스트의 다른 요청도 함께 멈춤
+
+호스트별 상태(HostThrottle)는 프로세스 안의 모든 세션이 공유하므로
+스크래퍼 인스턴스나 스레드가 여러 개여도 한 사이트에 가는 총량이 제한됩니다.
+asyncio 코드(async_scraper)는 이벤트 루프를 막지 않도록 HostThrottle.try_acquire로 같은 제한을 따릅니다.
+로컬 스텁 서버를 쓰는 벤치마크/테스트는 HostThrottle(enabled=False) 또는 exempt_hosts=LOOPBACK_HOSTS 를 넘기면 됩니다.
+
+환경변수: SCRAPE_HOST_RATE(기본 2/초), SCRAPE_HOST_BURST(4), SCRAPE_HOST_MAX_IN_FLIGHT(2),
+         SCRAPE_MAX_RETRIES(3), SCRAPE_POOL_SIZE(16)
+"""
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from batch_scraper import host_of
+
+DEFAULT_HOST_RATE = float(os.environ.get('SCRAPE_HOST_RATE', '2'))
+DEFAULT_HOST_BURST = int(os.environ.get('SCRAPE_HOST_BURST', '4'))
+DEFAULT_HOST_MAX_IN_FLIGHT = int(os.environ.get('SCRAPE_HOST_MAX_IN_FLIGHT', '2'))
+DEFAULT_MAX_RETRIES = int(os.environ.get('SCRAPE_MAX_RETRIES', '3'))
+# 연결 풀 크기: 호스트별 연결 수 (batch_scraper/async 워커 수보다 작으면 연결을 버리고 다시 맺음)
+DEFAULT_POOL_SIZE = int(os.environ.get('SCRAPE_POOL_SIZE', '16'))
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+# Retry-After가 이보다 길면 기다리지 않고 응답을 그대로 돌려줌 (초)
+MAX_RETRY_AFTER = 120.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_METHODS = {'GET', 'HEAD'}
+# try_acquire에서 호스트 요청 자리가 없을 때 다시 확인하기까지 기다릴 초
+SLOT_POLL_INTERVAL = 0.05
+# 제한하지 않아도 되는 자기 자신 (exempt_hosts에 넘길 때)
+LOOPBACK_HOSTS = frozenset({'127.0.0.1', 'localhost', '::1'})
+
+
+def retry_after_seconds(response):
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 기다릴 초 (없거나 못 읽으면 None)"""
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """attempt번째 재시도 전 대기 시간 (full jitter: 0 ~ min(cap, base * 2^attempt))"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 burst개까지 쌓이는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        # Retry-After 등으로 이 시각까지는 토큰을 주지 않음
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _wait_time(self, now):
+        """지금 토큰 하나를 꺼낼 수 있으면 0, 아니면 기다릴 초"""
+        if now < self.paused_until:
+            return self.paused_until - now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def try_acquire(self):
+        """기다리지 않고 토큰 하나 꺼내기: 꺼냈으면 0, 아니면 다시 시도하기 전까지 기다릴 초"""
+        with self._lock:
+            return self._wait_time(time.monotonic())
+
+    def acquire(self):
+        """토큰 하나 꺼내기 (없으면 생길 때까지 대기), 기다린 초 반환"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def pause(self, seconds):
+        """seconds 동안 이 호스트 요청 멈춤 (429 Retry-After)"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+class HostThrottle:
+    """호스트별 토큰 버킷 + 동시 요청 수 제한 (여러 세션이 공유)"""
+
+    def __init__(self, rate=DEFAULT_HOST_RATE, burst=DEFAULT_HOST_BURST, max_in_flight=DEFAULT_HOST_MAX_IN_FLIGHT,
+                 overrides=None, exempt_hosts=(), enabled=True):
+        self.rate = rate
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        # 호스트별 다른 값 {호스트: {'rate': ..., 'burst': ..., 'max_in_flight': ...}}
+        self.overrides = overrides or {}
+        # 제한하지 않을 호스트 (enabled=False면 모든 호스트)
+        self.exempt_hosts = frozenset(exempt_hosts)
+        self.enabled = enabled
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def _host(self, host):
+        with self._lock:
+            entry = self._hosts.get(host)
+            if entry is None:
+                settings = self.overrides.get(host, {})
+                entry = {
+                    'bucket': TokenBucket(settings.get('rate', self.rate), settings.get('burst', self.burst)),
+                    'slots': threading.BoundedSemaphore(settings.get('max_in_flight', self.max_in_flight)),
+                }
+                self._hosts[host] = entry
+            return entry
+
+    def exempt(self, host):
+        return not self.enabled or host in self.exempt_hosts
+
+    def acquire(self, host):
+        """요청 자리 + 토큰 얻기 (반드시 release와 짝지어 호출)"""
+        if self.exempt(host):
+            return
+        entry = self._host(host)
+        entry['slots'].acquire()
+        try:
+            entry['bucket'].acquire()
+        except BaseException:
+            entry['slots'].release()
+            raise
+
+    def try_acquire(self, host):
+        """기다리지 않고 요청 자리 + 토큰 얻기 (asyncio용): 얻었으면 0, 아니면 다시 시도하기 전까지 기다릴 초
+
+        0을 돌려받았을 때만 release와 짝지어 호출합니다.
+        """
+        if self.exempt(host):
+            return 0.0
+        entry = self._host(host)
+        if not entry['slots'].acquire(blocking=False):
+            return SLOT_POLL_INTERVAL
+        delay = entry['bucket'].try_acquire()
+        if delay > 0:
+            entry['slots'].release()
+        return delay
+
+    def release(self, host):
+        if not self.exempt(host):
+            self._host(host)['slots'].release()
+
+    def pause(self, host, seconds):
+        if not self.exempt(host):
+            self._host(host)['bucket'].pause(seconds)
+
+
+# 프로세스 안의 모든 PoliteSession이 공유하는 기본 제한
+DEFAULT_THROTTLE = HostThrottle()
+
+
+class ThrottledAdapter(HTTPAdapter):
+    """요청 하나(리다이렉트 한 단계)마다 호스트 제한을 거는 어댑터
+
+    requests는 리다이렉트를 따라갈 때도 단계마다 어댑터의 send를 부르므로
+    다른 호스트로 옮겨 가도 그 호스트의 토큰 버킷/동시 요청 수를 따름
+    """
+
+    def __init__(self, throttle, **kwargs):
+        self.throttle = throttle
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        host = host_of(request.url)
+        self.throttle.acquire(host)
+        try:
+            response = super().send(request, **kwargs)
+            # 본문을 받는 동안에도 요청 자리를 차지하도록 (stream=True면 호출한 쪽이 읽음)
+            if not kwargs.get('stream'):
+                response.content
+            return response
+        finally:
+            self.throttle.release(host)
+
+
+class PoliteSession(requests.Session):
+    """호스트별 속도/동시성 제한 + 재시도가 붙은 requests.Session"""
+
+    def __init__(self, throttle=None, max_retries=DEFAULT_MAX_RETRIES, pool_size=DEFAULT_POOL_SIZE):
+        super().__init__()
+        self.throttle = throttle or DEFAULT_THROTTLE
+        self.max_retries = max_retries
+        # 재시도는 아래 request()에서 직접 (토큰 버킷과 Retry-After를 함께 따르도록), 어댑터는 연결 풀 + 호스트 제한
+        adapter = ThrottledAdapter(self.throttle, pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        host = host_of(url)
+        retryable = method.upper() in RETRY_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = super().request(method, url, *args, **kwargs)
+                error = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response, error = None, e
+
+            should_retry = error is not None or response.status_code in RETRY_STATUSES
+            if not retryable or not should_retry or attempt >= self.max_retries:
+                if error is not None:
+                    raise error
+                return response
+
+            delay = backoff_delay(attempt)
+            retry_after = retry_after_seconds(response)
+            if retry_after is not None:
+                if retry_after > MAX_RETRY_AFTER:
+                    return response
+                # 서버가 알려준 시간만큼 이 호스트 전체를 멈춤
+                self.throttle.pause(host, retry_after)
+                delay = max(delay, retry_after)
+            print(f"⏳ 재시도 {attempt + 1}/{self.max_retries} ({host}, "
+                  f"{error or response.status_code}), {delay:.1f}초 후")
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+🔁 저장된 공연 페이지 재확인 스케줄러
+culture_logs 에 저장된 source_url 을 공연 날짜가 가까운 순서로 다시 받아 봅니다.
+- 가지치기한 본문 해시(page_parser.content_hash)가 지난번과 같으면 파싱/추출 없이 다음 확인 시각만 갱신
+- 해시가 바뀌었을 때만 추출해서 필드(가격/출연진/프로그램 등)별 변경 내역을 rescrape_changes 에 기록
+- 공연이 가까울수록 자주 확인 (CHECK_INTERVALS), 지난 공연은 더 확인하지 않음
+- 확인할 URL은 next_check_at 을 먼저 미뤄서 가져가므로 gunicorn 워커 여러 개가 같은 URL을 겹쳐 확인하지 않음
+
+첫 확인 결과가 기준값이 되고, 그 뒤부터 바뀐 필드만 기록합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+
+from page_parser import content_hash
+from site_adapters import FIELDS
+
+# (공연까지 남은 일수 이하, 확인 간격 초): 가까운 공연일수록 자주
+CHECK_INTERVALS = [
+    (3, 6 * 60 * 60),
+    (14, 24 * 60 * 60),
+    (60, 3 * 24 * 60 * 60),
+]
+FAR_CHECK_INTERVAL = 7 * 24 * 60 * 60
+# 날짜를 모르는 공연
+UNKNOWN_DATE_INTERVAL = 7 * 24 * 60 * 60
+# 가져오기 실패 후 다시 시도할 때까지 (초)
+RETRY_INTERVAL = 60 * 60
+# 한 URL을 가져간 뒤 결과를 기록할 때까지 다른 워커가 가져가지 못하게 미뤄 두는 시간 (초)
+CLAIM_LEASE = 10 * 60
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_TICK_INTERVAL = 10 * 60
+
+
+def performance_day(value):
+    """culture_logs.date (YYYY-MM-DD...) → date (못 읽으면 None)"""
+    try:
+        return datetime.strptime((value or '')[:10], '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def check_interval(performance_date, today=None):
+    """다음 확인까지 간격 (초), 지난 공연이면 None"""
+    if performance_date is None:
+        return UNKNOWN_DATE_INTERVAL
+    days_left = (performance_date - (today or date.today())).days
+    if days_left < 0:
+        return None
+    for max_days, interval in CHECK_INTERVALS:
+        if days_left <= max_days:
+            return interval
+    return FAR_CHECK_INTERVAL
+
+
+def field_diffs(old_fields, new_fields):
+    """[(필드, 이전 값, 새 값)] (바뀐 필드만)"""
+    return [
+        (field, old_fields.get(field), new_fields.get(field))
+        for field in FIELDS
+        if old_fields.get(field) != new_fields.get(field)
+    ]
+
+
+class RescrapeScheduler:
+    def __init__(self, scraper, database, batch_size=DEFAULT_BATCH_SIZE):
+        # get_page_content / parse_concert_info 가 있는 스크래퍼
+        self.scraper = scraper
+        self.database = database
+        self.batch_size = batch_size
+        self._thread = None
+        self._stop = threading.Event()
+        self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.database, timeout=30)
+
+    def _init_db(self):
+        """재확인 상태/변경 내역 테이블 생성"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS rescrape_state (
+                url TEXT PRIMARY KEY,
+                content_hash TEXT,
+                fields TEXT,
+                checks INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                checked_at REAL,
+                changed_at REAL,
+                next_check_at REAL NOT NULL DEFAULT 0
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_rescrape_state_next ON rescrape_state (next_check_at)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS rescrape_changes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                field TEXT NOT NULL,
+                old_value TEXT,
+                new_value TEXT,
+                detected_at REAL NOT NULL
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_rescrape_changes_url ON rescrape_changes (url, detected_at)')
+        conn.commit()
+        conn.close()
+
+    def due(self, now=None):
+        """지금 확인할 (URL, 공연 날짜) 목록 (공연이 가까운 순, 날짜 모르는 것은 뒤로)"""
+        now = now or time.time()
+        conn = self._connect()
+        # 새로 저장된 기록의 URL을 상태 테이블에 추가
+        conn.execute('''
+            INSERT OR IGNORE INTO rescrape_state (url)
+            SELECT DISTINCT source_url FROM culture_logs WHERE source_url LIKE 'http%'
+        ''')
+        conn.commit()
+        rows = conn.execute('''
+            SELECT s.url, MIN(l.date) FROM rescrape_state s
+            JOIN culture_logs l ON l.source_url = s.url
+            WHERE s.next_check_at <= ?
+            GROUP BY s.url
+        ''', (now,)).fetchall()
+        conn.close()
+
+        today = date.fromtimestamp(now)
+        items = []
+        for url, value in rows:
+            performance_date = performance_day(value)
+            if performance_date is not None and performance_date < today:
+                continue
+            items.append((url, performance_date))
+        items.sort(key=lambda item: (item[1] is None, item[1] or today))
+        return items
+
+    def claim(self, url, now):
+        """다른 워커보다 먼저 이 URL을 가져감 (성공하면 True)"""
+        conn = self._connect()
+        cursor = conn.execute(
+            'UPDATE rescrape_state SET next_check_at = ? WHERE url = ? AND next_check_at <= ?',
+            (now + CLAIM_LEASE, url, now),
+        )
+        conn.commit()
+        conn.close()
+        return cursor.rowcount == 1
+
+    def check(self, url, performance_date, now=None):
+        """URL 하나 확인 → 'unchanged' / 'changed' / 'baseline' / 'failed'"""
+        now = now or time.time()
+        html_content = self.scraper.get_page_content(url)
+        conn = self._connect()
+        try:
+            if not html_content:
+                conn.execute('''
+                    UPDATE rescrape_state SET failures = failures + 1, next_check_at = ? WHERE url = ?
+                ''', (now + RETRY_INTERVAL, url))
+                return 'failed'
+
+            interval = check_interval(performance_date, date.fromtimestamp(now))
+            # 지난 공연이 되면 더 확인하지 않음 (next_check_at = 무한대)
+            next_check_at = now + interval if interval is not None else float('inf')
+            digest = content_hash(html_content)
+            previous_hash, previous_fields = conn.execute(
+                'SELECT content_hash, fields FROM rescrape_state WHERE url = ?', (url,)
+            ).fetchone()
+
+            if digest == previous_hash:
+                conn.execute('''
+                    UPDATE rescrape_state SET checks = checks + 1, failures = 0, checked_at = ?, next_check_at = ?
+                    WHERE url = ?
+                ''', (now, next_check_at, url))
+                return 'unchanged'
+
+            info = self.scraper.parse_concert_info(url, html_content)
+            fields = {field: info[field] for field in FIELDS}
+            diffs = field_diffs(json.loads(previous_fields), fields) if previous_fields else []
+            conn.executemany('''
+                INSERT INTO rescrape_changes (url, field, old_value, new_value, detected_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', [
+                (url, field, json.dumps(old, ensure_ascii=False), json.dumps(new, ensure_ascii=False), now)
+                for field, old, new in diffs
+            ])
+            conn.execute('''
+                UPDATE rescrape_state SET content_hash = ?, fields = ?, checks = checks + 1, failures = 0,
+                    checked_at = ?, changed_at = CASE WHEN ? THEN ? ELSE changed_at END, next_check_at = ?
+                WHERE url = ?
+            ''', (digest, json.dumps(fields, ensure_ascii=False), now, bool(diffs), now, next_check_at, url))
+            if previous_fields is None:
+                return 'baseline'
+            return 'changed' if diffs else 'unchanged'
+        finally:
+            conn.commit()
+            conn.close()
+
+    def run_once(self, now=None):
+        """확인할 때가 된 URL을 batch_size개까지 확인, 결과별 개수 반환"""
+        now = now or time.time()
+        # 데이터베이스 초기화(/api/reset-database) 뒤에도 테이블이 있도록
+        self._init_db()
+        counts = {'baseline': 0, 'unchanged': 0, 'changed': 0, 'failed': 0}
+        checked = 0
+        for url, performance_date in self.due(now):
+            if checked >= self.batch_size:
+                break
+            if not self.claim(url, now):
+                continue
+            checked += 1
+            try:
+                counts[self.check(url, performance_date, now)] += 1
+            except Exception as e:
+                print(f"재확인 실패 ({url}): {str(e)}")
+                counts['failed'] += 1
+        return counts
+
+    def changes(self, url=None, limit=50):
+        """최근 변경 내역 (URL 지정 가능)"""
+        conn = self._connect()
+        query = 'SELECT url, field, old_value, new_value, detected_at FROM rescrape_changes'
+        params = []
+        if url:
+            query += ' WHERE url = ?'
+            params.append(url)
+        query += ' ORDER BY detected_at DESC, id DESC LIMIT ?'
+        params.append(limit)
+        rows = conn.execute(query, params).fetchall()
+        conn.close()
+        return [
+            {
+                'url': row[0],
+                'field': row[1],
+                'old': json.loads(row[2]),
+                'new': json.loads(row[3]),
+                'detected_at': datetime.fromtimestamp(row[4]).strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            for row in rows
+        ]
+
+    def start(self, interval=DEFAULT_TICK_INTERVAL):
+        """백그라운드 스레드에서 interval초마다 run_once"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    counts = self.run_once()
+                    if any(counts.values()):
+                        print(f"🔁 공연 페이지 재확인: {counts}")
+                except Exception as e:
+                    print(f"재확인 스케줄러 오류: {str(e)}")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
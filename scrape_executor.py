@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🧵 웹앱용 스크래핑 실행기
+요청마다 스레드를 새로 띄우는 대신 고정 크기 워커 풀과 크기가 정해진 대기열로 스크래핑합니다.
+- 워커(max_workers)와 대기열(max_queue)이 모두 차면 ScrapeQueueFull → 앱이 429 + Retry-After로 응답
+- 같은 URL(정규화 기준)이 이미 대기/진행 중이면 새로 스크래핑하지 않고 그 작업에 리스너만 붙임
+  (UI에서 같은 공연을 여러 번 눌러도 가져오기는 한 번)
+- 리스너는 listener(event, payload)로 불림: 'started' / 'stage'(진행 단계) / 'done'(결과) / 'error'(메시지)
+  진행 단계는 스크래퍼의 scrape_timings.stage 구간에서 나옴 ('fetching', 'rendering', 'extracting')
+
+환경변수: SCRAPE_WORKERS(기본 4), SCRAPE_QUEUE_SIZE(16), SCRAPE_RETRY_AFTER(5초)
+"""
+
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from scrape_timings import progress
+from task_store import normalize_url
+
+DEFAULT_WORKERS = int(os.environ.get('SCRAPE_WORKERS', '4'))
+DEFAULT_QUEUE_SIZE = int(os.environ.get('SCRAPE_QUEUE_SIZE', '16'))
+DEFAULT_RETRY_AFTER = int(os.environ.get('SCRAPE_RETRY_AFTER', '5'))
+
+
+def new_task_id():
+    """겹치지 않는 작업 ID"""
+    return f"task_{uuid.uuid4().hex}"
+
+
+class ScrapeQueueFull(Exception):
+    """워커와 대기열이 모두 찼음 (retry_after초 뒤 다시 요청)"""
+
+    def __init__(self, retry_after):
+        super().__init__(f'스크래핑 대기열이 가득 찼습니다. {retry_after}초 후 다시 시도해주세요.')
+        self.retry_after = retry_after
+
+
+class _Flight:
+    """URL 하나의 대기/진행 중 작업과 결과를 기다리는 리스너들"""
+
+    def __init__(self, url):
+        self.url = url
+        self.started = False
+        self.stage = None
+        self.listeners = []
+
+
+class ScrapeExecutor:
+    def __init__(self, func, max_workers=DEFAULT_WORKERS, max_queue=DEFAULT_QUEUE_SIZE,
+                 retry_after=DEFAULT_RETRY_AFTER):
+        # func(url) → 결과 (워커 스레드에서 실행)
+        self.func = func
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scrape')
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._counts = {'submitted': 0, 'coalesced': 0, 'rejected': 0}
+
+    def submit(self, url, listener):
+        """URL 스크래핑 요청, 이미 같은 URL 작업이 있어서 합쳐졌으면 True
+
+        자리가 없으면 ScrapeQueueFull
+        """
+        key = normalize_url(url)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                flight.listeners.append(listener)
+                self._counts['coalesced'] += 1
+                started, stage = flight.started, flight.stage
+            else:
+                if len(self._flights) >= self.max_workers + self.max_queue:
+                    self._counts['rejected'] += 1
+                    raise ScrapeQueueFull(self.retry_after)
+                flight = _Flight(url)
+                flight.listeners.append(listener)
+                self._flights[key] = flight
+                self._counts['submitted'] += 1
+                self._executor.submit(self._run, key, flight)
+                return False
+
+        # 이미 진행 중인 작업에 붙었으면 시작/현재 단계 알림을 바로
+        if started:
+            self._notify([listener], 'started', None)
+        if stage:
+            self._notify([listener], 'stage', stage)
+        return True
+
+    def _run(self, key, flight):
+        with self._lock:
+            flight.started = True
+            listeners = list(flight.listeners)
+        self._notify(listeners, 'started', None)
+
+        def on_stage(name):
+            with self._lock:
+                flight.stage = name
+                listeners = list(flight.listeners)
+            self._notify(listeners, 'stage', name)
+
+        try:
+            with progress(on_stage):
+                event, payload = 'done', self.func(flight.url)
+        except Exception as e:
+            event, payload = 'error', str(e)
+        finally:
+            # 여기서부터 같은 URL 요청은 새 작업으로
+            with self._lock:
+                self._flights.pop(key, None)
+                listeners = list(flight.listeners)
+        self._notify(listeners, event, payload)
+
+    def _notify(self, listeners, event, payload):
+        for listener in listeners:
+            try:
+                listener(event, payload)
+            except Exception as e:
+                print(f"스크래핑 리스너 오류: {str(e)}")
+
+    def stats(self):
+        """대기/진행 중 작업 수와 누적 제출/합침/거절 수"""
+        with self._lock:
+            running = sum(1 for flight in self._flights.values() if flight.started)
+            return {
+                'running': running,
+                'queued': len(self._flights) - running,
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                **self._counts,
+            }
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+📈 스크래핑 메트릭 (웹 프로세스와 scrape_worker.py 공통)
+SCRAPE_MODE=worker 에서는 스크래핑이 워커 프로세스에서만 돌기 때문에 집계도 그쪽에서 해야 합니다.
+두 프로세스가 같은 METRICS_DIR 에 프로세스별 스냅샷을 쓰므로 /metrics 는 워커 몫까지 합쳐서 보여 줍니다.
+"""
+
+from batch_scraper import host_of
+from metrics import Counter, Gauge, Histogram
+
+SCRAPES_IN_FLIGHT = Gauge('scrape_tasks_in_flight', '진행 중인 스크래핑 작업 수')
+SCRAPES_COMPLETED = Counter('scrape_tasks_completed_total', '끝난 스크래핑 작업 수', ['outcome'])
+SCRAPES_BY_HOST = Counter('scrape_results_total', '호스트별 스크래핑 성공/실패 수', ['host', 'outcome'])
+SCRAPE_DURATION = Histogram('scrape_duration_seconds', '스크래핑 한 건 소요 시간')
+
+
+def record_scrape(url, success):
+    """스크래핑 한 건 결과 집계"""
+    outcome = 'success' if success else 'failure'
+    SCRAPES_COMPLETED.inc(outcome=outcome)
+    SCRAPES_BY_HOST.inc(host=host_of(url) or 'unknown', outcome=outcome)
+
+
+def observe_scrape(scrape, url):
+    """scrape(url) 실행하면서 진행 중 수/소요 시간/성공·실패 집계 (예외는 실패로 세고 그대로 올림)"""
+    result = None
+    try:
+        with SCRAPES_IN_FLIGHT.track(), SCRAPE_DURATION.time():
+            result = scrape(url)
+        return result
+    finally:
+        record_scrape(url, result is not None)
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+⏱️ 스크래핑 단계별 시간 기록
+스크래퍼가 record_timings(...) 블록 안에서 돌면 가져오기/파싱/본문 텍스트/추출기별 소요 시간과
+가져온 경로(캐시, 네트워크, 렌더링 등), 받은 바이트 수, 본문 길이를 모아 결과의 `_timings`에 붙입니다.
+블록 밖(기록을 켜지 않은 스크래퍼)에서는 stage/note/count가 아무것도 하지 않습니다.
+
+기록은 스레드마다 따로 잡히므로 scrape_many처럼 여러 스레드가 동시에 스크래핑해도 섞이지 않고,
+TimingAggregate가 최근 N건을 모아 단계별/호스트별 p50/p95와 가장 느린 스크래핑을 보여 줍니다.
+SharedTimingAggregate는 같은 기록을 SQLite 파일에 모아서 gunicorn 워커들과 scrape_worker.py 가 함께 씁니다.
+
+progress(callback) 블록 안에서는 가져오기/렌더링/파싱 단계에 들어갈 때마다 callback('fetching' 등)이 불려서
+웹앱이 진행 상황을 바로 알릴 수 있습니다 (시간 기록과는 따로 켜짐).
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from batch_scraper import host_of
+
+# 집계에 남길 최근 스크래핑 수
+DEFAULT_WINDOW = 500
+
+# stage 이름 → 진행 단계 (PROGRESS_STAGES에 없는 단계는 알리지 않음)
+PROGRESS_STAGES = {
+    'fetch': 'fetching',
+    'fetch_api': 'fetching',
+    'render': 'rendering',
+    'parse': 'extracting',
+}
+
+_local = threading.local()
+
+
+def current():
+    """이 스레드에서 기록 중인 Timings (없으면 None)"""
+    return getattr(_local, 'timings', None)
+
+
+@contextmanager
+def progress(callback):
+    """with progress(callback): ... → 이 스레드에서 진행 단계가 바뀔 때마다 callback(단계)"""
+    previous = getattr(_local, 'progress', None)
+    _local.progress = [callback, None]
+    try:
+        yield
+    finally:
+        _local.progress = previous
+
+
+def _report_progress(name):
+    listener = getattr(_local, 'progress', None)
+    phase = PROGRESS_STAGES.get(name)
+    if listener is None or phase is None or listener[1] == phase:
+        return
+    listener[1] = phase
+    try:
+        listener[0](phase)
+    except Exception as e:
+        print(f"진행 상황 알림 실패: {str(e)}")
+
+
+@contextmanager
+def stage(name):
+    """with stage('parse'): ... → 단계 시간 누적 (기록 중이 아니면 그냥 실행)"""
+    _report_progress(name)
+    timings = current()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_stage(name, time.perf_counter() - started)
+
+
+def note(**info):
+    """가져온 경로 같은 값 기록 (같은 이름이면 덮어씀)"""
+    timings = current()
+    if timings is not None:
+        timings.info.update(info)
+
+
+def count(name, amount):
+    """받은 바이트 수 같은 값 누적"""
+    timings = current()
+    if timings is not None:
+        timings.info[name] = timings.info.get(name, 0) + amount
+
+
+def mark_failed():
+    """이번 스크래핑을 실패로 집계 (결과 없음)"""
+    timings = current()
+    if timings is not None:
+        timings.failed = True
+
+
+def percentile(samples, fraction):
+    """정렬된 표본의 백분위수 (최근접 순위)"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(samples):
+    """ms 표본 목록 → 건수/p50/p95/최대"""
+    return {
+        'count': len(samples),
+        'p50_ms': round(percentile(samples, 0.5), 2),
+        'p95_ms': round(percentile(samples, 0.95), 2),
+        'max_ms': round(max(samples), 2),
+    }
+
+
+class Timings:
+    """스크래핑 한 건의 단계별 시간 (ms) + 부가 정보"""
+
+    def __init__(self):
+        self.stages = {}
+        self.info = {}
+        self.total = None
+        self.failed = False
+        self._started = time.perf_counter()
+
+    def add_stage(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds * 1000
+
+    def finish(self):
+        self.total = (time.perf_counter() - self._started) * 1000
+
+    def as_dict(self):
+        """결과에 붙일 `_timings` 형식"""
+        timings = {'total_ms': round(self.total or 0.0, 2)}
+        timings.update(self.info)
+        timings['stages_ms'] = {name: round(ms, 2) for name, ms in self.stages.items()}
+        return timings
+
+
+class TimingAggregate:
+    """최근 스크래핑 시간 기록 모음 (스레드 안전)"""
+
+    def __init__(self, window=DEFAULT_WINDOW):
+        self._entries = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def add(self, url, timings, success=True):
+        with self._lock:
+            self._entries.append((url, host_of(url), success, timings.as_dict()))
+
+    def entries(self):
+        """최근 기록 [(URL, 호스트, 성공 여부, `_timings` dict)]"""
+        with self._lock:
+            return list(self._entries)
+
+    def summary(self, slowest=5):
+        """단계별/호스트별 p50/p95/최대 + 가장 느린 스크래핑"""
+        entries = self.entries()
+
+        stages = {}
+        hosts = {}
+        for url, host, success, timings in entries:
+            for name, ms in timings['stages_ms'].items():
+                stages.setdefault(name, []).append(ms)
+            host_entry = hosts.setdefault(host, {'totals': [], 'failures': 0, 'fetch_paths': {}})
+            host_entry['totals'].append(timings['total_ms'])
+            if not success:
+                host_entry['failures'] += 1
+            path = timings.get('fetch_path')
+            if path:
+                host_entry['fetch_paths'][path] = host_entry['fetch_paths'].get(path, 0) + 1
+
+        host_rows = []
+        for host, host_entry in hosts.items():
+            row = {'host': host}
+            row.update(summarize(host_entry['totals']))
+            row['failures'] = host_entry['failures']
+            row['fetch_paths'] = host_entry['fetch_paths']
+            host_rows.append(row)
+        host_rows.sort(key=lambda row: row['p95_ms'], reverse=True)
+
+        stage_rows = {name: summarize(samples) for name, samples in stages.items()}
+        recent = sorted(entries, key=lambda entry: entry[3]['total_ms'], reverse=True)[:slowest]
+        return {
+            'window': len(entries),
+            'stages': dict(sorted(stage_rows.items(), key=lambda item: item[1]['p95_ms'], reverse=True)),
+            'hosts': host_rows,
+            'slowest': [
+                {'url': url, 'success': success, 'timings': timings}
+                for url, host, success, timings in recent
+            ],
+        }
+
+
+class SharedTimingAggregate(TimingAggregate):
+    """여러 프로세스가 같이 쓰는 최근 스크래핑 시간 기록 (SQLite 파일, 최근 window건만 남김)"""
+
+    def __init__(self, path, window=DEFAULT_WINDOW):
+        super().__init__(window)
+        self.path = path
+        self.window = window
+        self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _init_db(self):
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_timings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                host TEXT,
+                success INTEGER NOT NULL,
+                timings TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def add(self, url, timings, success=True):
+        try:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    'INSERT INTO scrape_timings (url, host, success, timings) VALUES (?, ?, ?, ?)',
+                    (url, host_of(url), int(success), json.dumps(timings.as_dict(), ensure_ascii=False)),
+                )
+                conn.execute('DELETE FROM scrape_timings WHERE id <= ?', (cursor.lastrowid - self.window,))
+                conn.commit()
+            finally:
+                conn.close()
+        except Exception as e:
+            print(f"스크래핑 시간 기록 저장 실패: {str(e)}")
+
+    def entries(self):
+        conn = self._connect()
+        rows = conn.execute(
+            'SELECT url, host, success, timings FROM scrape_timings ORDER BY id DESC LIMIT ?', (self.window,)
+        ).fetchall()
+        conn.close()
+        return [(url, host, bool(success), json.loads(timings)) for url, host, success, timings in reversed(rows)]
+
+
+@contextmanager
+def record_timings(aggregate, url):
+    """with record_timings(aggregate, url) as timings: ... (aggregate가 None이면 기록 안 함, timings는 None)"""
+    if aggregate is None:
+        yield None
+        return
+
+    timings = Timings()
+    previous = current()
+    _local.timings = timings
+    try:
+        yield timings
+    except Exception:
+        timings.failed = True
+        raise
+    finally:
+        _local.timings = previous
+        timings.finish()
+        aggregate.add(url, timings, not timings.failed)
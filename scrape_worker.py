@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+🛠️ 스크래핑 워커 데몬
+웹 프로세스(gunicorn) 밖에서 스크래핑합니다. culture_log_app.py 가 SCRAPE_MODE=worker 로 돌면
+/api/scrape 는 작업을 SQLite 작업 큐(scrape_tasks.db)에 넣기만 하고, 이 프로세스가 꺼내서 처리한 뒤
+결과를 같은 파일에 써서 /api/scrape-status, /api/scrape-events 가 그대로 읽습니다.
+
+- 작업은 임대(lease)로 가져가고 스크래핑하는 동안 주기적으로 연장, 워커가 죽으면 임대가 끝난 뒤 다른 워커가 다시 가져감
+- 실패하면 task_store.MAX_JOB_ATTEMPTS번까지 점점 길게 기다렸다가 재시도
+- 같은 URL을 기다리는 작업은 한 번에 가져가서 한 번만 스크래핑
+- 처리량은 --concurrency(프로세스 안 스레드 수) 또는 워커 프로세스 수를 늘려서 조절
+- 저장된 공연 페이지 재확인(RescrapeScheduler)도 이 프로세스에서 (RESCRAPE_INTERVAL초마다, 0이면 끔),
+  웹 프로세스는 SCRAPE_MODE=worker면 재확인하지 않음
+- 스크래핑 메트릭(scrape_metrics)과 단계별 시간(SCRAPE_TIMINGS_DB)은 웹 프로세스와 같은 곳에 기록해서
+  /metrics, /api/scrape-timings 에 워커가 처리한 몫도 나옴
+
+사용법: python scrape_worker.py [--concurrency 2] [--once]
+"""
+
+import argparse
+import os
+import threading
+import uuid
+
+from http_cache import ResponseCache
+from rescrape_scheduler import RescrapeScheduler
+from scrape_metrics import observe_scrape
+from scrape_timings import SharedTimingAggregate, progress
+from task_store import ScrapeTaskStore, JOB_LEASE
+
+DEFAULT_TASK_DB = os.environ.get('SCRAPE_TASK_DB', 'scrape_tasks.db')
+DEFAULT_CONCURRENCY = int(os.environ.get('SCRAPE_WORKER_CONCURRENCY', '2'))
+DEFAULT_TIMINGS_DB = os.environ.get('SCRAPE_TIMINGS_DB', 'scrape_timings.db')
+DEFAULT_TIMINGS_WINDOW = int(os.environ.get('SCRAPE_TIMINGS_WINDOW', 500))
+# 재확인할 공연 기록 DB (culture_log_app.DATABASE와 같은 파일), 재확인 주기 (초, 0이면 끔)
+DEFAULT_CULTURE_LOG_DB = 'culture_log.db'
+DEFAULT_RESCRAPE_INTERVAL = int(os.environ.get('RESCRAPE_INTERVAL', 600))
+# 빈 큐를 다시 볼 간격, heartbeat 간격 (초)
+POLL_INTERVAL = 1.0
+HEARTBEAT_INTERVAL = 10
+
+
+class ScrapeWorker:
+    def __init__(self, scraper, store, concurrency=DEFAULT_CONCURRENCY, lease=JOB_LEASE):
+        self.scraper = scraper
+        self.store = store
+        self.concurrency = concurrency
+        self.lease = lease
+        self.worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+
+    def run_one(self):
+        """큐에서 URL 하나 처리, 처리했으면 True"""
+        job = self.store.claim_job(self.worker_id, self.lease)
+        if job is None:
+            return False
+        url, task_ids = job
+
+        # 스크래핑하는 동안 임대 연장
+        done = threading.Event()
+
+        def keep_lease():
+            while not done.wait(self.lease / 3):
+                self.store.extend_lease(task_ids, self.worker_id, self.lease)
+
+        threading.Thread(target=keep_lease, daemon=True).start()
+
+        def on_stage(name):
+            for task_id in task_ids:
+                self.store.set_stage(task_id, name)
+
+        try:
+            with progress(on_stage):
+                result = observe_scrape(self.scraper.scrape_concert_info, url)
+            if result is None:
+                self.store.retry_job(task_ids, '페이지 로딩 실패')
+            else:
+                for task_id in task_ids:
+                    self.store.finish(task_id, result)
+        except Exception as e:
+            print(f"스크래핑 실패 ({url}): {str(e)}")
+            self.store.retry_job(task_ids, str(e))
+        finally:
+            done.set()
+        return True
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                if not self.run_one():
+                    self._stop.wait(POLL_INTERVAL)
+            except Exception as e:
+                print(f"워커 오류: {str(e)}")
+                self._stop.wait(POLL_INTERVAL)
+
+    def run(self):
+        """stop()까지 concurrency개 스레드로 큐 처리"""
+        print(f"🛠️ 스크래핑 워커 시작: {self.worker_id} (스레드 {self.concurrency}개)")
+        threads = [threading.Thread(target=self._loop, daemon=True) for _ in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        try:
+            while not self._stop.is_set():
+                self.store.heartbeat(self.worker_id)
+                self._stop.wait(HEARTBEAT_INTERVAL)
+        except KeyboardInterrupt:
+            self.stop()
+        for thread in threads:
+            thread.join()
+
+    def run_until_empty(self):
+        """큐가 빌 때까지 처리한 수 반환 (--once)"""
+        self.store.heartbeat(self.worker_id)
+        processed = 0
+        while self.run_one():
+            processed += 1
+        return processed
+
+    def stop(self):
+        self._stop.set()
+
+
+def main():
+    from simple_scraper import SimpleConcertScraper
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', default=DEFAULT_TASK_DB, help='작업 큐 SQLite 파일 (웹앱의 SCRAPE_TASK_DB와 같아야 함)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--once', action='store_true', help='큐가 비면 끝내기')
+    args = parser.parse_args()
+
+    # 웹앱과 같은 응답 캐시 설정
+    scraper = SimpleConcertScraper(cache=ResponseCache(
+        'http_cache.db',
+        ttl=int(os.environ.get('SCRAPE_CACHE_TTL', 3600)),
+        max_bytes=int(os.environ.get('SCRAPE_CACHE_MAX_MB', 50)) * 1024 * 1024,
+    ), timings=SharedTimingAggregate(DEFAULT_TIMINGS_DB, DEFAULT_TIMINGS_WINDOW))
+    store = ScrapeTaskStore(args.db, ttl=int(os.environ.get('SCRAPE_RESULT_TTL', 3600)))
+    worker = ScrapeWorker(scraper, store, concurrency=args.concurrency)
+    if args.once:
+        print(f"📊 처리한 URL {worker.run_until_empty()}개")
+    else:
+        if DEFAULT_RESCRAPE_INTERVAL > 0:
+            RescrapeScheduler(scraper, DEFAULT_CULTURE_LOG_DB).start(DEFAULT_RESCRAPE_INTERVAL)
+        worker.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -3,107 +3,182 @@
 🎼 간단한 클래식 공연 정보 스크래퍼 (Selenium 없이)
 """
 
-import requests
-from bs4 import BeautifulSoup
 import re
 import json
 from datetime import datetime
+from page_parser import parse_html
+from site_adapters import FIELDS, extract_site_fields
+from polite_fetch import PoliteSession
+from batch_scraper import scrape_many, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT
+from scrape_timings import record_timings, stage, note, count, mark_failed
+from extraction import TextScanner, load_keywords, role_patterns, finditer_at, search_at, search_before, line_before
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+# ---- 추출 패턴 (import 시점에 한 번만 컴파일) ----
+TITLE_SKIP_WORDS = ['공연정보', 'lotte', 'sac', '예매']
+TITLE_SELECTORS = ['h1', 'title', '.concert_title', '.performance_title']
+
+# 롯데콘서트홀 특정 패턴
+TITLE_NAMED_PATTERN = re.compile(r'정명훈\s*&\s*원\s*코리아\s*오케스트라\s*<[^>]+>')
+TITLE_BRACKET_PATTERN = re.compile(r'[가-힣\w\s&,.]+<[가-힣\w\s]+>')
+TITLE_BRACKET_STOP = re.compile(r'[^가-힣\w\s&,.]')
+TITLE_PLAIN_PATTERN = re.compile(r'[가-힣\w \t&,.]{10,100}')
+
+DATE_PATTERNS = [
+    re.compile(r'2025[-\.]\d{1,2}[-\.]\d{1,2}\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}'),
+    re.compile(r'2025년\s*\d{1,2}월\s*\d{1,2}일\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}'),
+    re.compile(r'2025[-\.]\d{1,2}[-\.]\d{1,2}'),
+    re.compile(r'2025년\s*\d{1,2}월\s*\d{1,2}일'),
+]
+
+# 키워드 사전 (keywords.json)
+KEYWORDS = load_keywords()
+
+VENUES = KEYWORDS['venues']
+
+# 롯데콘서트홀 형식: "역할 | 이름" — (패턴, 역할, 시작 키워드)
+ROLE_NAME_PATTERN = r'([가-힣\s]+(?:\([A-Za-z\s\-]+\))?)'
+ROLE_PATTERNS = role_patterns(KEYWORDS['roles'], ROLE_NAME_PATTERN, overrides={
+    '연주': r'([가-힣\s\w]+(?:\([A-Za-z\s\-]+\))?)',
+    '합창': r'([가-힣\s\w,]+)',
+})
+
+# 베토벤 교향곡 제9번 특별 패턴 — (패턴, 후보 종류, 시작 키워드)
+BEETHOVEN_PATTERNS = [
+    (re.compile(r'베토벤\s*교향곡\s*제\s*9번[^\n]{0,50}', re.IGNORECASE), 'composer', '베토벤'),
+    (re.compile(r'Beethoven\s*Symphony\s*No\.?\s*9[^\n]{0,50}', re.IGNORECASE), 'composer', 'Beethoven'),
+    (re.compile(r'교향곡\s*제\s*9번[^\n]*(?:합창|Choral)', re.IGNORECASE), 'symphony', '교향곡'),
+]
+
+# 일반적인 작곡가 패턴
+COMPOSERS = KEYWORDS['composers']
+COMPOSER_PATTERNS = [
+    (composer, re.compile(rf'{re.escape(composer)}[^\n]{{10,80}}', re.IGNORECASE)) for composer in COMPOSERS
+]
+PROGRAM_SKIP_WORDS = ['가격', 'price', '티켓']
+
+# 좌석별 가격 패턴 — (패턴, 후보 종류)
+SEAT_PATTERNS = [
+    (re.compile(r'[RSABCVIP]+석\s*[:\s]*[\d,]+원'), 'seat'),
+    (re.compile(r'[RSABCVIP]+\s*[:\s]*[\d,]+원'), 'seat'),
+    (re.compile(r'(?:전석|일반|학생)\s*[:\s]*[\d,]+원'), 'seat_grade'),
+    (re.compile(r'시야방해[RSAB]*\s*[:\s]*[\d,]+원'), 'obstructed'),
+]
+
+# 본문 한 번 훑기로 모든 추출기의 후보 위치 수집
+SCANNER = TextScanner(
+    patterns={
+        'bracket': '<',
+        'date': r'2025[-\.년]',
+        'seat': r'[RSABCVIP]+(?=석|[\s:]*[\d,]+원)',
+    },
+    keywords={
+        'title_name': ['정명훈'],
+        'venue': VENUES,
+        'role': [literal for _, _, literal in ROLE_PATTERNS],
+        'symphony': ['교향곡'],
+        'seat_grade': ['전석', '일반', '학생'],
+        'obstructed': ['시야방해'],
+    },
+    ci_keywords={
+        'composer': COMPOSERS,
+    },
+)
 
 class SimpleConcertScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+    def __init__(self, cache=None, parser=None, timings=None, throttle=None):
+        # 호스트별 속도/동시성 제한 + 재시도 (throttle이 없으면 프로세스 안의 모든 스크래퍼가 공유하는 기본 제한)
+        self.session = PoliteSession(throttle=throttle)
+        self.session.headers.update(DEFAULT_HEADERS)
+        # http_cache.ResponseCache (None이면 캐시 없이 매번 다운로드)
+        self.cache = cache
+        # HTML 파서 백엔드 (None이면 page_parser.DEFAULT_BACKEND)
+        self.parser = parser
+        # scrape_timings.TimingAggregate (있으면 결과에 `_timings`를 붙이고 집계에 추가)
+        self.timings = timings
 
     def get_page_content(self, url):
         """페이지 콘텐츠 가져오기"""
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            return response.text
+            with stage('fetch'):
+                if self.cache:
+                    html_content, source = self.cache.fetch_with_source(self.session, url, timeout=15)
+                else:
+                    response = self.session.get(url, timeout=15)
+                    response.raise_for_status()
+                    html_content, source = response.text, 'network'
         except Exception as e:
             print(f"페이지 로딩 실패: {str(e)}")
             return None
 
-    def extract_title(self, soup, text):
+        note(fetch_path=source)
+        if source == 'network':
+            count('bytes', len(html_content.encode('utf-8')))
+        return html_content
+
+    def extract_title(self, page, text, index=None):
         """공연 제목 추출"""
-        # 롯데콘서트홀 특정 패턴
-        title_patterns = [
-            r'정명훈\s*&\s*원\s*코리아\s*오케스트라\s*<[^>]+>',
-            r'[가-힣\w\s&,.]+<[가-힣\w\s]+>',
-            r'[가-힣\w\s&,.]{10,100}'
+        index = index or SCANNER.scan(text)
+
+        # 롯데콘서트홀 특정 패턴 → "... <...>" 패턴 → 첫 날짜 바로 윗줄 (검색 결과/목록) → 일반 텍스트 순서
+        candidates = [
+            search_at(TITLE_NAMED_PATTERN, text, index.positions('title_name')),
+            search_before(TITLE_BRACKET_PATTERN, text, index.positions('bracket'), stop_class=TITLE_BRACKET_STOP),
+            line_before(text, index.positions('date')),
+            TITLE_PLAIN_PATTERN.search(text),
         ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, text)
+
+        for match in candidates:
             if match:
                 title = match.group().strip()
-                if len(title) > 5 and not any(skip in title.lower() for skip in ['공연정보', 'lotte', 'sac', '예매']):
+                if len(title) > 5 and not any(skip in title.lower() for skip in TITLE_SKIP_WORDS):
                     return title
         
         # HTML 태그에서 찾기
-        title_selectors = ['h1', 'title', '.concert_title', '.performance_title']
-        for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text().strip()
-                if len(title) > 5 and not any(skip in title.lower() for skip in ['공연정보', 'lotte', 'sac', '예매']):
+        for selector in TITLE_SELECTORS:
+            element_text = page.select_text(selector)
+            if element_text:
+                title = element_text.strip()
+                if len(title) > 5 and not any(skip in title.lower() for skip in TITLE_SKIP_WORDS):
                     return title
                     
         return "제목 추출 실패"
 
-    def extract_date_time(self, text):
+    def extract_date_time(self, text, index=None):
         """날짜 및 시간 추출"""
-        date_patterns = [
-            r'2025[-\.]\d{1,2}[-\.]\d{1,2}\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}',
-            r'2025년\s*\d{1,2}월\s*\d{1,2}일\s*\([월화수목금토일]\)\s*\d{1,2}:\d{2}',
-            r'2025[-\.]\d{1,2}[-\.]\d{1,2}',
-            r'2025년\s*\d{1,2}월\s*\d{1,2}일'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
+        index = index or SCANNER.scan(text)
+
+        for pattern in DATE_PATTERNS:
+            match = search_at(pattern, text, index.positions('date'))
             if match:
                 return match.group().strip()
                 
         return ""
 
-    def extract_venue(self, text):
+    def extract_venue(self, text, index=None):
         """공연장 추출"""
-        venues = [
-            '롯데콘서트홀', '예술의전당', 'SAC', '세종문화회관', '통영국제음악당',
-            'LG아트센터', '금호아트홀', '블루스퀘어', 'IBK챔버홀', '리사이틀홀'
-        ]
-        
-        for venue in venues:
-            if venue in text:
+        index = index or SCANNER.scan(text)
+
+        for venue in VENUES:
+            if index.found('venue', venue):
                 return venue
                     
         return ""
 
-    def extract_performers(self, text):
+    def extract_performers(self, text, index=None):
         """출연진 정보 추출"""
+        index = index or SCANNER.scan(text)
         performers = []
         
-        # 롯데콘서트홀 형식: "역할 | 이름"
-        role_patterns = [
-            (r'지휘\s*[|│]\s*([가-힣\s]+(?:\([A-Za-z\s\-]+\))?)', '지휘'),
-            (r'소프라노\s*[|│]\s*([가-힣\s]+(?:\([A-Za-z\s\-]+\))?)', '소프라노'),
-            (r'메조\s*소프라노\s*[|│]\s*([가-힣\s]+(?:\([A-Za-z\s\-]+\))?)', '메조소프라노'),
-            (r'테너\s*[|│]\s*([가-힣\s]+(?:\([A-Za-z\s\-]+\))?)', '테너'),
-            (r'바리톤\s*[|│]\s*([가-힣\s]+(?:\([A-Za-z\s\-]+\))?)', '바리톤'),
-            (r'연주\s*[|│]\s*([가-힣\s\w]+(?:\([A-Za-z\s\-]+\))?)', '연주'),
-            (r'합창\s*[|│]\s*([가-힣\s\w,]+)', '합창'),
-        ]
-        
-        for pattern, role in role_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, role, literal in ROLE_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions('role', literal)):
                 name = match.group(1).strip()
                 if name and len(name) > 1:
                     performer_info = f"{name} - {role}"
@@ -112,55 +187,36 @@ class SimpleConcertScraper:
         
         return performers[:12]  # 최대 12명
 
-    def extract_program(self, text):
+    def extract_program(self, text, index=None):
         """프로그램 정보 추출"""
+        index = index or SCANNER.scan(text)
         programs = []
         
         # 베토벤 교향곡 제9번 특별 패턴
-        beethoven_patterns = [
-            r'베토벤\s*교향곡\s*제\s*9번[^\n]{0,50}',
-            r'Beethoven\s*Symphony\s*No\.?\s*9[^\n]{0,50}',
-            r'교향곡\s*제\s*9번[^\n]*(?:합창|Choral)',
-        ]
-        
-        for pattern in beethoven_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern, kind, literal in BEETHOVEN_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions(kind, literal)):
                 program = match.group().strip()
                 if program not in programs:
                     programs.append(program)
         
         # 일반적인 작곡가 패턴
-        composers = [
-            'Rachmaninoff', 'Beethoven', 'Mozart', 'Bach', 'Brahms', 'Chopin', 
-            '라흐마니노프', '베토벤', '모차르트', '바흐', '브람스', '쇼팽'
-        ]
-        
-        for composer in composers:
-            pattern = rf'{composer}[^\n]{{10,80}}'
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for composer, pattern in COMPOSER_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions('composer', composer)):
                 program = match.group().strip()
                 if len(program) > 10 and len(program) < 120:
-                    if not any(skip in program.lower() for skip in ['가격', 'price', '티켓']) and program not in programs:
+                    if not any(skip in program.lower() for skip in PROGRAM_SKIP_WORDS) and program not in programs:
                         programs.append(program)
         
         return programs[:8]  # 최대 8개
 
-    def extract_price(self, text):
+    def extract_price(self, text, index=None):
         """가격 정보 추출"""
+        index = index or SCANNER.scan(text)
         prices = []
         
         # 좌석별 가격 패턴
-        seat_patterns = [
-            r'[RSABCVIP]+석\s*[:\s]*[\d,]+원',
-            r'[RSABCVIP]+\s*[:\s]*[\d,]+원',
-            r'시야방해[RSAB]*\s*[:\s]*[\d,]+원'
-        ]
-        
-        for pattern in seat_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, kind in SEAT_PATTERNS:
+            for match in finditer_at(pattern, text, index.positions(kind)):
                 price = match.group().strip()
                 if price not in prices:
                     prices.append(price)
@@ -170,33 +226,60 @@ class SimpleConcertScraper:
     def scrape_concert_info(self, url):
         """공연 정보 스크래핑"""
         print(f"🔍 스크래핑 중: {url}")
-        
-        html_content = self.get_page_content(url)
-        if not html_content:
-            return None
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 스크립트와 스타일 태그 제거
-        for script in soup(["script", "style"]):
-            script.decompose()
-            
-        text_content = soup.get_text()
-        
+
+        with record_timings(self.timings, url) as timings:
+            html_content = self.get_page_content(url)
+            concert_info = self.parse_concert_info(url, html_content) if html_content else None
+            if concert_info is None:
+                mark_failed()
+
+        if timings and concert_info:
+            concert_info['_timings'] = timings.as_dict()
+        return concert_info
+
+    def parse_concert_info(self, url, html_content):
+        """이미 받아온 HTML에서 공연 정보 추출 (네트워크 없음)"""
+        # 파싱 + script/style/nav/footer/메뉴 가지치기
+        with stage('parse'):
+            page = parse_html(html_content, self.parser)
+        note(html_length=len(html_content))
+
+        # 사이트 어댑터: 알려진 DOM 노드의 작은 조각에서만 추출
+        fields = extract_site_fields(self, url, page)
+
+        # 어댑터가 없거나 못 찾은 필드만 본문 전체에서 범용 추출
+        missing = [field for field in FIELDS if field not in fields]
+        if missing:
+            with stage('text'):
+                text_content = page.text
+            note(text_length=len(text_content))
+            with stage('scan'):
+                index = SCANNER.scan(text_content)
+            generic = {
+                'title': lambda: self.extract_title(page, text_content, index),
+                'date': lambda: self.extract_date_time(text_content, index),
+                'venue': lambda: self.extract_venue(text_content, index),
+                'performers': lambda: self.extract_performers(text_content, index),
+                'program': lambda: self.extract_program(text_content, index),
+                'price': lambda: self.extract_price(text_content, index),
+            }
+            for field in missing:
+                with stage(f'extract_{field}'):
+                    fields[field] = generic[field]()
+
         # 정보 추출
         concert_info = {
             'url': url,
             'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'title': self.extract_title(soup, text_content),
-            'date': self.extract_date_time(text_content),
-            'venue': self.extract_venue(text_content),
-            'performers': self.extract_performers(text_content),
-            'program': self.extract_program(text_content),
-            'price': self.extract_price(text_content)
         }
+        concert_info.update((field, fields[field]) for field in FIELDS)
         
         return concert_info
 
+    def scrape_many(self, urls, max_workers=DEFAULT_MAX_WORKERS, per_host_limit=DEFAULT_PER_HOST_LIMIT):
+        """여러 공연 URL 동시 스크래핑 (끝나는 순서대로 결과 반환)"""
+        return scrape_many(self, urls, max_workers=max_workers, per_host_limit=per_host_limit)
+
     def close(self):
         """리소스 정리 (Selenium 없으므로 필요 없음)"""
         pass
\ No newline at end of file
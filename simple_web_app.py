@@ -8,30 +8,30 @@ from simple_scraper import SimpleConcertScraper
 import json
 import os
 from datetime import datetime
-import threading
-import time
+from scrape_executor import ScrapeExecutor, ScrapeQueueFull, new_task_id
+from task_registry import TaskRegistry
 
 app = Flask(__name__)
 
 # 전역 스크래퍼 인스턴스
 scraper = SimpleConcertScraper()
 
-# 스크래핑 결과를 저장할 전역 변수
-scraping_results = {}
-scraping_status = {}
+# 스크래핑 상태/결과 (항목 수, 크기, 끝난 뒤 보관 시간 제한)
+scraping_tasks = TaskRegistry()
 
-def scrape_async(task_id, url):
-    """비동기 스크래핑 함수"""
-    global scraping_results, scraping_status
-    
-    try:
-        scraping_status[task_id] = "진행중"
-        result = scraper.scrape_concert_info(url)
-        scraping_results[task_id] = result
-        scraping_status[task_id] = "완료"
-    except Exception as e:
-        scraping_results[task_id] = None
-        scraping_status[task_id] = f"오류: {str(e)}"
+def task_listener(task_id):
+    """실행기 알림 → 작업 상태/결과 기록"""
+    def listener(event, payload):
+        if event == 'started':
+            scraping_tasks.set_status(task_id, "진행중")
+        elif event == 'done':
+            scraping_tasks.finish(task_id, "완료", payload)
+        elif event == 'error':
+            scraping_tasks.finish(task_id, f"오류: {payload}")
+    return listener
+
+# 고정 크기 워커 풀 (같은 URL 동시 요청은 한 번만 스크래핑)
+scrape_executor = ScrapeExecutor(scraper.scrape_concert_info)
 
 @app.route('/')
 def index():
@@ -51,22 +51,26 @@ def scrape_api():
         return jsonify({'error': '올바른 URL을 입력해주세요.'}), 400
     
     # 작업 ID 생성
-    task_id = f"task_{int(time.time() * 1000)}"
+    task_id = new_task_id()
     
-    # 비동기로 스크래핑 시작
-    thread = threading.Thread(target=scrape_async, args=(task_id, url))
-    thread.daemon = True
-    thread.start()
+    # 비동기로 스크래핑 시작 (자리가 없으면 429)
+    scraping_tasks.set_status(task_id, "대기중")
+    try:
+        scrape_executor.submit(url, task_listener(task_id))
+    except ScrapeQueueFull as e:
+        scraping_tasks.discard(task_id)
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
     
     return jsonify({'task_id': task_id})
 
 @app.route('/api/status/<task_id>')
 def get_status(task_id):
     """스크래핑 상태 확인"""
-    status = scraping_status.get(task_id, "알 수 없음")
+    status, result = scraping_tasks.get(task_id)
     
     if status == "완료":
-        result = scraping_results.get(task_id)
         return jsonify({
             'status': status,
             'result': result
@@ -76,6 +80,11 @@ def get_status(task_id):
             'status': status
         })
 
+@app.route('/api/tasks')
+def get_task_stats():
+    """메모리에 있는 작업 수/크기와 삭제 통계"""
+    return jsonify(scraping_tasks.stats())
+
 @app.route('/api/save', methods=['POST'])
 def save_result():
     """결과를 JSON 파일로 저장"""
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+🏛️ 사이트별 어댑터 레지스트리
+URL 호스트로 공연장 사이트 어댑터를 골라, 알려진 DOM 노드(제목/정보 표/출연진/프로그램)의 텍스트만 꺼냅니다.
+스크래퍼의 정규식 추출기는 그 작은 조각에서만 돌리고,
+어댑터가 없는 사이트나 노드를 못 찾은 필드만 예전처럼 본문 전체에서 범용 추출합니다.
+
+새 사이트 추가: SiteAdapter를 상속해 hosts와 선택자를 채우고 @register_adapter 를 붙이세요.
+시즌 목록 크롤링(catalog_crawler.py)까지 하려면 listing_urls와 detail_id_pattern/detail_url도 채우세요.
+"""
+
+from batch_scraper import host_of
+from scrape_timings import stage
+
+FIELDS = ['title', 'date', 'venue', 'performers', 'program', 'price']
+
+# 등록된 어댑터 목록
+ADAPTERS = []
+
+
+def register_adapter(adapter_class):
+    """어댑터 클래스 등록 (데코레이터)"""
+    ADAPTERS.append(adapter_class())
+    return adapter_class
+
+
+def find_adapter(url):
+    """URL 호스트에 맞는 어댑터 (없으면 None)"""
+    host = host_of(url)
+    for adapter in ADAPTERS:
+        if any(host == name or host.endswith('.' + name) for name in adapter.hosts):
+            return adapter
+    return None
+
+
+def extract_site_fields(scraper, url, page):
+    """어댑터로 찾은 필드만 담은 dict (어댑터가 없으면 빈 dict)"""
+    adapter = find_adapter(url)
+    if not adapter:
+        return {}
+
+    try:
+        return adapter.extract(scraper, page)
+    except Exception as e:
+        print(f"사이트 어댑터 추출 실패 ({adapter.name}): {str(e)}")
+        return {}
+
+
+def clean(text):
+    """연속 공백/줄바꿈을 공백 하나로"""
+    return ' '.join(text.split())
+
+
+class SiteAdapter:
+    """사이트 어댑터 기본 클래스: 필드별 CSS 선택자만 정하면 됨"""
+
+    name = 'base'
+    hosts = ()
+    # 렌더링 대기 조건: 이 노드가 나타나면 페이지 준비 완료
+    ready_selector = None
+    # 사이트가 공연 데이터를 불러오는 JSON API 주소 템플릿 (fetch_strategy.api_url_for 형식, 없으면 None)
+    # 있으면 정적 HTML이 빈 껍데기일 때 브라우저보다 먼저 시도함
+    api_url = None
+    # 공연 제목 노드
+    title_selector = None
+    # 정보 표의 항목 이름/값 노드 (같은 순서로 짝지음)와 필드별 항목 이름
+    label_selector = None
+    value_selector = None
+    labels = {}
+    # 출연진/프로그램 줄 노드
+    performers_selector = None
+    program_selector = None
+    # 시즌 목록/달력 페이지 (크롤러 시작점)
+    listing_urls = ()
+    # 목록 페이지에서 따라갈 다른 목록 페이지 링크 (페이지 넘김 등, href 정규식)
+    listing_link_pattern = None
+    # 목록 HTML 전체에서 상세 페이지 ID를 찾는 정규식 (그룹 1)과 정규화된 상세 URL 템플릿
+    detail_id_pattern = None
+    detail_url = None
+
+    def fragments(self, page):
+        """필드별 텍스트 조각 목록 {필드: [텍스트, ...]}"""
+        fragments = {}
+        if self.title_selector:
+            title = page.select_text(self.title_selector)
+            if title:
+                fragments['title'] = [title]
+
+        if self.label_selector and self.value_selector:
+            labels = [clean(label) for label in page.select_texts(self.label_selector)]
+            rows = dict(zip(labels, page.select_texts(self.value_selector)))
+            for field, label in self.labels.items():
+                if label in rows:
+                    fragments[field] = [rows[label]]
+
+        if self.performers_selector:
+            fragments['performers'] = page.select_texts(self.performers_selector)
+        if self.program_selector:
+            fragments['program'] = page.select_texts(self.program_selector)
+        return fragments
+
+    def extract(self, scraper, page):
+        """조각에서 필드 추출 (스크래퍼의 추출기를 조각에만 적용, 비어 있는 필드는 빼고 반환)"""
+        fields = {}
+        with stage('adapter_select'):
+            fragments = self.fragments(page)
+        for field, texts in fragments.items():
+            lines = [clean(text) for text in texts]
+            lines = [line for line in lines if line]
+            if not lines:
+                continue
+
+            with stage(f'extract_{field}'):
+                value = self.extract_field(scraper, field, lines)
+            if value:
+                fields[field] = value
+        return fields
+
+    def extract_field(self, scraper, field, lines):
+        """필드 하나의 조각 줄들에서 값 추출"""
+        if field in ('title', 'venue'):
+            return lines[0]
+        if field == 'date':
+            return scraper.extract_date_time(lines[0])
+        if field == 'price':
+            return scraper.extract_price(' '.join(lines))
+        if field == 'performers':
+            # 줄마다 따로 돌려서 "역할 | 이름" 패턴이 다음 줄로 넘어가지 않게 함
+            performers = []
+            for line in lines:
+                for performer in scraper.extract_performers(line):
+                    if performer not in performers:
+                        performers.append(performer)
+            return performers
+        return list(dict.fromkeys(lines))
+
+
+@register_adapter
+class LotteConcertHallAdapter(SiteAdapter):
+    name = 'lotteconcerthall'
+    hosts = ('lotteconcerthall.com',)
+    ready_selector = '.concert_info .tit_area .tit'
+    title_selector = '.concert_info .tit_area .tit'
+    label_selector = '.concert_info .info_list .label'
+    value_selector = '.concert_info .info_list .cont'
+    labels = {'date': '공연일시', 'venue': '공연장소', 'price': '티켓가격'}
+    performers_selector = '.performer_info p'
+    program_selector = '.program_info p'
+    listing_urls = ('https://www.lotteconcerthall.com/kor/Performance/Index',)
+    listing_link_pattern = r'/kor/Performance/Index\?[^"\'#\s]*'
+    detail_id_pattern = r'ConcertDetails/(\d+)'
+    detail_url = 'https://www.lotteconcerthall.com/kor/Performance/ConcertDetails/{id}'
+
+
+@register_adapter
+class SacAdapter(SiteAdapter):
+    name = 'sac'
+    hosts = ('sac.or.kr',)
+    ready_selector = '.show_info .show_title'
+    title_selector = '.show_info .show_title'
+    label_selector = '.show_info .show_detail dt'
+    value_selector = '.show_info .show_detail dd'
+    labels = {'date': '기간', 'venue': '장소', 'price': '가격'}
+    # 공연소개 탭 안에 "[출연]", "[프로그램]" 소제목으로 나뉘어 있음
+    detail_selector = '#tab1 .detail_txt p'
+    sections = {'출연': 'performers', '프로그램': 'program'}
+    listing_urls = ('https://www.sac.or.kr/site/main/show/list',)
+    listing_link_pattern = r'/site/main/show/list\?[^"\'#\s]*'
+    detail_id_pattern = r'show_view\?(?:[^"\'\s]*?&(?:amp;)?)?SN=(\d+)'
+    detail_url = 'https://www.sac.or.kr/site/main/show/show_view?SN={id}'
+
+    def fragments(self, page):
+        fragments = super().fragments(page)
+        field = None
+        for text in page.select_texts(self.detail_selector):
+            line = clean(text)
+            if line.startswith('[') and line.endswith(']'):
+                field = self.sections.get(line[1:-1].strip())
+            elif field and line and not line.startswith('※'):
+                fragments.setdefault(field, []).append(line)
+        return fragments
+
+
+@register_adapter
+class SejongPacAdapter(SiteAdapter):
+    name = 'sejongpac'
+    hosts = ('sejongpac.or.kr',)
+    ready_selector = '.perform_detail .perform_title'
+    title_selector = '.perform_detail .perform_title'
+    label_selector = '.perform_detail .perform_info th'
+    value_selector = '.perform_detail .perform_info td'
+    labels = {'date': '공연기간', 'venue': '공연장소', 'price': '티켓가격'}
+    performers_selector = '.perform_cast p'
+    program_selector = '.perform_program p'
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🗃️ 프로세스 메모리용 스크래핑 작업 목록 (web_app.py / simple_web_app.py)
+작업 ID별 상태와 결과를 메모리에 두되, 계속 스크래핑해도 메모리가 일정하게 유지되도록 제한합니다.
+- 끝난(완료/오류) 작업은 ttl초 뒤 삭제
+- 항목 수가 max_entries, 결과 크기(JSON 바이트) 합이 max_bytes를 넘으면 가장 오래 안 본 작업부터 삭제
+  (진행 중인 작업은 끝난 작업을 모두 지운 뒤에야 삭제)
+- stats()로 현재 크기와 이유별 삭제 수 확인
+
+culture_log_app.py 는 워커끼리 공유하는 SQLite 저장소(task_store.py)를 씁니다.
+환경변수: SCRAPE_TASKS_MAX(기본 1000), SCRAPE_TASKS_MAX_MB(20), SCRAPE_TASKS_TTL(3600초)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get('SCRAPE_TASKS_MAX', '1000'))
+DEFAULT_MAX_BYTES = int(os.environ.get('SCRAPE_TASKS_MAX_MB', '20')) * 1024 * 1024
+DEFAULT_TTL = int(os.environ.get('SCRAPE_TASKS_TTL', '3600'))
+UNKNOWN_STATUS = "알 수 없음"
+
+
+def result_size(result):
+    """결과가 차지하는 대략적인 크기 (JSON 바이트)"""
+    if result is None:
+        return 0
+    return len(json.dumps(result, ensure_ascii=False).encode('utf-8'))
+
+
+class TaskRegistry:
+    """작업 ID → 상태/결과 (스레드 안전, 항목 수/바이트/TTL 제한)"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        # 작업 ID → {'status', 'result', 'size'} (오래 안 본 순서)
+        self._tasks = OrderedDict()
+        # 끝난 작업 ID → 끝난 시각 (끝난 순서, TTL 삭제용)
+        self._finished = OrderedDict()
+        self._bytes = 0
+        self._evicted = {'ttl': 0, 'entries': 0, 'bytes': 0}
+        self._lock = threading.Lock()
+
+    def set_status(self, task_id, status):
+        """진행 중 상태 기록 (대기중/진행중)"""
+        with self._lock:
+            self._put(task_id, status, None)
+            self._finished.pop(task_id, None)
+            self._enforce_limits()
+
+    def finish(self, task_id, status, result=None):
+        """끝난 상태와 결과 기록 (완료/오류), ttl 카운트 시작"""
+        with self._lock:
+            self._put(task_id, status, result)
+            self._finished.pop(task_id, None)
+            self._finished[task_id] = time.monotonic()
+            self._enforce_limits()
+
+    def get(self, task_id):
+        """(상태, 결과) (없거나 지워졌으면 ('알 수 없음', None))"""
+        with self._lock:
+            self._expire()
+            entry = self._tasks.get(task_id)
+            if entry is None:
+                return UNKNOWN_STATUS, None
+            self._tasks.move_to_end(task_id)
+            return entry['status'], entry['result']
+
+    def discard(self, task_id):
+        with self._lock:
+            self._remove(task_id)
+
+    def stats(self):
+        """현재 항목 수/바이트와 이유별 삭제 수"""
+        with self._lock:
+            self._expire()
+            return {
+                'entries': len(self._tasks),
+                'running': len(self._tasks) - len(self._finished),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'evicted': dict(self._evicted),
+            }
+
+    def __len__(self):
+        with self._lock:
+            return len(self._tasks)
+
+    def _put(self, task_id, status, result):
+        size = result_size(result)
+        previous = self._tasks.pop(task_id, None)
+        if previous is not None:
+            self._bytes -= previous['size']
+        self._tasks[task_id] = {'status': status, 'result': result, 'size': size}
+        self._bytes += size
+
+    def _remove(self, task_id):
+        entry = self._tasks.pop(task_id, None)
+        self._finished.pop(task_id, None)
+        if entry is not None:
+            self._bytes -= entry['size']
+        return entry is not None
+
+    def _expire(self):
+        """ttl이 지난 끝난 작업 삭제 (끝난 순서라 앞에서부터만 보면 됨)"""
+        deadline = time.monotonic() - self.ttl
+        while self._finished:
+            task_id, finished_at = next(iter(self._finished.items()))
+            if finished_at > deadline:
+                break
+            self._remove(task_id)
+            self._evicted['ttl'] += 1
+
+    def _enforce_limits(self):
+        self._expire()
+        while len(self._tasks) > self.max_entries:
+            self._remove(self._victim())
+            self._evicted['entries'] += 1
+        while self._bytes > self.max_bytes and self._tasks:
+            self._remove(self._victim())
+            self._evicted['bytes'] += 1
+
+    def _victim(self):
+        """지울 작업: 가장 오래 안 본 끝난 작업, 없으면 가장 오래 안 본 작업"""
+        for task_id in self._tasks:
+            if task_id in self._finished:
+                return task_id
+        return next(iter(self._tasks))
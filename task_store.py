@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+📋 스크래핑 작업 상태/결과 공유 저장소
+작업 ID별 상태와 추출 결과를 SQLite 파일에 저장해서 gunicorn 워커 여러 개가 함께 씁니다.
+- /api/scrape-status 요청이 작업을 시작하지 않은 워커로 가도 상태/결과를 찾을 수 있음
+- 정규화한 URL로 최근(ttl 안) 성공 결과를 찾아서 같은 공연을 다시 스크래핑하지 않음
+- ttl이 지난 작업은 새 작업을 만들 때 함께 지움
+- 진행 단계(대기 → 가져오기 → 렌더링 → 추출 → 완료/오류)를 함께 저장하고, wait()로 바뀔 때까지 기다릴 수 있음
+  (이 프로세스에서 바뀌면 바로 깨어나고, 다른 워커에서 바뀐 것은 WAIT_POLL_INTERVAL마다 다시 읽어서 확인)
+- job=True로 만든 작업은 작업 큐 항목: 별도 프로세스(scrape_worker.py)가 claim_job으로 임대(lease)해서
+  처리하고, 임대가 끝나도록 소식이 없으면(워커가 죽으면) 다른 워커가 다시 가져감, 실패하면 MAX_JOB_ATTEMPTS번까지 재시도
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+DEFAULT_TASK_STORE_PATH = 'scrape_tasks.db'
+DEFAULT_TTL = 60 * 60  # 1시간
+
+# 상태 값 (템플릿이 '완료' / '오류...' 로 구분)
+STATUS_QUEUED = '대기중'
+STATUS_RUNNING = '진행중'
+STATUS_DONE = '완료'
+STATUS_UNKNOWN = '알 수 없음'
+ERROR_PREFIX = '오류: '
+
+# 진행 단계 (SSE/롱폴링으로 전달)
+STAGE_QUEUED = 'queued'
+STAGE_FETCHING = 'fetching'
+STAGE_RENDERING = 'rendering'
+STAGE_EXTRACTING = 'extracting'
+STAGE_DONE = 'done'
+STAGE_ERROR = 'error'
+FINAL_STAGES = {STAGE_DONE, STAGE_ERROR}
+# 다른 워커가 바꾼 상태를 다시 읽는 간격 (초)
+WAIT_POLL_INTERVAL = 0.5
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# 작업 큐: 한 번 가져간 워커가 이 시간 안에 임대를 연장하지 않으면 죽은 것으로 보고 다시 줌 (초)
+JOB_LEASE = 120
+MAX_JOB_ATTEMPTS = 3
+# 재시도 대기 (초, 시도마다 두 배)
+JOB_RETRY_DELAY = 30
+# 이 시간 안에 heartbeat가 있는 워커만 살아 있는 것으로 봄 (초)
+WORKER_ALIVE_WINDOW = 30
+# 큐 관련 열 (예전 파일에는 없으면 추가)
+EXTRA_COLUMNS = {
+    'stage': 'TEXT',
+    'source_url': 'TEXT',
+    'job': 'INTEGER NOT NULL DEFAULT 0',
+    'attempts': 'INTEGER NOT NULL DEFAULT 0',
+    'available_at': 'REAL NOT NULL DEFAULT 0',
+    'lease_until': 'REAL',
+    'worker_id': 'TEXT',
+}
+
+
+def normalize_url(url):
+    """같은 페이지를 가리키는 URL을 하나로 (스킴/호스트 소문자, 기본 포트/프래그먼트 제거, 쿼리 정렬)"""
+    parts = urlsplit((url or '').strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f'{host}:{parts.port}'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+def stage_of(status, default=STAGE_QUEUED):
+    """상태 문자열에 딸린 단계 (완료 → done, 오류 → error)"""
+    if status == STATUS_DONE:
+        return STAGE_DONE
+    if status.startswith(ERROR_PREFIX):
+        return STAGE_ERROR
+    return default
+
+
+class ScrapeTaskStore:
+    def __init__(self, path=DEFAULT_TASK_STORE_PATH, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        # 이 프로세스 안에서 상태가 바뀌면 wait() 중인 스레드를 깨움
+        self._changed = threading.Condition()
+        self._init_db()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _init_db(self):
+        """작업 테이블 생성"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_tasks (
+                task_id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                stage TEXT,
+                result TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        ''')
+        columns = [row[1] for row in conn.execute('PRAGMA table_info(scrape_tasks)')]
+        for name, definition in EXTRA_COLUMNS.items():
+            if name not in columns:
+                conn.execute(f'ALTER TABLE scrape_tasks ADD COLUMN {name} {definition}')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_scrape_tasks_url ON scrape_tasks (url, status, updated_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_scrape_tasks_updated ON scrape_tasks (updated_at)')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_scrape_tasks_job ON scrape_tasks (job, stage, available_at)')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_workers (
+                worker_id TEXT PRIMARY KEY,
+                host TEXT,
+                pid INTEGER,
+                started_at REAL NOT NULL,
+                seen_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def create(self, task_id, url, status=STATUS_QUEUED, result=None, job=False):
+        """새 작업 저장 (ttl 지난 작업은 이때 정리), job=True면 작업 큐에 넣음"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute('DELETE FROM scrape_tasks WHERE updated_at < ?', (now - self.ttl,))
+        conn.execute('''
+            INSERT OR REPLACE INTO scrape_tasks
+                (task_id, url, source_url, status, stage, result, job, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (task_id, normalize_url(url), url, status, stage_of(status), self._dump(result), int(job), now, now))
+        conn.commit()
+        conn.close()
+        self._notify()
+
+    def update(self, task_id, status, result=None, stage=None):
+        """작업 상태 (와 결과) 갱신, stage를 주지 않으면 완료/오류일 때만 단계도 바꿈"""
+        conn = self._connect()
+        conn.execute(
+            'UPDATE scrape_tasks SET status = ?, stage = COALESCE(?, stage), result = ?, updated_at = ? '
+            'WHERE task_id = ?',
+            (status, stage or stage_of(status, None), self._dump(result), time.time(), task_id),
+        )
+        conn.commit()
+        conn.close()
+        self._notify()
+
+    def set_stage(self, task_id, stage):
+        """진행 단계 갱신 (가져오기/렌더링/추출)"""
+        self.update(task_id, STATUS_RUNNING, stage=stage)
+
+    def finish(self, task_id, result):
+        """성공 결과 저장"""
+        self.update(task_id, STATUS_DONE, result)
+
+    def fail(self, task_id, error):
+        self.update(task_id, f'{ERROR_PREFIX}{error}')
+
+    def get(self, task_id):
+        """{'status', 'stage', 'result'} (없거나 ttl이 지났으면 상태 '알 수 없음', 단계 None)"""
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT status, stage, result FROM scrape_tasks WHERE task_id = ? AND updated_at >= ?',
+            (task_id, time.time() - self.ttl),
+        ).fetchone()
+        conn.close()
+        if not row:
+            return {'status': STATUS_UNKNOWN, 'stage': None, 'result': None}
+        return {'status': row[0], 'stage': row[1], 'result': self._load(row[2])}
+
+    def wait(self, task_id, seen_stage=None, timeout=25):
+        """단계가 seen_stage와 달라지거나 끝날 때까지 기다렸다가 get() 결과 반환 (timeout이면 그대로)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            task = self.get(task_id)
+            remaining = deadline - time.monotonic()
+            if task['stage'] != seen_stage or task['stage'] in FINAL_STAGES or task['stage'] is None \
+                    or remaining <= 0:
+                return task
+            with self._changed:
+                self._changed.wait(min(remaining, WAIT_POLL_INTERVAL))
+
+    def _notify(self):
+        with self._changed:
+            self._changed.notify_all()
+
+    def claim_job(self, worker_id, lease=JOB_LEASE):
+        """큐에서 가장 오래된 URL 하나를 임대 → (원래 URL, [작업 ID...]) (없으면 None)
+
+        같은 URL을 기다리는 작업은 모두 함께 가져가서 한 번만 스크래핑
+        임대가 끝난 진행 중 작업(워커가 죽은 경우)도 다시 가져감, 시도 횟수를 다 썼으면 오류로 끝냄
+        """
+        now = time.time()
+        conn = self._connect()
+        conn.isolation_level = None
+        try:
+            # 다른 워커와 같은 행을 가져가지 않도록 쓰기 잠금부터
+            conn.execute('BEGIN IMMEDIATE')
+            # 임대가 끝났는데 시도 횟수도 다 쓴 작업 (스크래핑하다 워커가 계속 죽는 URL)은 오류로 끝냄
+            expired = conn.execute('''
+                UPDATE scrape_tasks SET status = ?, stage = ?, lease_until = NULL, updated_at = ?
+                WHERE job = 1 AND stage NOT IN (?, ?, ?) AND lease_until < ? AND attempts >= ?
+            ''', (f'{ERROR_PREFIX}워커가 응답 없이 끝남 ({MAX_JOB_ATTEMPTS}번 시도)', STAGE_ERROR, now,
+                  STAGE_QUEUED, STAGE_DONE, STAGE_ERROR, now, MAX_JOB_ATTEMPTS)).rowcount
+            claimable = '''
+                job = 1 AND ((stage = ? AND available_at <= ?)
+                             OR (stage NOT IN (?, ?, ?) AND lease_until < ? AND attempts < ?))
+            '''
+            params = (STAGE_QUEUED, now, STAGE_QUEUED, STAGE_DONE, STAGE_ERROR, now, MAX_JOB_ATTEMPTS)
+            row = conn.execute(
+                f'SELECT url, source_url FROM scrape_tasks WHERE {claimable} ORDER BY created_at LIMIT 1', params
+            ).fetchone()
+            if row is None:
+                conn.execute('COMMIT')
+                if expired:
+                    self._notify()
+                return None
+            task_ids = [task_id for (task_id,) in conn.execute(
+                f'SELECT task_id FROM scrape_tasks WHERE url = ? AND {claimable}', (row[0],) + params
+            )]
+            conn.executemany('''
+                UPDATE scrape_tasks SET status = ?, stage = ?, attempts = attempts + 1, lease_until = ?,
+                    worker_id = ?, updated_at = ?
+                WHERE task_id = ?
+            ''', [(STATUS_RUNNING, STAGE_FETCHING, now + lease, worker_id, now, task_id) for task_id in task_ids])
+            conn.execute('COMMIT')
+            if expired:
+                self._notify()
+            return row[1] or row[0], task_ids
+        except Exception:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+    def extend_lease(self, task_ids, worker_id, lease=JOB_LEASE):
+        """스크래핑이 오래 걸릴 때 임대 연장 (다른 워커가 가져가지 않게)"""
+        now = time.time()
+        conn = self._connect()
+        conn.executemany(
+            'UPDATE scrape_tasks SET lease_until = ?, updated_at = ? WHERE task_id = ? AND worker_id = ?',
+            [(now + lease, now, task_id, worker_id) for task_id in task_ids],
+        )
+        conn.commit()
+        conn.close()
+
+    def retry_job(self, task_ids, error):
+        """실패한 작업: 시도 횟수가 남았으면 잠시 뒤 다시 큐로, 아니면 오류로 끝냄"""
+        now = time.time()
+        conn = self._connect()
+        for task_id in task_ids:
+            row = conn.execute('SELECT attempts FROM scrape_tasks WHERE task_id = ?', (task_id,)).fetchone()
+            if row and row[0] < MAX_JOB_ATTEMPTS:
+                conn.execute('''
+                    UPDATE scrape_tasks SET status = ?, stage = ?, lease_until = NULL, worker_id = NULL,
+                        available_at = ?, updated_at = ?
+                    WHERE task_id = ?
+                ''', (STATUS_QUEUED, STAGE_QUEUED, now + JOB_RETRY_DELAY * 2 ** (row[0] - 1), now, task_id))
+            else:
+                conn.execute('''
+                    UPDATE scrape_tasks SET status = ?, stage = ?, lease_until = NULL, updated_at = ?
+                    WHERE task_id = ?
+                ''', (f'{ERROR_PREFIX}{error}', STAGE_ERROR, now, task_id))
+        conn.commit()
+        conn.close()
+        self._notify()
+
+    def pending_jobs(self):
+        """큐에서 기다리거나 처리 중인 작업 수"""
+        conn = self._connect()
+        count = conn.execute(
+            'SELECT COUNT(*) FROM scrape_tasks WHERE job = 1 AND stage NOT IN (?, ?)', (STAGE_DONE, STAGE_ERROR)
+        ).fetchone()[0]
+        conn.close()
+        return count
+
+    def heartbeat(self, worker_id):
+        """워커가 살아 있음을 기록"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute('''
+            INSERT INTO scrape_workers (worker_id, host, pid, started_at, seen_at) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(worker_id) DO UPDATE SET seen_at = excluded.seen_at
+        ''', (worker_id, socket.gethostname(), os.getpid(), now, now))
+        conn.execute('DELETE FROM scrape_workers WHERE seen_at < ?', (now - self.ttl,))
+        conn.commit()
+        conn.close()
+
+    def live_workers(self, window=WORKER_ALIVE_WINDOW):
+        """최근 heartbeat가 있는 워커 수"""
+        conn = self._connect()
+        count = conn.execute(
+            'SELECT COUNT(*) FROM scrape_workers WHERE seen_at >= ?', (time.time() - window,)
+        ).fetchone()[0]
+        conn.close()
+        return count
+
+    def recent_result(self, url):
+        """이 URL의 ttl 안 가장 최근 성공 결과 (없으면 None)"""
+        conn = self._connect()
+        row = conn.execute('''
+            SELECT result FROM scrape_tasks
+            WHERE url = ? AND status = ? AND updated_at >= ?
+            ORDER BY updated_at DESC LIMIT 1
+        ''', (normalize_url(url), STATUS_DONE, time.time() - self.ttl)).fetchone()
+        conn.close()
+        return self._load(row[0]) if row else None
+
+    def stats(self):
+        """상태별 작업 수"""
+        conn = self._connect()
+        rows = conn.execute('SELECT status, COUNT(*) FROM scrape_tasks GROUP BY status').fetchall()
+        conn.close()
+        return dict(rows)
+
+    def _dump(self, result):
+        return json.dumps(result, ensure_ascii=False) if result is not None else None
+
+    def _load(self, value):
+        return json.loads(value) if value is not None else None
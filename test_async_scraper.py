@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+🎼 asyncio 스크래퍼 테스트 (로컬 스텁 서버 사용, 네트워크 불필요)
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus'))
+
+from async_scraper import AsyncConcertScraper
+from simple_scraper import SimpleConcertScraper
+from http_cache import ResponseCache
+from polite_fetch import HostThrottle
+from update_golden import FIELDS, load_corpus
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """/<이름> → 공연 페이지 (ETag 재검증), /redirect/<이름> → 302, 처음 failures번은 503 + Retry-After"""
+    pages = {}
+    failures = 0
+    seen = []
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = PageHandler
+        if self.path.startswith('/redirect/'):
+            self.respond(302, headers={'Location': self.path[len('/redirect'):]})
+            return
+        with cls.lock:
+            cls.seen.append(self.path)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+            failing = len(cls.seen) <= cls.failures
+        time.sleep(0.02)
+        with cls.lock:
+            cls.active -= 1
+
+        name = self.path.lstrip('/')
+        if failing:
+            self.respond(503, headers={'Retry-After': '0'})
+        elif name not in cls.pages:
+            self.respond(404)
+        elif self.headers.get('If-None-Match') == f'"{name}"':
+            self.respond(304)
+        else:
+            self.respond(200, cls.pages[name].encode('utf-8'), {'ETag': f'"{name}"'})
+
+    def respond(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(pages, failures=0):
+    PageHandler.pages = pages
+    PageHandler.failures = failures
+    PageHandler.seen = []
+    PageHandler.max_active = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def scrape_all(urls, **kwargs):
+    async def main():
+        async with AsyncConcertScraper(**kwargs) as scraper:
+            return {item['url']: item async for item in scraper.scrape_many(urls)}
+
+    return asyncio.run(main())
+
+
+def test_output_matches_simple_scraper():
+    corpus = load_corpus()
+    server, base = start_server({name: html for name, _, html in corpus})
+    urls = {f"{base}/{name}": html for name, _, html in corpus}
+
+    results = scrape_all(list(urls) + [f"{base}/missing"], throttle=HostThrottle(rate=100, burst=10))
+    server.shutdown()
+
+    simple = SimpleConcertScraper()
+    for url, html in urls.items():
+        assert results[url]['success'], url
+        expected = simple.parse_concert_info(url, html)
+        assert {field: results[url]['result'][field] for field in FIELDS} == {field: expected[field] for field in FIELDS}
+    assert results[f"{base}/missing"]['success'] is False
+
+
+def test_requests_follow_shared_throttle_retries_and_cache(tmp_path):
+    server, base = start_server({f'p{i}': f'<p>베토벤 교향곡 제{i + 1}번 d단조</p>' for i in range(4)}, failures=2)
+    urls = [f"{base}/redirect/p{i}" for i in range(4)]
+
+    # 호스트당 한 번에 하나씩, 503은 재시도, 리다이렉트 단계마다 제한
+    throttle = HostThrottle(rate=100, burst=10, max_in_flight=1)
+    cache = ResponseCache(str(tmp_path / 'cache.db'), ttl=0)
+    results = scrape_all(urls, throttle=throttle, cache=cache)
+    assert all(item['success'] for item in results.values())
+    assert PageHandler.max_active == 1
+    assert len(PageHandler.seen) == 4 + 2
+    assert cache.stats()['entries'] == 4
+
+    # TTL이 지난 캐시는 조건부 요청으로 재검증 (304여도 본문은 캐시에서)
+    PageHandler.seen = []
+    PageHandler.failures = 0
+    revalidated = scrape_all(urls[:1], throttle=throttle, cache=cache)
+    server.shutdown()
+    assert PageHandler.seen == ['/p0']
+    assert revalidated[urls[0]]['success']
+    assert revalidated[urls[0]]['result']['program'] == ['베토벤 교향곡 제1번 d단조']
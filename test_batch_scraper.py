@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+🎼 동시 스크래핑 (scrape_many, /api/scrape-batch) 테스트 (스텁 스크래퍼)
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+import importlib
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_scraper import scrape_many, host_of
+
+
+class StubScraper:
+    def __init__(self, delay=0, fail=(), missing=(), wait_for=None):
+        self.delay = delay
+        self.fail = set(fail)
+        self.missing = set(missing)
+        self.wait_for = wait_for or {}
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+
+    def scrape_concert_info(self, url):
+        host = host_of(url)
+        with self.lock:
+            self.running[host] = self.running.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.running[host])
+        try:
+            time.sleep(self.delay)
+            if url in self.wait_for:
+                assert self.wait_for[url].wait(5)
+            if url in self.fail:
+                raise RuntimeError('연결 실패')
+            if url in self.missing:
+                return None
+            return {'url': url, 'title': url.rsplit('/', 1)[-1]}
+        finally:
+            with self.lock:
+                self.running[host] -= 1
+
+    def scrape_many(self, urls, max_workers=8, per_host_limit=2):
+        return scrape_many(self, urls, max_workers=max_workers, per_host_limit=per_host_limit)
+
+
+def test_per_host_limit_caps_concurrent_requests():
+    urls = [f'https://www.lotteconcerthall.com/{i}' for i in range(6)]
+    urls += [f'https://www.sac.or.kr/{i}' for i in range(3)]
+
+    scraper = StubScraper(delay=0.05)
+    results = list(scrape_many(scraper, urls + urls[:2], max_workers=8, per_host_limit=2))
+
+    # 중복 URL은 한 번만, 호스트마다 동시에 2개까지 (그리고 실제로 2개씩 돌았음)
+    assert sorted(item['url'] for item in results) == sorted(urls)
+    assert scraper.peak == {'lotteconcerthall.com': 2, 'sac.or.kr': 2}
+
+
+def test_results_are_yielded_as_they_complete():
+    release = threading.Event()
+    slow, fast = 'https://a.example.com/slow', 'https://b.example.com/fast'
+    scraper = StubScraper(wait_for={slow: release})
+
+    results = scrape_many(scraper, [slow, fast])
+    try:
+        # 먼저 넣은 느린 URL이 끝나기 전에 빠른 URL 결과가 나옴
+        assert next(results)['url'] == fast
+    finally:
+        release.set()
+    assert [item['url'] for item in results] == [slow]
+
+
+def test_failures_become_items_instead_of_aborting():
+    urls = ['https://example.com/ok', 'https://example.com/boom', 'https://example.com/empty']
+    scraper = StubScraper(fail=[urls[1]], missing=[urls[2]])
+
+    results = {item['url']: item for item in scrape_many(scraper, urls)}
+    assert results[urls[0]] == {'url': urls[0], 'success': True, 'result': {'url': urls[0], 'title': 'ok'}, 'error': None}
+    assert results[urls[1]] == {'url': urls[1], 'success': False, 'result': None, 'error': '연결 실패'}
+    assert results[urls[2]]['success'] is False
+    assert results[urls[2]]['error'] == '페이지 로딩 실패'
+
+
+def load_app(tmp_path, monkeypatch):
+    """임시 디렉터리에서 culture_log_app 불러오기 (DB 파일이 저장소에 생기지 않도록)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('METRICS_DIR', str(tmp_path / 'metrics'))
+    return importlib.import_module('culture_log_app')
+
+
+def test_scrape_batch_endpoint_validates_and_streams_ndjson(tmp_path, monkeypatch):
+    app_module = load_app(tmp_path, monkeypatch)
+    urls = ['https://example.com/1', 'https://example.com/2']
+    monkeypatch.setattr(app_module, 'scraper', StubScraper(fail=[urls[1]]))
+    client = app_module.app.test_client()
+
+    too_many = [f'https://example.com/{i}' for i in range(app_module.MAX_BATCH_URLS + 1)]
+    response = client.post('/api/scrape-batch', json={'urls': too_many})
+    assert response.status_code == 400
+
+    response = client.post('/api/scrape-batch', json={'urls': [urls[0], 'ftp://example.com/x', 3]})
+    assert response.status_code == 400
+    assert response.get_json()['invalid'] == ['ftp://example.com/x', 3]
+
+    response = client.post('/api/scrape-batch', json={'urls': []})
+    assert response.status_code == 400
+
+    # URL마다 한 줄, 마지막 줄은 요약
+    response = client.post('/api/scrape-batch', json={'urls': urls})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    items = {line['url']: line for line in lines[:-1]}
+    assert set(items) == set(urls)
+    assert items[urls[0]]['success'] is True
+    assert items[urls[0]]['result']['title'] == '1'
+    assert items[urls[1]] == {'url': urls[1], 'success': False, 'result': None, 'error': '연결 실패'}
+    assert lines[-1] == {'done': True, 'succeeded': 1, 'failed': 1}
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+🗂️ 시즌 목록 크롤러 테스트 (네트워크 대신 메모리의 목록 페이지 사용)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_scraper import scrape_many
+from catalog_crawler import CatalogStore, CatalogCrawler, catalog_sources, detail_urls
+from site_adapters import find_adapter
+
+LISTING = 'https://www.lotteconcerthall.com/kor/Performance/Index'
+PAGE_2 = LISTING + '?page=2'
+
+
+def listing_page(ids, next_page=None):
+    links = ''.join(f'<a href="/kor/Performance/ConcertDetails/{i}?ref=list#top">공연 {i}</a>' for i in ids)
+    if next_page:
+        links += f'<a href="{next_page.replace("&", "&amp;")}">다음</a>'
+    return f'<html><body>{links}</body></html>'
+
+
+class FakeScraper:
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+        self.scraped = []
+
+    def get_page_content(self, url):
+        self.fetched.append(url)
+        return self.pages.get(url)
+
+    def scrape_concert_info(self, url):
+        self.scraped.append(url)
+        return {'url': url, 'title': url.rsplit('/', 1)[-1]}
+
+    def scrape_many(self, urls, max_workers=8, per_host_limit=2):
+        return scrape_many(self, urls, max_workers=max_workers, per_host_limit=per_host_limit)
+
+
+def test_rerun_only_fetches_new_concerts(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'))
+    lotte = find_adapter(LISTING)
+    pages = {
+        LISTING: listing_page([1, 2], next_page='/kor/Performance/Index?page=2'),
+        PAGE_2: listing_page([2, 3]),
+    }
+
+    scraper = FakeScraper(pages)
+    results = list(CatalogCrawler(scraper, store).crawl([lotte]))
+    assert scraper.fetched == [LISTING, PAGE_2]
+    assert sorted(scraper.scraped) == [
+        f'https://www.lotteconcerthall.com/kor/Performance/ConcertDetails/{i}' for i in (1, 2, 3)
+    ]
+    assert all(item['success'] for item in results)
+
+    # 다시 돌리면 새 공연이 없는 첫 페이지에서 멈추고 아무것도 추출하지 않음
+    scraper = FakeScraper(pages)
+    assert list(CatalogCrawler(scraper, store).crawl([lotte])) == []
+    assert scraper.fetched == [LISTING]
+
+    # 새 공연 하나가 올라오면 그것만 추출
+    pages[LISTING] = listing_page([4, 1, 2], next_page='/kor/Performance/Index?page=2')
+    scraper = FakeScraper(pages)
+    list(CatalogCrawler(scraper, store).crawl([lotte]))
+    assert scraper.scraped == ['https://www.lotteconcerthall.com/kor/Performance/ConcertDetails/4']
+    assert store.stats()['detail_done'] == 4
+
+
+def test_sac_detail_links_normalized():
+    sac = find_adapter('https://www.sac.or.kr/site/main/show/list')
+    html = ('<a href="/site/main/show/show_view?SN=66360">a</a>'
+            '<a href="/site/main/show/show_view?type=A&amp;SN=66360">b</a>'
+            "<a onclick=\"location.href='show_view?SN=70001'\">c</a>")
+    assert detail_urls(sac, html) == [
+        'https://www.sac.or.kr/site/main/show/show_view?SN=66360',
+        'https://www.sac.or.kr/site/main/show/show_view?SN=70001',
+    ]
+    assert {adapter.name for adapter in catalog_sources()} == {'lotteconcerthall', 'sac'}
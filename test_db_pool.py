@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+🗃️ SQLite 연결 풀 테스트
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from db_pool import ConnectionPool
+
+
+def test_thread_connection_reused_in_wal_and_rolled_back_on_error(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'culture_log.db'))
+    with pool.connection() as conn:
+        conn.execute('CREATE TABLE culture_logs (id INTEGER PRIMARY KEY, title TEXT)')
+    assert pool.get() is conn
+    assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO culture_logs (title) VALUES ('롤백')")
+            raise RuntimeError('실패')
+    assert conn.execute('SELECT COUNT(*) FROM culture_logs').fetchone()[0] == 0
+
+    # 스레드마다 다른 연결
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.get()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    # DB 파일을 지우면 다음 사용 때 새 파일에 새 연결
+    pool.remove_database()
+    assert not os.path.exists(pool.path)
+    assert pool.get() is not conn
+    assert pool.get().execute("SELECT name FROM sqlite_master WHERE name = 'culture_logs'").fetchone() is None
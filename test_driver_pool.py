@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+🚗 드라이버 풀 테스트 (실제 Chrome 대신 가짜 드라이버 사용)
+"""
+
+import sys
+import os
+import re
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from selenium.common.exceptions import NoSuchElementException
+
+from driver_pool import DriverPool, BLOCKED_URL_PATTERNS
+from concert_scraper import ConcertScraper
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError('chrome not reachable')
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_pool_reuses_prewarmed_drivers_and_stays_bounded():
+    pool = DriverPool(size=2, max_pages=100, factory=FakeDriver)
+    pool.prewarm()
+    assert pool.stats['launched'] == 2
+
+    first = pool.checkout()
+    second = pool.checkout()
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.1)
+
+    pool.checkin(first)
+    assert pool.checkout() is first
+    assert pool.stats['launched'] == 2
+    pool.checkin(first)
+    pool.checkin(second)
+    pool.close()
+    assert first.driver.quit_called and second.driver.quit_called
+
+
+def test_pool_recycles_after_max_pages_and_replaces_crashed_drivers():
+    pool = DriverPool(size=1, max_pages=2, factory=FakeDriver)
+
+    entry = pool.checkout()
+    pool.checkin(entry)
+    assert pool.checkout() is entry
+    pool.checkin(entry)  # 2페이지째 → 교체
+    assert entry.driver.quit_called
+
+    # 사용 중 브라우저가 죽으면 반납할 때 버리고 새로 띄움
+    with pytest.raises(RuntimeError):
+        with pool.driver() as driver:
+            assert driver is not entry.driver
+            crashed = driver
+            driver.alive = False
+            raise RuntimeError('invalid session id')
+
+    with pool.driver() as driver:
+        assert driver is not crashed and driver.alive
+    assert crashed.quit_called
+    assert pool.stats['recycled'] == 1 and pool.stats['crashed'] == 1
+    pool.close()
+
+
+def test_pool_slot_released_on_interrupt_and_abandoned_generator():
+    pool = DriverPool(size=1, max_pages=100, factory=FakeDriver)
+
+    with pytest.raises(KeyboardInterrupt):
+        with pool.driver():
+            raise KeyboardInterrupt
+
+    def pages():
+        with pool.driver() as driver:
+            yield driver
+
+    abandoned = pages()
+    next(abandoned)
+    abandoned.close()  # GeneratorExit
+
+    entry = pool.checkout(timeout=0.1)
+    assert pool.stats['launched'] == 1
+    pool.checkin(entry)
+    pool.close()
+
+
+def blocked(url):
+    """Network.setBlockedURLs 처럼 '*'만 와일드카드로 URL 전체와 맞춰 봄"""
+    return any(
+        re.fullmatch('.*'.join(re.escape(part) for part in pattern.split('*')), url)
+        for pattern in BLOCKED_URL_PATTERNS
+    )
+
+
+def test_blocked_patterns_cover_versioned_assets():
+    assert blocked('https://www.sac.or.kr/img/a.png')
+    assert blocked('https://www.sac.or.kr/img/a.png?v=3')
+    assert blocked('https://www.lotteconcerthall.com/fonts/NotoSans.woff2?ver=20250101')
+    assert blocked('https://www.googletagmanager.com/gtag/js?id=G-1')
+    assert not blocked('https://www.sac.or.kr/site/main/show/show_view?SN=66360')
+    assert not blocked('https://www.sac.or.kr/js/jquery.icons.js?v=3')
+
+
+class FakeBrowser(FakeDriver):
+    """준비 노드가 ready_after초 뒤에 나타나고, 리소스 요청은 5개에서 멈추는 가짜 브라우저"""
+
+    def __init__(self, ready_after=0.2):
+        super().__init__()
+        self.ready_after = ready_after
+        self.page_source = '<html></html>'
+
+    def get(self, url):
+        self.loaded_at = time.monotonic()
+
+    def find_element(self, by, selector):
+        if time.monotonic() - self.loaded_at < self.ready_after:
+            raise NoSuchElementException(selector)
+        return object()
+
+    def execute_script(self, script):
+        if 'readyState' in script:
+            return ['complete', 5]
+        return super().execute_script(script)
+
+
+def test_render_waits_for_readiness_instead_of_fixed_sleep():
+    scraper = ConcertScraper()
+
+    # 어댑터가 있는 사이트: 준비 노드가 나타나는 즉시 반환
+    started = time.monotonic()
+    scraper.render_page(FakeBrowser(ready_after=0.2), 'https://www.lotteconcerthall.com/kor/Performance/ConcertDetails/1')
+    assert 0.2 <= time.monotonic() - started < 1.0
+
+    # 그 외 사이트: 네트워크가 잠잠해지면 반환
+    started = time.monotonic()
+    scraper.render_page(FakeBrowser(), 'https://example.com/concert/1')
+    assert time.monotonic() - started < 1.5
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+🎯 추출 엔진 골든 테스트
+corpus/pages 의 저장된 공연 페이지를 두 스크래퍼로 파싱해서 corpus/golden 결과(회귀)와 비교합니다.
+정확도 기준은 corpus/expected 의 손으로 확인한 정답입니다.
+(네트워크 불필요, 골든 갱신: python corpus/update_golden.py, 정답은 직접 수정)
+"""
+
+import sys
+import os
+import json
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus'))
+
+from simple_scraper import SimpleConcertScraper
+from concert_scraper import ConcertScraper
+from page_parser import parse_html, available_backends
+from site_adapters import find_adapter
+from update_golden import FIELDS, load_corpus, extract_fields, golden_path, expected_path
+
+
+def check_golden(key, scraper_class):
+    # 설치된 모든 파서 백엔드가 같은 결과를 내야 함
+    for backend in available_backends():
+        scraper = scraper_class(parser=backend)
+        for name, url, html in load_corpus():
+            with open(golden_path(name), encoding='utf-8') as f:
+                expected = json.load(f)[key]
+            assert extract_fields(scraper, url, html) == expected, (backend, name)
+
+
+def test_simple_scraper_matches_golden():
+    check_golden('simple', SimpleConcertScraper)
+
+
+def test_concert_scraper_matches_golden():
+    check_golden('concert', ConcertScraper)
+
+
+def test_hand_checked_answers_cover_corpus():
+    # 벤치마크 정확도 기준: 페이지마다 두 스크래퍼 형식의 모든 필드
+    for name, url, html in load_corpus():
+        with open(expected_path(name), encoding='utf-8') as f:
+            expected = json.load(f)
+        assert expected['notes'], name
+        for key in ('simple', 'concert'):
+            assert sorted(expected[key]) == sorted(FIELDS), (name, key)
+
+
+def test_scrapers_match_hand_checked_answers():
+    for key, scraper in (('simple', SimpleConcertScraper()), ('concert', ConcertScraper())):
+        for name, url, html in load_corpus():
+            with open(expected_path(name), encoding='utf-8') as f:
+                expected = json.load(f)[key]
+            assert extract_fields(scraper, url, html) == expected, (key, name)
+
+
+def test_role_inside_longer_role_and_multi_name_performers():
+    # '메조 소프라노'의 끝부분 '소프라노'는 따로 잡지 않음
+    for scraper in (SimpleConcertScraper(), ConcertScraper()):
+        assert scraper.extract_performers('메조 소프라노 | 김정미') == ['김정미 - 메조소프라노']
+
+    # 악센트 있는 영문 이름, 쉼표로 나열한 합창단
+    concert = ConcertScraper()
+    assert concert.extract_performers('비올라│시몬 트루슈카 Šimon Truszka') == ['시몬 트루슈카 (Šimon Truszka) - 비올라']
+    assert concert.extract_performers('합창 | 국립합창단, 안양시립합창단 Anyang, Seoul') == [
+        '국립합창단, 안양시립합창단 (Anyang, Seoul) - 합창'
+    ]
+
+
+def test_listing_title_venue_and_seat_grades():
+    text = "롯데콘서트홀 모바일 사이트\n로그인\n인 하우스 아티스트 시리즈 Ⅲ\n2025.11.26 (수) 19:30\n롯데콘서트홀"
+    page = parse_html('<html></html>')
+    for scraper in (SimpleConcertScraper(), ConcertScraper()):
+        assert scraper.extract_title(page, text) == '인 하우스 아티스트 시리즈 Ⅲ'
+
+    # 공연장 뒤에는 홀 이름만 붙임
+    concert = ConcertScraper()
+    assert concert.extract_venue(text) == '롯데콘서트홀'
+    assert concert.extract_venue('장소: 세종문화회관 대극장 (광화문)') == '세종문화회관 대극장'
+
+    assert SimpleConcertScraper().extract_price('R석 90,000원, 전석 20,000원 (청소년)') == ['R석 90,000원', '전석 20,000원']
+
+
+def test_pruning_drops_scripts_and_menus():
+    html = """<html><body><nav>공연안내/예매</nav><div id="gnb">마이페이지</div>
+    <script>var menu = {"menu_move_yn": "N"};</script><p>지휘 | 정명훈</p>
+    <footer>서울특별시 송파구</footer></body></html>"""
+    for backend in available_backends():
+        assert parse_html(html, backend).text == '지휘 | 정명훈', backend
+
+
+def test_price_fallback_without_seat_classes():
+    scraper = ConcertScraper()
+    text = "입장료 12,000원 / 주차 500원 / 후원 2,000,000원\n전화 1544-7744"
+    assert scraper.extract_price(text) == ['12,000원']
+
+
+def test_bracket_title_on_huge_page_stays_linear():
+    # '<' 뒤에 '>'가 없는 긴 본문: 예전 패턴은 위치마다 끝까지 훑어서 제곱 시간이 걸렸음
+    text = '공연 안내 ' * 40000 + '끝<'
+    page = parse_html('<html></html>')
+
+    started = time.perf_counter()
+    SimpleConcertScraper().extract_title(page, text)
+    ConcertScraper().extract_title(page, text)
+    assert time.perf_counter() - started < 1.0
+
+
+def test_site_adapter_registry_falls_back_for_unknown_hosts():
+    assert find_adapter('https://m.lotteconcerthall.com/kor/Performance/ConcertDetails/1').name == 'lotteconcerthall'
+    assert find_adapter('https://www.sac.or.kr/site/main/show/show_view?SN=1').name == 'sac'
+    assert find_adapter('https://example.com/concert/1') is None
+
+    # 어댑터가 없는 호스트는 본문 전체 범용 추출
+    name, url, html = load_corpus()[0]
+    info = SimpleConcertScraper().parse_concert_info('https://example.com/concert/1', html)
+    assert info['date'] and info['venue'] == '롯데콘서트홀'
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+🧭 호스트별 가져오기 전략 학습 테스트 (네트워크/브라우저 대신 저장된 corpus 페이지 사용)
+"""
+
+import sys
+import os
+import json
+from contextlib import contextmanager
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from concert_scraper import ConcertScraper
+from fetch_strategy import FetchStrategyStore, RELEARN_AFTER, api_url_for
+from http_cache import ResponseCache
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+JS_SHELL = '<html><body><div id="app"></div><script src="/app.js"></script></body></html>'
+
+
+def corpus_page(name):
+    with open(os.path.join(ROOT, 'corpus', 'pages', name), encoding='utf-8') as f:
+        return f.read()
+
+
+class RecordingScraper(ConcertScraper):
+    """requests/브라우저 대신 정해 둔 HTML을 돌려주고 호출을 기록"""
+
+    def __init__(self, static_html, rendered_html, **kwargs):
+        super().__init__(**kwargs)
+        self.static_html = static_html
+        self.rendered_html = rendered_html
+        self.calls = []
+
+    def fetch_static(self, url):
+        self.calls.append('static')
+        return self.static_html
+
+    def fetch_rendered(self, url):
+        self.calls.append('rendered')
+        return self.rendered_html
+
+
+def test_js_shell_host_is_learned_as_rendered_and_skips_requests(tmp_path):
+    store = FetchStrategyStore(str(tmp_path / 'strategy.db'), config_path=None)
+    scraper = RecordingScraper(JS_SHELL, corpus_page('sac_66360.html'), strategies=store)
+    url = 'https://www.sac.or.kr/site/main/show/show_view?SN=66360'
+
+    first = scraper.scrape_concert_info(url)
+    assert scraper.calls == ['static', 'rendered']
+    assert first['venue'] and first['date']
+    assert store.lookup('sac.or.kr')['strategy'] == 'rendered'
+
+    # 새 프로세스에서도 기억: 바로 브라우저로
+    store = FetchStrategyStore(str(tmp_path / 'strategy.db'), config_path=None)
+    scraper = RecordingScraper(JS_SHELL, corpus_page('sac_66360.html'), strategies=store)
+    second = scraper.scrape_concert_info(url)
+    assert scraper.calls == ['rendered']
+    assert second['performers'] == first['performers']
+    assert store.table()[0]['successes'] == 2
+
+    # 계속 빈 결과가 나오면 잊고 다시 알아봄
+    scraper.rendered_html = JS_SHELL
+    for _ in range(RELEARN_AFTER):
+        scraper.scrape_concert_info(url)
+    assert store.lookup('sac.or.kr') is None
+
+
+def test_static_host_and_config_override(tmp_path):
+    config = tmp_path / 'fetch_strategies.json'
+    config.write_text(json.dumps({'hosts': {
+        'lotteconcerthall.com': {'strategy': 'rendered'},
+        'bad.example.com': {'strategy': 'teleport'},
+    }}), encoding='utf-8')
+    store = FetchStrategyStore(str(tmp_path / 'strategy.db'), config_path=str(config))
+    page = corpus_page('sejong_pac_2025.html')
+
+    scraper = RecordingScraper(page, page, strategies=store)
+    scraper.scrape_concert_info('https://www.sejongpac.or.kr/portal/performance/performance/view.do?performIdx=1')
+    assert scraper.calls == ['static']
+    assert store.lookup('sejongpac.or.kr')['strategy'] == 'static'
+
+    # 설정 파일 고정값은 학습보다 우선하고, 잘못된 값은 무시
+    scraper.calls = []
+    scraper.static_html = corpus_page('lotte_260811.html')
+    scraper.scrape_concert_info('https://www.lotteconcerthall.com/kor/Performance/ConcertDetails/260811')
+    assert scraper.calls == ['rendered']
+    assert store.lookup('bad.example.com') is None
+    assert [(row['host'], row['source']) for row in store.table()] == [
+        ('lotteconcerthall.com', 'config'), ('sejongpac.or.kr', 'learned'),
+    ]
+
+    assert api_url_for('https://api.example.com/shows/{id}?sn={SN}',
+                       'https://example.com/show/view/66360?SN=7') == 'https://api.example.com/shows/66360?sn=7'
+
+
+class FakePool:
+    @contextmanager
+    def driver(self):
+        yield None
+
+
+class RenderingScraper(ConcertScraper):
+    """브라우저 대신 정해 둔 HTML로 렌더링"""
+
+    def __init__(self, rendered_html, **kwargs):
+        super().__init__(driver_pool=FakePool(), **kwargs)
+        self.rendered_html = rendered_html
+        self.renders = 0
+
+    def render_page(self, driver, url):
+        self.renders += 1
+        return self.rendered_html
+
+
+def test_rendered_html_cached_apart_from_static_responses(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.db'))
+    scraper = RenderingScraper(corpus_page('sac_66360.html'), cache=cache)
+    url = 'https://www.sac.or.kr/site/main/show/show_view?SN=66360'
+
+    assert scraper.fetch_rendered(url) == scraper.fetch_rendered(url)
+    assert scraper.renders == 1
+    # 정적 요청이 읽는 키에는 렌더링 결과가 없음 (JS 껍데기 호스트를 static으로 학습하지 않게)
+    assert cache.get(url) is None
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+🗄️ HTTP 응답 캐시 테스트 (로컬 스텁 서버 사용, 네트워크 불필요)
+"""
+
+import sys
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from http_cache import ResponseCache
+from simple_scraper import SimpleConcertScraper
+from scrape_timings import TimingAggregate
+
+PAGE = '<html><body>롯데콘서트홀 2025.11.19 (수) 19:30</body></html>'
+ETAG = '"v1"'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        StubHandler.requests_seen.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = PAGE.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('ETag', ETAG)
+        self.send_header('Last-Modified', 'Mon, 15 Sep 2025 14:00:00 GMT')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/page"
+
+
+def test_fresh_entry_served_without_request(tmp_path):
+    server, url = start_server()
+    StubHandler.requests_seen = []
+    cache = ResponseCache(str(tmp_path / 'cache.db'), ttl=60)
+    session = requests.Session()
+
+    assert cache.fetch(session, url) == PAGE
+    assert cache.fetch(session, url) == PAGE
+    assert len(StubHandler.requests_seen) == 1
+    server.shutdown()
+
+
+def test_stale_entry_revalidated_with_304(tmp_path):
+    server, url = start_server()
+    StubHandler.requests_seen = []
+    cache = ResponseCache(str(tmp_path / 'cache.db'), ttl=0)
+    session = requests.Session()
+
+    assert cache.fetch(session, url) == PAGE
+    assert cache.fetch(session, url) == PAGE
+    assert len(StubHandler.requests_seen) == 2
+    assert StubHandler.requests_seen[1].get('If-None-Match') == ETAG
+    assert StubHandler.requests_seen[1].get('If-Modified-Since') == 'Mon, 15 Sep 2025 14:00:00 GMT'
+    server.shutdown()
+
+
+def test_lru_eviction_keeps_size_bounded(tmp_path):
+    cache = ResponseCache(str(tmp_path / 'cache.db'), max_bytes=250)
+    cache.store('http://a/1', 'a' * 100)
+    cache.store('http://a/2', 'b' * 100)
+    cache.get('http://a/1')  # 1번을 최근 사용으로
+    cache.store('http://a/3', 'c' * 100)
+
+    assert cache.get('http://a/2') is None
+    assert cache.get('http://a/1') is not None
+    assert cache.get('http://a/3') is not None
+    assert cache.stats()['bytes'] <= 250
+
+
+def test_scrape_timings_record_fetch_path_and_stages(tmp_path):
+    server, url = start_server()
+    aggregate = TimingAggregate()
+    scraper = SimpleConcertScraper(cache=ResponseCache(str(tmp_path / 'cache.db'), ttl=60), timings=aggregate)
+
+    first = scraper.scrape_concert_info(url)['_timings']
+    second = scraper.scrape_concert_info(url)['_timings']
+    assert first['fetch_path'] == 'network' and first['bytes'] == len(PAGE.encode('utf-8'))
+    assert second['fetch_path'] == 'cache' and 'bytes' not in second
+    assert {'fetch', 'parse', 'text', 'extract_date', 'extract_venue'} <= set(first['stages_ms'])
+    assert first['text_length'] > 0
+
+    summary = aggregate.summary()
+    assert summary['window'] == 2
+    assert summary['hosts'][0]['fetch_paths'] == {'network': 1, 'cache': 1}
+    # 기록을 켜지 않은 스크래퍼는 결과가 예전과 같음
+    assert '_timings' not in SimpleConcertScraper(cache=ResponseCache(str(tmp_path / 'cache.db'))).scrape_concert_info(url)
+    server.shutdown()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+🔤 Aho-Corasick 키워드 매처 테스트
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_matcher import KeywordMatcher
+from extraction import TextScanner
+
+
+def test_finds_overlapping_keywords_in_one_pass():
+    matcher = KeywordMatcher()
+    for word in ['메조', '소프라노', '메조 소프라노', '롯데콘서트홀', '콘서트홀']:
+        matcher.add(word, word)
+
+    text = '메조 소프라노 | 김정미, 롯데콘서트홀'
+    assert sorted(matcher.find_all(text)) == [
+        (0, '메조'), (0, '메조 소프라노'), (3, '소프라노'), (15, '롯데콘서트홀'), (17, '콘서트홀'),
+    ]
+
+
+def test_case_insensitive_and_exact_keywords():
+    scanner = TextScanner(keywords={'venue': ['SAC']}, ci_keywords={'composer': ['Bach', '바흐']})
+    index = scanner.scan('sac BACH Offenbach SAC 바흐')
+
+    assert index.positions('venue', 'SAC') == [19]
+    assert index.positions('composer', 'Bach') == [4, 14]
+    assert index.positions('composer', '바흐') == [23]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+🎼 출연진/프로그램/가격 하위 테이블 테스트
+"""
+
+import sys
+import os
+import json
+import sqlite3
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from log_details import create_detail_tables, save_log_details, parse_performers, parse_program, parse_prices, canonical_composer
+
+
+def test_parse_scraped_formats():
+    assert parse_performers(['정명훈(Myung-Whun Chung) - 지휘', '[주요 출연자] 두다멜, 로스앤젤레스 필하모닉']) == [
+        ('정명훈', '지휘'), ('두다멜', None), ('로스앤젤레스 필하모닉', None),
+    ]
+    assert parse_performers(['베로니카 야루스코바 (Veronika Jarůšková) - 바이올린']) == [('베로니카 야루스코바', '바이올린')]
+    assert parse_program(['Brahms Symphony No.4', '브람스의 헝가리 무곡', '오펜바흐 서곡']) == [
+        ('브람스', 'Brahms Symphony No.4'), ('브람스', '브람스의 헝가리 무곡'), (None, '오펜바흐 서곡'),
+    ]
+    # composer_names 에 없는 작곡가는 찾은 키워드 그대로, 조회할 때도 같은 값
+    assert parse_program(['Haydn String Quartet in D major, Op. 76 No. 5', 'Dvořák String Quartet No. 13']) == [
+        ('Haydn', 'Haydn String Quartet in D major, Op. 76 No. 5'), ('Dvořák', 'Dvořák String Quartet No. 13'),
+    ]
+    assert canonical_composer('haydn') == 'Haydn'
+    assert parse_prices(['R석 400,000원', '시야방해R 30,000원', '무료']) == [('R석', 400000), ('시야방해R', 30000)]
+
+
+def test_existing_logs_migrated_and_children_follow_deletes(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'culture_log.db'))
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.execute('''
+        CREATE TABLE culture_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, venue TEXT,
+            performers TEXT, program TEXT, price TEXT
+        )
+    ''')
+    conn.execute('INSERT INTO culture_logs (title, venue, performers, program, price) VALUES (?, ?, ?, ?, ?)', (
+        '옛 기록', '예술의전당', json.dumps(['정명훈 - 지휘'], ensure_ascii=False),
+        json.dumps(['Brahms Symphony No.4']), json.dumps(['R석 100,000원'], ensure_ascii=False),
+    ))
+    create_detail_tables(conn)
+
+    new_id = conn.execute("INSERT INTO culture_logs (title, venue) VALUES ('새 기록', '롯데콘서트홀')").lastrowid
+    save_log_details(conn, new_id, ['정명훈 - 피아노'], '브람스 피아노 협주곡 1번', ['S석 60,000원'])
+
+    rows = conn.execute('''
+        SELECT l.title, p.role FROM log_performers p JOIN culture_logs l ON l.id = p.log_id
+        WHERE p.name = ? ORDER BY l.id
+    ''', ('정명훈',)).fetchall()
+    assert rows == [('옛 기록', '지휘'), ('새 기록', '피아노')]
+    assert conn.execute("SELECT COUNT(*) FROM log_works WHERE composer = '브람스'").fetchone()[0] == 2
+    assert conn.execute('SELECT AVG(amount) FROM log_prices').fetchone()[0] == 80000
+
+    # 다시 만들어도 중복으로 옮기지 않음
+    create_detail_tables(conn)
+    assert conn.execute('SELECT COUNT(*) FROM log_performers').fetchone()[0] == 2
+
+    conn.execute('DELETE FROM culture_logs WHERE id = ?', (new_id,))
+    for table in ('log_performers', 'log_works', 'log_prices'):
+        assert conn.execute(f'SELECT COUNT(*) FROM {table} WHERE log_id = ?', (new_id,)).fetchone()[0] == 0
+
+
+def test_works_saved_without_composer_filled_on_startup(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'culture_log.db'))
+    conn.execute('''
+        CREATE TABLE culture_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, performers TEXT, program TEXT, price TEXT
+        )
+    ''')
+    create_detail_tables(conn)
+    log_id = conn.execute("INSERT INTO culture_logs (title) VALUES ('파벨 하스 콰르텟')").lastrowid
+    # 키워드를 추가하기 전에 작곡가 없이 저장된 곡
+    conn.execute("INSERT INTO log_works (log_id, composer, title, position) VALUES (?, NULL, 'Haydn Op. 76 No. 5', 0)",
+                 (log_id,))
+
+    create_detail_tables(conn)
+    assert conn.execute('SELECT composer FROM log_works').fetchall() == [('Haydn',)]
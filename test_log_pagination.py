@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+📑 /api/logs 키셋 페이지네이션 테스트
+"""
+
+import sys
+import os
+import sqlite3
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from log_pagination import (
+    ORDER_BY, CountCache, create_indexes, encode_cursor, decode_cursor, keyset_condition, keyset_params,
+)
+
+
+def test_keyset_pages_follow_index_order_without_gaps(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'culture_log.db'))
+    conn.execute('''
+        CREATE TABLE culture_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, category TEXT NOT NULL,
+            date TEXT NOT NULL, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    create_indexes(conn)
+    # 같은 날짜/시각 기록이 많아도 id로 순서가 정해짐
+    conn.executemany(
+        "INSERT INTO culture_logs (title, category, date, created_at) VALUES (?, ?, ?, '2026-01-01 00:00:00')",
+        [(f'공연 {i}', 'concert' if i % 2 else 'play', f'2026-01-{i % 3 + 1:02d}') for i in range(20)],
+    )
+
+    query = f"SELECT id, date, created_at FROM culture_logs l WHERE l.category = ? %s ORDER BY {ORDER_BY} LIMIT 3"
+    plan = conn.execute('EXPLAIN QUERY PLAN ' + query % f'AND {keyset_condition()}',
+                        ('concert', '2026-01-02', '', 0)).fetchall()
+    assert 'idx_culture_logs_category_date' in plan[0][3]
+    assert not any('TEMP B-TREE' in row[3] for row in plan)
+
+    seen, token = [], None
+    while True:
+        if token:
+            values = decode_cursor(token, 3)
+            rows = conn.execute(query % f'AND {keyset_condition()}', ['concert'] + keyset_params(values)).fetchall()
+        else:
+            rows = conn.execute(query % '', ('concert',)).fetchall()
+        if not rows:
+            break
+        seen.extend(row[0] for row in rows)
+        token = encode_cursor(list(rows[-1][1:]) + [rows[-1][0]])
+
+    expected = [row[0] for row in conn.execute(
+        f"SELECT id FROM culture_logs l WHERE category = 'concert' ORDER BY {ORDER_BY}")]
+    assert seen == expected and len(seen) == 10
+
+
+def test_cursor_token_and_count_cache():
+    token = encode_cursor([-1.25, '2026-01-01', '2026-01-01 12:00:00', 7])
+    assert '=' not in token and '/' not in token
+    assert decode_cursor(token, 4) == [-1.25, '2026-01-01', '2026-01-01 12:00:00', 7]
+    assert keyset_params([-1.25, 'd', 'c', 7], rank='bm25(x)') == [-1.25, -1.25, 'd', 'c', 7]
+    with pytest.raises(ValueError):
+        decode_cursor(token, 3)
+    with pytest.raises(ValueError):
+        decode_cursor('!!', 3)
+
+    calls = []
+    counts = CountCache(ttl=60)
+    assert counts.get(('concert', None), lambda: calls.append(1) or 5) == 5
+    assert counts.get(('concert', None), lambda: calls.append(1) or 6) == 5
+    counts.clear()
+    assert counts.get(('concert', None), lambda: calls.append(1) or 6) == 6
+    assert len(calls) == 2
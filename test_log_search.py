@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+🔎 기록 전문 검색 색인 테스트
+"""
+
+import sys
+import os
+import sqlite3
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from log_search import create_search_index, search_clause, render_snippet
+
+
+def search(conn, text):
+    source, conditions, params, rank, snippet = search_clause(conn, text)
+    query = f"SELECT l.title, {snippet or 'NULL'} FROM {source} WHERE " + " AND ".join(conditions)
+    if rank:
+        query += f" ORDER BY {rank}"
+    return conn.execute(query, params).fetchall()
+
+
+def test_trigram_index_follows_table_and_ranks_title_first(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'culture_log.db'))
+    conn.execute('''
+        CREATE TABLE culture_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, category TEXT, date TEXT,
+            venue TEXT, performers TEXT, program TEXT, review TEXT
+        )
+    ''')
+    conn.execute('''INSERT INTO culture_logs (title, venue, performers, program, review)
+                    VALUES ('정기공연', '예술의전당', '["정명훈", "서울시향"]', '["브람스 교향곡 1번"]', '<좋았다>')''')
+    # 색인 전에 있던 기록도 검색됨
+    assert create_search_index(conn)
+    conn.execute('''INSERT INTO culture_logs (title, venue, performers, program, review)
+                    VALUES ('브람스의 밤', '롯데콘서트홀', '[]', '[]', '정명훈 지휘가 아니어서 아쉬움')''')
+
+    # 띄어쓰기 없는 한글 부분 문자열, 제목에 있는 기록이 먼저
+    assert [row[0] for row in search(conn, '브람스')] == ['브람스의 밤', '정기공연']
+    assert [row[0] for row in search(conn, '정명훈 교향곡')] == ['정기공연']
+    # 두 글자는 LIKE로
+    assert [row[0] for row in search(conn, '명훈 교향곡')] == ['정기공연']
+    # 따옴표/연산자도 그냥 글자로
+    assert search(conn, '"브람스 OR') == []
+
+    rows = search(conn, '좋았다')
+    assert render_snippet(rows[0][1]) == '&lt;<mark>좋았다</mark>&gt;'
+
+    # 수정/삭제도 색인에 반영
+    conn.execute("UPDATE culture_logs SET title = '모차르트의 밤', program = '[]' WHERE title = '브람스의 밤'")
+    assert [row[0] for row in search(conn, '브람스')] == ['정기공연']
+    conn.execute("DELETE FROM culture_logs WHERE title = '정기공연'")
+    assert search(conn, '브람스') == []
+    assert [row[0] for row in search(conn, '모차르트')] == ['모차르트의 밤']
+
+    # 이미 있으면 그대로 (다시 만들어도 중복 없음)
+    assert create_search_index(conn)
+    assert len(search(conn, '모차르트')) == 1
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+📈 메트릭 집계 테스트 (gunicorn 워커 여러 개를 레지스트리 여러 개로 흉내 냄)
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from metrics import MetricsRegistry, Counter, Gauge, Histogram, mark_process_dead
+
+DEAD_PID = 2 ** 22 + 12345  # 리눅스 pid_max보다 커서 살아 있을 수 없는 PID
+
+
+def make_worker(directory, pid):
+    registry = MetricsRegistry(str(directory), pid=pid)
+    return registry, {
+        'scrapes': Counter('scrape_results_total', '호스트별 결과', ['host', 'outcome'], registry=registry),
+        'in_flight': Gauge('scrape_tasks_in_flight', '진행 중', registry=registry),
+        'latency': Histogram('http_request_duration_seconds', '지연', ['route'], buckets=(0.1, 1.0), registry=registry),
+    }
+
+
+def test_counters_and_histograms_sum_across_workers_and_dead_gauges_drop(tmp_path):
+    live, live_metrics = make_worker(tmp_path, os.getpid())
+    dead, dead_metrics = make_worker(tmp_path, DEAD_PID)
+
+    for metrics in (live_metrics, dead_metrics):
+        metrics['scrapes'].inc(host='sac.or.kr', outcome='success')
+        metrics['in_flight'].inc(2)
+        metrics['latency'].observe(0.05, route='/api/logs')
+    dead_metrics['latency'].observe(0.5, route='/api/logs')
+    dead.flush()
+    mark_process_dead(DEAD_PID, str(tmp_path))
+
+    text = live.render()
+    assert 'scrape_results_total{host="sac.or.kr",outcome="success"} 2' in text
+    # 끝난 워커의 진행 중 작업 수는 빠짐
+    assert 'scrape_tasks_in_flight 2' in text
+    assert 'http_request_duration_seconds_bucket{route="/api/logs",le="0.1"} 2' in text
+    assert 'http_request_duration_seconds_bucket{route="/api/logs",le="+Inf"} 3' in text
+    assert 'http_request_duration_seconds_count{route="/api/logs"} 3' in text
+    assert '# TYPE http_request_duration_seconds histogram' in text
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+🤝 공용 가져오기 계층 테스트 (로컬 스텁 서버 사용, 네트워크 불필요)
+"""
+
+import sys
+import os
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from polite_fetch import PoliteSession, HostThrottle, LOOPBACK_HOSTS, retry_after_seconds
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """처음 failures번은 503 + Retry-After, 그다음부터 200 (동시 요청 수 최댓값 기록)"""
+    failures = 0
+    seen = 0
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = FlakyHandler
+        if self.path == '/redirect':
+            self.send_response(302)
+            self.send_header('Location', '/page')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        with cls.lock:
+            cls.seen += 1
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+            failing = cls.seen <= cls.failures
+        time.sleep(0.02)
+        with cls.lock:
+            cls.active -= 1
+
+        body = b'ok'
+        self.send_response(503 if failing else 200)
+        if failing:
+            self.send_header('Retry-After', '0')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(failures):
+    FlakyHandler.failures = failures
+    FlakyHandler.seen = FlakyHandler.max_active = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/page"
+
+
+def test_transient_errors_retried_until_success():
+    server, url = start_server(failures=2)
+    session = PoliteSession(throttle=HostThrottle(rate=100, burst=10), max_retries=3)
+    response = session.get(url, timeout=5)
+    assert response.status_code == 200
+    assert FlakyHandler.seen == 3
+
+    # 재시도 횟수를 넘기면 마지막 응답을 그대로 돌려줌
+    server.shutdown()
+    server, url = start_server(failures=5)
+    session = PoliteSession(throttle=HostThrottle(rate=100, burst=10), max_retries=1)
+    assert session.get(url, timeout=5).status_code == 503
+    assert FlakyHandler.seen == 2
+    server.shutdown()
+
+
+def test_host_rate_and_in_flight_limits_shared_across_threads():
+    server, url = start_server(failures=0)
+    throttle = HostThrottle(rate=20, burst=2, max_in_flight=1)
+    sessions = [PoliteSession(throttle=throttle) for _ in range(3)]
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=sessions[i % 3].get, args=(url,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 처음 2개는 버킷에서 바로, 나머지 4개는 초당 20개 속도로 (최소 0.2초)
+    assert time.monotonic() - started >= 0.19
+    assert FlakyHandler.seen == 6
+    assert FlakyHandler.max_active == 1
+    server.shutdown()
+
+
+def test_retry_after_parses_seconds_and_dates():
+    class Response:
+        def __init__(self, value):
+            self.headers = {'Retry-After': value} if value else {}
+
+    assert retry_after_seconds(Response('7')) == 7.0
+    assert retry_after_seconds(Response('Wed, 21 Oct 2015 07:28:00 GMT')) == 0.0
+    assert retry_after_seconds(Response(None)) is None
+
+
+def test_each_redirect_hop_throttled_and_loopback_exemptable():
+    class CountingThrottle(HostThrottle):
+        acquired = 0
+
+        def acquire(self, host):
+            CountingThrottle.acquired += 1
+            super().acquire(host)
+
+    server, url = start_server(failures=0)
+    session = PoliteSession(throttle=CountingThrottle(rate=100, burst=10))
+    response = session.get(url.replace('/page', '/redirect'), timeout=5)
+    assert response.status_code == 200 and len(response.history) == 1
+    # 처음 요청 + 리다이렉트 한 단계
+    assert CountingThrottle.acquired == 2
+
+    # 제외한 호스트는 버킷을 만들지도 않음
+    throttle = HostThrottle(rate=0.001, burst=1, exempt_hosts=LOOPBACK_HOSTS)
+    session = PoliteSession(throttle=throttle)
+    for _ in range(3):
+        assert session.get(url, timeout=5).status_code == 200
+    assert throttle._hosts == {}
+    server.shutdown()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+🔁 재확인 스케줄러 테스트 (임시 DB + 스텁 페이지, 네트워크 불필요)
+"""
+
+import sys
+import os
+import sqlite3
+import time
+import importlib
+from datetime import date, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from simple_scraper import SimpleConcertScraper
+from rescrape_scheduler import RescrapeScheduler
+
+PAGE = '''<html><head><script>var t = {stamp};</script></head><body>
+<h1>가을 리사이틀</h1><p>공연장: 롯데콘서트홀</p><p>가격: {price}</p>
+<!-- rendered {stamp} --></body></html>'''
+
+
+class StubScraper(SimpleConcertScraper):
+    """get_page_content는 pages에서, parse 호출 수를 셈"""
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+        self.parsed = 0
+
+    def get_page_content(self, url):
+        return self.pages.get(url)
+
+    def parse_concert_info(self, url, html_content):
+        self.parsed += 1
+        return super().parse_concert_info(url, html_content)
+
+
+def make_database(tmp_path, rows):
+    database = str(tmp_path / 'culture_log.db')
+    conn = sqlite3.connect(database)
+    conn.execute('CREATE TABLE culture_logs (id INTEGER PRIMARY KEY, title TEXT, date TEXT, source_url TEXT)')
+    conn.executemany('INSERT INTO culture_logs (title, date, source_url) VALUES (?, ?, ?)', rows)
+    conn.commit()
+    conn.close()
+    return database
+
+
+def test_unchanged_page_skips_parse_and_changed_price_is_recorded(tmp_path):
+    soon = (date.today() + timedelta(days=5)).isoformat()
+    later = (date.today() + timedelta(days=30)).isoformat()
+    past = (date.today() - timedelta(days=1)).isoformat()
+    database = make_database(tmp_path, [
+        ('later', later, 'https://example.com/later'),
+        ('soon', soon, 'https://example.com/soon'),
+        ('past', past, 'https://example.com/past'),
+        ('manual', soon, ''),
+    ])
+    pages = {
+        'https://example.com/soon': PAGE.format(stamp=1, price='R석 50,000원'),
+        'https://example.com/later': PAGE.format(stamp=1, price='R석 70,000원'),
+    }
+    scraper = StubScraper(pages)
+    scheduler = RescrapeScheduler(scraper, database)
+
+    # 가까운 공연부터, 지난 공연/URL 없는 기록은 제외
+    assert [url for url, _ in scheduler.due()] == ['https://example.com/soon', 'https://example.com/later']
+
+    now = time.time()
+    assert scheduler.run_once(now)['baseline'] == 2
+    assert scraper.parsed == 2
+    # 다음 확인 전에는 다시 가져가지 않음
+    assert scheduler.due(now + 60) == []
+
+    # 스크립트/주석만 바뀐 페이지 → 파싱 없이 unchanged
+    pages['https://example.com/soon'] = PAGE.format(stamp=2, price='R석 50,000원')
+    pages['https://example.com/later'] = PAGE.format(stamp=2, price='R석 90,000원')
+    counts = scheduler.run_once(now + 3 * 24 * 60 * 60 + 60)
+    assert counts == {'baseline': 0, 'unchanged': 1, 'changed': 1, 'failed': 0}
+    assert scraper.parsed == 3
+
+    changes = scheduler.changes()
+    assert [(c['url'], c['field']) for c in changes] == [('https://example.com/later', 'price')]
+    assert changes[0]['old'] == ['R석 70,000원'] and changes[0]['new'] == ['R석 90,000원']
+
+
+def test_app_starts_scheduler_explicitly_and_not_in_worker_mode(tmp_path, monkeypatch):
+    # 임시 디렉터리에서 불러오기 (DB 파일이 저장소에 생기지 않도록)
+    (tmp_path / 'app').mkdir()
+    monkeypatch.chdir(tmp_path / 'app')
+    monkeypatch.setenv('RESCRAPE_INTERVAL', '600')
+    monkeypatch.setenv('METRICS_DIR', str(tmp_path / 'metrics'))
+    app_module = importlib.import_module('culture_log_app')
+
+    # 불러오기만 해서는 시작하지 않음
+    assert app_module.rescrape_scheduler._thread is None
+
+    scheduler = RescrapeScheduler(StubScraper({}), make_database(tmp_path, []))
+    monkeypatch.setattr(app_module, 'rescrape_scheduler', scheduler)
+    monkeypatch.setattr(app_module, 'RESCRAPE_INTERVAL', 600)
+
+    # 스크래핑을 워커 프로세스가 하면 웹 프로세스에서는 재확인도 안 함
+    monkeypatch.setattr(app_module, 'SCRAPE_MODE', 'worker')
+    assert app_module.start_rescrape_scheduler() is False
+    assert scheduler._thread is None
+
+    monkeypatch.setattr(app_module, 'SCRAPE_MODE', 'inline')
+    assert app_module.start_rescrape_scheduler() is True
+    assert scheduler._thread.is_alive()
+    scheduler.stop()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+🧵 스크래핑 실행기 테스트 (대기열 상한, 같은 URL 합치기)
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from scrape_executor import ScrapeExecutor, ScrapeQueueFull, new_task_id
+from scrape_timings import stage
+
+
+def test_same_url_coalesced_and_full_queue_rejected():
+    release = threading.Event()
+    calls = []
+
+    def slow_scrape(url):
+        calls.append(url)
+        with stage('fetch'):
+            release.wait(5)
+        return {'url': url}
+
+    executor = ScrapeExecutor(slow_scrape, max_workers=1, max_queue=1, retry_after=7)
+    events = {}
+    finished = threading.Semaphore(0)
+
+    def listener(name):
+        def on_event(event, payload):
+            events.setdefault(name, []).append(event)
+            if event != 'started':
+                finished.release()
+        return on_event
+
+    assert executor.submit('https://example.com/a#x', listener('a1')) is False
+    # 같은 페이지 (프래그먼트/대소문자만 다름) → 같은 작업에 붙음
+    assert executor.submit('https://EXAMPLE.com/a', listener('a2')) is True
+    assert executor.submit('https://example.com/b', listener('b')) is False
+
+    with pytest.raises(ScrapeQueueFull) as error:
+        executor.submit('https://example.com/c', listener('c'))
+    assert error.value.retry_after == 7
+
+    release.set()
+    for _ in range(3):
+        assert finished.acquire(timeout=5)
+    assert calls == ['https://example.com/a#x', 'https://example.com/b']
+    # 진행 단계는 스크래퍼의 stage 구간에서
+    assert events['a1'] == events['b'] == ['started', 'stage', 'done']
+    assert events['a2'][-1] == 'done'
+    assert executor.stats()['coalesced'] == 1 and executor.stats()['rejected'] == 1
+    assert new_task_id() != new_task_id()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🛠️ 스크래핑 워커/작업 큐 테스트 (임시 DB + 스텁 스크래퍼)
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from task_store import ScrapeTaskStore, MAX_JOB_ATTEMPTS
+from scrape_worker import ScrapeWorker
+from scrape_timings import stage, record_timings, SharedTimingAggregate
+from metrics import REGISTRY
+from worker_supervisor import WorkerSupervisor
+
+
+class StubScraper:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.calls = []
+
+    def scrape_concert_info(self, url):
+        self.calls.append(url)
+        with stage('fetch'):
+            pass
+        if self.fail:
+            raise RuntimeError('연결 실패')
+        return {'title': '가을 리사이틀', 'url': url}
+
+
+def test_worker_processes_same_url_once_and_retries_failures(tmp_path):
+    store = ScrapeTaskStore(str(tmp_path / 'tasks.db'))
+    store.create('task_a1', 'https://example.com/a#x', job=True)
+    store.create('task_a2', 'https://EXAMPLE.com/a', job=True)
+    store.create('task_b', 'https://example.com/b', job=True)
+    # 작업 큐가 아닌 (웹 프로세스 안에서 도는) 작업은 가져가지 않음
+    store.create('task_inline', 'https://example.com/c')
+
+    scraper = StubScraper()
+    assert ScrapeWorker(scraper, store).run_until_empty() == 2
+    assert scraper.calls == ['https://example.com/a#x', 'https://example.com/b']
+    assert store.get('task_a2')['result']['title'] == '가을 리사이틀'
+    assert store.get('task_inline')['stage'] == 'queued'
+    assert store.pending_jobs() == 0
+
+    # 실패하면 시도 횟수를 남기고 큐로 돌아감 (재시도 대기 중이라 바로 다시 가져가지 않음)
+    store.create('task_d', 'https://example.com/d', job=True)
+    assert ScrapeWorker(StubScraper(fail=True), store).run_until_empty() == 1
+    assert store.get('task_d')['stage'] == 'queued'
+    assert store.claim_job('other') is None
+
+
+def test_expired_lease_is_reclaimed_after_worker_crash(tmp_path):
+    store = ScrapeTaskStore(str(tmp_path / 'tasks.db'))
+    store.create('task_a', 'https://example.com/a', job=True)
+
+    # 임대만 하고 죽은 워커
+    assert store.claim_job('dead', lease=-1) == ('https://example.com/a', ['task_a'])
+    assert store.claim_job('alive') == ('https://example.com/a', ['task_a'])
+    # 임대 중인 작업은 다른 워커가 가져가지 않음
+    assert store.claim_job('third') is None
+
+
+def test_job_that_keeps_killing_workers_ends_in_error(tmp_path):
+    store = ScrapeTaskStore(str(tmp_path / 'tasks.db'))
+    store.create('task_a', 'https://example.com/a', job=True)
+
+    # 가져갈 때마다 워커가 죽어서 retry_job까지 가지 못함
+    for attempt in range(MAX_JOB_ATTEMPTS):
+        assert store.claim_job(f'dead_{attempt}', lease=-1) == ('https://example.com/a', ['task_a'])
+    assert store.claim_job('alive') is None
+    task = store.get('task_a')
+    assert task['stage'] == 'error'
+    assert task['status'].startswith('오류: ')
+    assert store.pending_jobs() == 0
+
+
+class TimedStubScraper(StubScraper):
+    """웹앱 스크래퍼처럼 단계별 시간을 집계에 남김"""
+
+    def __init__(self, timings):
+        super().__init__()
+        self.timings = timings
+
+    def scrape_concert_info(self, url):
+        with record_timings(self.timings, url):
+            return super().scrape_concert_info(url)
+
+
+def test_worker_scrapes_show_up_in_metrics_and_shared_timings(tmp_path):
+    def sample(name, **labels):
+        return REGISTRY.values[name].get(tuple(labels.items()), 0)
+
+    before = sample('scrape_results_total', host='example.com', outcome='success')
+    store = ScrapeTaskStore(str(tmp_path / 'tasks.db'))
+    for path in ('a', 'b', 'c'):
+        store.create(f'task_{path}', f'https://example.com/{path}', job=True)
+
+    # 워커 프로세스 쪽 기록 (최근 2건만)
+    scraper = TimedStubScraper(SharedTimingAggregate(str(tmp_path / 'timings.db'), window=2))
+    assert ScrapeWorker(scraper, store).run_until_empty() == 3
+    assert sample('scrape_results_total', host='example.com', outcome='success') == before + 3
+    assert sample('scrape_tasks_in_flight') == 0
+
+    # 웹 프로세스 쪽에서 같은 파일을 읽음
+    summary = SharedTimingAggregate(str(tmp_path / 'timings.db'), window=2).summary()
+    assert summary['window'] == 2
+    assert summary['hosts'][0]['host'] == 'example.com'
+    assert 'fetch' in summary['stages']
+
+
+def wait_until(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_supervisor_restarts_dead_worker_and_stops_it():
+    # 바로 죽는 워커: 종료 코드를 남기고 다시 띄움
+    supervisor = WorkerSupervisor([sys.executable, '-c', 'import sys; sys.exit(3)'], restart_delay=0.01)
+    supervisor.start()
+    wait_until(lambda: len(supervisor.exit_codes) >= 2)
+    supervisor.stop()
+    assert supervisor.exit_codes[:2] == [3, 3]
+
+    # 멈추면 돌고 있는 워커도 끝냄
+    supervisor = WorkerSupervisor([sys.executable, '-c', 'import time; time.sleep(30)'])
+    supervisor.start()
+    wait_until(lambda: supervisor.process is not None)
+    supervisor.stop()
+    assert supervisor.process.poll() is not None
+    assert supervisor.exit_codes == []
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+🗃️ 메모리 작업 목록 제한 테스트 (항목 수, 바이트, TTL)
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from task_registry import TaskRegistry, result_size
+
+
+def test_entries_and_bytes_stay_bounded_and_running_tasks_survive():
+    registry = TaskRegistry(max_entries=50, max_bytes=10_000, ttl=3600)
+    registry.set_status('running', "진행중")
+
+    # 계속 스크래핑해도 항목 수/바이트가 상한을 넘지 않음
+    for i in range(2000):
+        registry.finish(f'task_{i}', "완료", {'title': f'공연 {i}', 'program': ['x' * 50]})
+        stats = registry.stats()
+        assert stats['entries'] <= 50 and stats['bytes'] <= 10_000
+
+    # 진행 중인 작업은 끝난 작업보다 나중에 지워짐, 가장 최근 작업은 남음
+    assert registry.get('running') == ("진행중", None)
+    assert registry.get('task_1999')[0] == "완료"
+    assert registry.get('task_0') == ("알 수 없음", None)
+    # 작업 2001개 중 남은 것을 뺀 만큼 삭제, 바이트 합은 남은 결과 크기 합과 같음
+    assert stats['evicted']['entries'] + stats['evicted']['bytes'] == 2001 - stats['entries']
+    assert stats['bytes'] == sum(result_size(registry.get(f'task_{i}')[1]) for i in range(2000))
+
+
+def test_finished_tasks_expire_after_ttl():
+    registry = TaskRegistry(ttl=0.05)
+    registry.finish('done', "완료", {'title': 'a'})
+    registry.finish('failed', "오류: 페이지 로딩 실패")
+    registry.set_status('running', "진행중")
+    time.sleep(0.1)
+
+    assert registry.get('done')[0] == "알 수 없음"
+    assert registry.get('running')[0] == "진행중"
+    stats = registry.stats()
+    assert stats['evicted']['ttl'] == 2 and stats['entries'] == 1 and stats['bytes'] == 0
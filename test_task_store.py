@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+📋 스크래핑 작업 공유 저장소 테스트
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from task_store import ScrapeTaskStore, normalize_url, STATUS_DONE, STATUS_UNKNOWN
+
+
+def test_status_shared_between_stores_and_recent_result_by_normalized_url(tmp_path):
+    path = str(tmp_path / 'tasks.db')
+    # 워커 두 개가 같은 파일을 씀
+    first, second = ScrapeTaskStore(path), ScrapeTaskStore(path)
+    url = 'https://www.sac.or.kr/site/main/show/show_view?SN=67427#non'
+
+    first.create('task_1', url)
+    first.finish('task_1', {'title': '가을 리사이틀'})
+    assert second.get('task_1') == {'status': STATUS_DONE, 'stage': 'done', 'result': {'title': '가을 리사이틀'}}
+    assert second.get('task_missing')['status'] == STATUS_UNKNOWN
+
+    assert normalize_url('HTTPS://WWW.SAC.OR.KR:443/site/main/show/show_view?SN=67427') == normalize_url(url)
+    assert second.recent_result('https://www.sac.or.kr/site/main/show/show_view?SN=67427') == {'title': '가을 리사이틀'}
+    second.create('task_2', 'https://example.com/a')
+    second.fail('task_2', '페이지 로딩 실패')
+    assert first.recent_result('https://example.com/a') is None
+
+    # ttl이 지나면 결과를 다시 쓰지 않음
+    expired = ScrapeTaskStore(path, ttl=0.05)
+    time.sleep(0.1)
+    assert expired.recent_result(url) is None
+    assert expired.get('task_1')['status'] == STATUS_UNKNOWN
+
+
+def test_wait_returns_when_stage_changes(tmp_path):
+    store = ScrapeTaskStore(str(tmp_path / 'tasks.db'))
+    store.create('task_1', 'https://example.com/a')
+    assert store.wait('task_1')['stage'] == 'queued'
+
+    threading.Timer(0.05, store.set_stage, args=('task_1', 'fetching')).start()
+    started = time.monotonic()
+    task = store.wait('task_1', 'queued', timeout=5)
+    assert task['stage'] == 'fetching' and task['status'] == '진행중'
+    assert time.monotonic() - started < 1
+
+    # 바뀌지 않으면 timeout 뒤 그대로
+    assert store.wait('task_1', 'fetching', timeout=0.1)['stage'] == 'fetching'
@@ -6,33 +6,46 @@ Flask로 만든 웹 인터페이스
 
 from flask import Flask, render_template, request, jsonify, send_from_directory
 from concert_scraper import ConcertScraper
+from driver_pool import DriverPool
+from fetch_strategy import FetchStrategyStore
+import atexit
 import json
 import os
 from datetime import datetime
-import threading
-import time
+from scrape_executor import ScrapeExecutor, ScrapeQueueFull, new_task_id
+from task_registry import TaskRegistry
 
 app = Flask(__name__)
 
+# 렌더링용 브라우저 풀: 서버 시작 때 미리 띄워 두고 요청 스레드들이 나눠 씀
+driver_pool = DriverPool()
+# debug 리로더의 감시용 부모 프로세스에서는 브라우저를 띄우지 않음
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    driver_pool.prewarm(background=True)
+atexit.register(driver_pool.close)
+
+# 호스트별로 배운 가져오기 방법 (static / rendered / api)
+fetch_strategies = FetchStrategyStore()
+
 # 전역 스크래퍼 인스턴스
-scraper = ConcertScraper()
+scraper = ConcertScraper(driver_pool=driver_pool, strategies=fetch_strategies)
 
-# 스크래핑 결과를 저장할 전역 변수
-scraping_results = {}
-scraping_status = {}
+# 스크래핑 상태/결과 (항목 수, 크기, 끝난 뒤 보관 시간 제한)
+scraping_tasks = TaskRegistry()
 
-def scrape_async(task_id, url):
-    """비동기 스크래핑 함수"""
-    global scraping_results, scraping_status
-    
-    try:
-        scraping_status[task_id] = "진행중"
-        result = scraper.scrape_concert_info(url)
-        scraping_results[task_id] = result
-        scraping_status[task_id] = "완료"
-    except Exception as e:
-        scraping_results[task_id] = None
-        scraping_status[task_id] = f"오류: {str(e)}"
+def task_listener(task_id):
+    """실행기 알림 → 작업 상태/결과 기록"""
+    def listener(event, payload):
+        if event == 'started':
+            scraping_tasks.set_status(task_id, "진행중")
+        elif event == 'done':
+            scraping_tasks.finish(task_id, "완료", payload)
+        elif event == 'error':
+            scraping_tasks.finish(task_id, f"오류: {payload}")
+    return listener
+
+# 고정 크기 워커 풀 (같은 URL 동시 요청은 한 번만 스크래핑)
+scrape_executor = ScrapeExecutor(scraper.scrape_concert_info)
 
 @app.route('/')
 def index():
@@ -52,22 +65,26 @@ def scrape_api():
         return jsonify({'error': '올바른 URL을 입력해주세요.'}), 400
     
     # 작업 ID 생성
-    task_id = f"task_{int(time.time() * 1000)}"
+    task_id = new_task_id()
     
-    # 비동기로 스크래핑 시작
-    thread = threading.Thread(target=scrape_async, args=(task_id, url))
-    thread.daemon = True
-    thread.start()
+    # 비동기로 스크래핑 시작 (자리가 없으면 429)
+    scraping_tasks.set_status(task_id, "대기중")
+    try:
+        scrape_executor.submit(url, task_listener(task_id))
+    except ScrapeQueueFull as e:
+        scraping_tasks.discard(task_id)
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
     
     return jsonify({'task_id': task_id})
 
 @app.route('/api/status/<task_id>')
 def get_status(task_id):
     """스크래핑 상태 확인"""
-    status = scraping_status.get(task_id, "알 수 없음")
+    status, result = scraping_tasks.get(task_id)
     
     if status == "완료":
-        result = scraping_results.get(task_id)
         return jsonify({
             'status': status,
             'result': result
@@ -77,6 +94,16 @@ def get_status(task_id):
             'status': status
         })
 
+@app.route('/api/fetch-strategies')
+def get_fetch_strategies():
+    """호스트별 가져오기 전략 표 (설정 고정값 + 학습 결과)"""
+    return jsonify({'strategies': fetch_strategies.table()})
+
+@app.route('/api/tasks')
+def get_task_stats():
+    """메모리에 있는 작업 수/크기와 삭제 통계"""
+    return jsonify(scraping_tasks.stats())
+
 @app.route('/api/save', methods=['POST'])
 def save_result():
     """결과를 JSON 파일로 저장"""
@@ -100,11 +127,5 @@ def save_result():
             'error': str(e)
         })
 
-@app.teardown_appcontext
-def close_scraper(error):
-    """앱 종료시 스크래퍼 정리"""
-    if hasattr(scraper, 'close'):
-        scraper.close()
-
 if __name__ == '__main__':
     app.run(debug=True, host='127.0.0.1', port=5000)
\ No newline at end of file
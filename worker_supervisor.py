@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+🧑‍✈️ 웹 서버 + 스크래핑 워커 감독 프로세스
+Render 디스크는 서비스 하나에만 붙어서 작업 큐(scrape_tasks.db)를 같이 쓰는 워커를 별도 서비스로 뺄 수 없습니다.
+그래서 같은 인스턴스에서 웹 서버(gunicorn)와 scrape_worker.py 를 함께 띄우되, 셸 `&` 대신 이 프로세스가 감독합니다.
+
+- 웹 서버는 앞에서 실행하고, 끝나면 워커도 멈추고 같은 종료 코드로 끝냄 (Render가 서비스를 다시 시작)
+- 워커가 끝나면 종료 코드를 로그에 남기고 점점 길게 기다렸다가 다시 시작 (오래 잘 돌았으면 대기 시간 초기화)
+- 워커가 없는 동안 /api/scrape 는 살아 있는 워커가 없으므로 웹 프로세스 안에서 바로 처리 (inline)
+- SIGTERM/SIGINT 는 웹 서버에 전달
+
+사용법: python worker_supervisor.py gunicorn culture_log_app:app
+"""
+
+import argparse
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+WORKER_COMMAND = [sys.executable, 'scrape_worker.py']
+# 워커 재시작 대기 (초): 처음 값에서 두 배씩, 최대값까지
+RESTART_DELAY = 1.0
+MAX_RESTART_DELAY = 60.0
+# 이만큼(초) 돌다가 끝났으면 대기 시간을 처음 값으로
+HEALTHY_AFTER = 60.0
+# 멈출 때 워커가 끝나길 기다리는 시간 (초), 넘으면 강제 종료
+STOP_TIMEOUT = 10
+
+
+class WorkerSupervisor:
+    """명령 하나를 백그라운드 스레드에서 실행하고, 끝나면 종료 코드를 남기고 다시 시작"""
+
+    def __init__(self, command=WORKER_COMMAND, restart_delay=RESTART_DELAY,
+                 max_restart_delay=MAX_RESTART_DELAY, healthy_after=HEALTHY_AFTER):
+        self.command = command
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.healthy_after = healthy_after
+        self.process = None
+        # 끝난 워커의 종료 코드 (시작하지 못했으면 None)
+        self.exit_codes = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def run(self):
+        delay = self.restart_delay
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.process = subprocess.Popen(self.command)
+            except Exception as e:
+                print(f"⚠️ 스크래핑 워커를 시작할 수 없습니다: {str(e)}", flush=True)
+                code = None
+            else:
+                print(f"🛠️ 스크래핑 워커 시작 (pid {self.process.pid})", flush=True)
+                if self._stop.is_set():
+                    # 시작하는 사이에 stop()이 불렸으면 stop()이 못 본 프로세스일 수 있음
+                    self.process.terminate()
+                code = self.process.wait()
+
+            if self._stop.is_set():
+                break
+            self.exit_codes.append(code)
+            if time.monotonic() - started >= self.healthy_after:
+                delay = self.restart_delay
+            print(f"🚨 스크래핑 워커 종료 (종료 코드 {code}), {delay:.0f}초 뒤 다시 시작 "
+                  f"(그동안 스크래핑은 웹 프로세스에서 처리)", flush=True)
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.max_restart_delay)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=STOP_TIMEOUT):
+        """재시작을 멈추고 실행 중인 워커 종료"""
+        self._stop.set()
+        process = self.process
+        if process and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        if self._thread:
+            self._thread.join(timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='앞에서 실행할 웹 서버 명령')
+    args = parser.parse_args()
+    if not args.command:
+        parser.error('웹 서버 명령이 필요합니다 (예: gunicorn culture_log_app:app)')
+
+    supervisor = WorkerSupervisor()
+    supervisor.start()
+    server = subprocess.Popen(args.command)
+
+    def forward(signum, frame):
+        server.send_signal(signum)
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+
+    code = server.wait()
+    print(f"🛑 웹 서버 종료 (종료 코드 {code}), 스크래핑 워커도 멈춤", flush=True)
+    supervisor.stop()
+    return code
+
+
+if __name__ == '__main__':
+    sys.exit(main())